@@ -42,6 +42,7 @@ setup(
         "docs": ["sphinx", "ipykernel", "nbsphinx"],
         "test": ["pytest", "black"],
         "extra": ["jupyterlab"],
+        "numba": ["numba"],
     },
     project_urls={
         "Documentation": "https://apsg.readthedocs.io/",
@@ -5,8 +5,9 @@ API to read data from PySDB database
 """
 
 import sqlite3
+from functools import cached_property, lru_cache
 from os.path import isfile
-from apsg.feature._geodata import Lineation, Foliation
+import numpy as np
 from apsg.feature._container import LineationSet, FoliationSet
 
 
@@ -22,17 +23,53 @@ class SDB(object):
 
     """
 
-    _SELECT = """SELECT sites.name as name, sites.x_coord as x,
-    sites.y_coord as y, units.name as unit, structdata.azimuth as azimuth,
-    structdata.inclination as inclination, structype.structure as structure,
-    structype.planar as planar, structdata.description as description,
-    GROUP_CONCAT(tags.name) AS tags
-    FROM structdata
+    _TABLES = ("meta", "sites", "units", "structype", "structdata", "tags", "tagged")
+
+    # indexes on join keys and filter columns used by selects
+    _INDEXES = (
+        ("idx_structdata_sites", "structdata", "id_sites"),
+        ("idx_structdata_structype", "structdata", "id_structype"),
+        ("idx_sites_units", "sites", "id_units"),
+        ("idx_tagged_structdata", "tagged", "id_structdata"),
+        ("idx_tagged_tags", "tagged", "id_tags"),
+        ("idx_structype_structure", "structype", "structure"),
+        ("idx_sites_name", "sites", "name"),
+        ("idx_units_name", "units", "name"),
+        ("idx_tags_name", "tags", "name"),
+    )
+
+    _META_UPSERT = (
+        "INSERT INTO meta (name,value) VALUES (?,?) "
+        "ON CONFLICT(name) DO UPDATE SET value=excluded.value"
+    )
+
+    # joins of measurements with sites, structure types and units
+    _DATA_FROM = """FROM structdata
     INNER JOIN sites ON structdata.id_sites=sites.id
     INNER JOIN structype ON structype.id = structdata.id_structype
-    INNER JOIN units ON units.id = sites.id_units
-    LEFT OUTER JOIN tagged ON structdata.id = tagged.id_structdata
-    LEFT OUTER JOIN tags ON tags.id = tagged.id_tags"""
+    INNER JOIN units ON units.id = sites.id_units"""
+
+    _SELECT_NO_TAGS = """SELECT sites.name as name, sites.x_coord as x,
+    sites.y_coord as y, units.name as unit, structdata.azimuth as azimuth,
+    structdata.inclination as inclination, structype.structure as structure,
+    structype.planar as planar, structdata.description as description
+    """ + _DATA_FROM
+
+    # tags are matched as substrings of tag names, e.g. "fold" matches "folded"
+    _TAG_EXISTS = """EXISTS (SELECT 1 FROM tagged
+    INNER JOIN tags ON tags.id = tagged.id_tags
+    WHERE tagged.id_structdata = structdata.id
+    AND tags.name LIKE '%' || ? || '%')"""
+
+    _DISTINCT_SELECT = ("SELECT DISTINCT {col} " + _DATA_FROM).format
+
+    _TAG_JOINS = """
+    INNER JOIN tagged ON structdata.id = tagged.id_structdata
+    INNER JOIN tags ON tags.id = tagged.id_tags"""
+
+    # formatters of dynamic parts of selects
+    _WHERE_IN = "{col} IN ({qs})".format
+    _GETSET_SELECT = "SELECT azimuth, inclination, planar, name FROM ({sel})".format
 
     _SITE_SELECT = """SELECT sites.name as name, units.name as unit,
     sites.x_coord as x, sites.y_coord as y, sites.description as description
@@ -40,19 +77,54 @@ class SDB(object):
     INNER JOIN units ON units.id = sites.id_units
     ORDER BY sites.name"""
 
-    def __new__(cls, sdb_file):
+    def __init__(self, sdb_file):
         assert isfile(sdb_file), "Database does not exists."
-        cls.conn = sqlite3.connect(sdb_file)
-        cls.conn.row_factory = sqlite3.Row
-        cls.conn.execute("pragma encoding='UTF-8'")
-        cls.conn.execute(SDB._SELECT + " LIMIT 1")
-        return super(SDB, cls).__new__(cls)
+        # room for the cached select templates besides the ad-hoc queries
+        self.conn = sqlite3.connect(sdb_file, cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("pragma encoding='UTF-8'")
+        # read-heavy workload, keep pages in memory and use memory-mapped I/O
+        self.conn.execute("pragma cache_size=-65536")
+        self.conn.execute("pragma mmap_size=268435456")
+        self.conn.execute("pragma temp_store=MEMORY")
+        tables = {
+            row[0]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+        }
+        assert tables.issuperset(SDB._TABLES), "Database is not valid SDB file."
+        self._meta_cache = {}
+
+    def optimize(self):
+        """Create indexes used by selects and gather statistics for query planner.
+
+        Note that database file is modified, so it must be writable.
+
+        """
+        with self.conn:
+            for name, table, col in SDB._INDEXES:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {table}({col})"
+                )
+            self.conn.execute("ANALYZE")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close connection to database."""
+        self.conn.close()
 
     def __repr__(self):
         return "PySDB database version: {}".format(self.meta("version"))
 
     def meta(self, name, val=None, delete=False):
         if delete:
+            self._meta_cache.clear()
             try:
                 self.conn.execute("DELETE FROM meta WHERE name=?", (name,))
                 self.conn.commit()
@@ -61,6 +133,9 @@ class SDB(object):
                 print("Metadata '{}' not deleted.".format(name))
                 raise
         elif val is None:
+            if name in self._meta_cache:
+                return self._meta_cache[name]
+            key = name
             if name == "crs":  # keep compatible with old sdb files
                 val = self.conn.execute(
                     "SELECT value FROM meta WHERE name='crs'"
@@ -71,11 +146,43 @@ class SDB(object):
                 "SELECT value FROM meta WHERE name=?", (name,)
             ).fetchall()
             if res:
+                self._meta_cache[key] = res[0][0]
                 return res[0][0]
             else:
                 raise ValueError("SDB: Metadata '{}' does not exists".format(name))
         else:
+            self._meta_cache.clear()
             try:
+                self._meta_write([(name, val)])
+                self.conn.commit()
+            except sqlite3.OperationalError:
+                self.conn.rollback()
+                print("Metadata '{}' not updated.".format(name))
+                raise
+
+    def meta_many(self, items):
+        """Set several metadata values in single transaction.
+
+        Args:
+          items (dict): metadata names and values
+
+        """
+        items = list(dict(items).items())
+        self._meta_cache.clear()
+        try:
+            with self.conn:
+                self._meta_write(items)
+        except sqlite3.OperationalError:
+            print("Metadata not updated.")
+            raise
+
+    def _meta_write(self, items):
+        """Insert or update (name, value) pairs without commit"""
+        try:
+            self.conn.executemany(SDB._META_UPSERT, items)
+        except sqlite3.OperationalError:
+            # no unique constraint on name or SQLite older than 3.24
+            for name, val in items:
                 exval = self.conn.execute(
                     "SELECT value FROM meta WHERE name=?", (name,)
                 ).fetchall()
@@ -87,11 +194,6 @@ class SDB(object):
                     self.conn.execute(
                         "UPDATE meta SET value = ? WHERE name = ?", (val, name)
                     )
-                self.conn.commit()
-            except sqlite3.OperationalError:
-                self.conn.rollback()
-                print("Metadata '{}' not updated.".format(name))
-                raise
 
     def info(self, report="basic"):
         lines = []
@@ -103,75 +205,131 @@ class SDB(object):
             lines.append("Number of sites: {}".format(len(self.sites())))
             lines.append("Number of units: {}".format(len(self.units())))
             lines.append("Number of structures: {}".format(len(self.structures())))
-            r = self.execsql(self._make_select())
-            lines.append("Number of measurements: {}".format(len(r)))
+            lines.append("Number of measurements: {}".format(self._count()))
         elif report == "data":
-            for s in self.structures():
-                r = self.execsql(self._make_select(structs=s))
-                if len(r) > 0:
-                    lines.append("Number of {} measurements: {}".format(s, len(r)))
+            for s, n in self._counts_by_structure().items():
+                lines.append("Number of {} measurements: {}".format(s, n))
         elif report == "tags":
-            for s in self.structures():
-                r = self.execsql(self._make_select(tags=s))
-                if len(r) > 0:
-                    lines.append("{} measurements tagged as {}.".format(len(r), s))
+            for s, n in self._counts_by_tag().items():
+                lines.append("{} measurements tagged as {}.".format(n, s))
         else:
             lines.append("No report.")
 
         return "\n".join(lines)
 
-    def _make_select(self, structs=None, sites=None, units=None, tags=None):
-        w = []
-        if structs:
-            if isinstance(structs, str):
-                w.append("structype.structure='%s'" % structs)
-            elif isinstance(structs, (list, tuple)):
-                u = " OR ".join(
-                    ["structype.structure='{}'".format(struct) for struct in structs]
-                )
-                w.append("(" + u + ")")
-            else:
-                raise ValueError("Keyword structs must be list or string.")
-        if sites:
-            if isinstance(sites, str):
-                w.append("sites.name='{}'".format(sites))
-            elif isinstance(sites, (list, tuple)):
-                u = " OR ".join(["sites.name='{}'".format(site) for site in sites])
-                w.append("(" + u + ")")
-            else:
-                raise ValueError("Keyword sites must be list or string.")
-        if units:
-            if isinstance(units, str):
-                w.append("unit='{}'".format(units))
-            elif isinstance(units, (list, tuple)):
-                u = " OR ".join(["unit='{}'".format(unit) for unit in units])
-                w.append("(" + u + ")")
-            else:
-                raise ValueError("Keyword units must be list or string.")
-        if tags:
-            if isinstance(tags, str):
-                tagw = ["tags LIKE '%{}%'".format(tags)]
-            elif isinstance(tags, (list, tuple)):
-                u = " AND ".join(["tags LIKE '%{}%'".format(tag) for tag in tags])
-                tagw = ["({})".format(u)]
-            else:
-                raise ValueError("Keyword tags must be list or string.")
-            insel = SDB._SELECT
-            if w:
-                insel += " WHERE {} GROUP BY structdata.id".format(" AND ".join(w))
-            else:
-                insel += " GROUP BY structdata.id"
-            sel = "SELECT * FROM ({}) WHERE {}".format(insel, " AND ".join(tagw))
-        else:
-            sel = SDB._SELECT
-            if w:
-                sel += " WHERE {} GROUP BY structdata.id".format(" AND ".join(w))
-            else:
-                sel += " GROUP BY structdata.id"
-        return sel
+    @staticmethod
+    def _in_clause(col, n):
+        """Return parameterized IN clause for n values"""
+        return SDB._WHERE_IN(col=col, qs=",".join("?" * n))
 
-    def execsql(self, sql):
-        return self.conn.execute(sql).fetchall()
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _where_template(nstructs, nsites, nunits, ntags):
+        """Return parameterized WHERE clause for given numbers of filter values"""
+        w = [
+            SDB._in_clause(col, n)
+            for col, n in (
+                ("structype.structure", nstructs),
+                ("sites.name", nsites),
+                ("units.name", nunits),
+            )
+            if n
+        ]
+        w.extend([SDB._TAG_EXISTS] * ntags)
+        if w:
+            return " WHERE " + " AND ".join(w)
+        return ""
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _select_template(nstructs, nsites, nunits, ntags):
+        """Return parameterized select for given numbers of filter values"""
+        where = SDB._where_template(nstructs, nsites, nunits, ntags)
+        return SDB._SELECT_NO_TAGS + where + " ORDER BY structdata.id"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _getset_template(nstructs, nsites, nunits, ntags):
+        """Return parameterized select of columns needed to create features"""
+        sel = SDB._select_template(nstructs, nsites, nunits, ntags)
+        return SDB._GETSET_SELECT(sel=sel)
+
+    @staticmethod
+    def _filter_values(structs=None, sites=None, units=None, tags=None):
+        """Return filter values of getset keywords as tuples"""
+        values = []
+        for kw, val in (
+            ("structs", structs),
+            ("sites", sites),
+            ("units", units),
+            ("tags", tags),
+        ):
+            if not val:
+                val = ()
+            elif isinstance(val, str):
+                val = (val,)
+            elif not isinstance(val, (list, tuple)):
+                raise ValueError("Keyword {} must be list or string.".format(kw))
+            values.append(tuple(val))
+        return values
+
+    def _make_select(self, **kwargs):
+        """Return parameterized select and tuple of its parameters"""
+        structs, sites, units, tags = self._filter_values(**kwargs)
+        sel = self._select_template(len(structs), len(sites), len(units), len(tags))
+        params = structs + sites + units + tags
+        return sel, params
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _distinct_template(column, nstructs, nsites, nunits, ntags):
+        """Return parameterized select of distinct values of column"""
+        sel = SDB._DISTINCT_SELECT(col=column)
+        if column.startswith("tags."):
+            sel += SDB._TAG_JOINS
+        where = SDB._where_template(nstructs, nsites, nunits, ntags)
+        return sel + where + " ORDER BY " + column
+
+    def _make_distinct(self, column, **kwargs):
+        """Return parameterized select of distinct values and its parameters"""
+        structs, sites, units, tags = self._filter_values(**kwargs)
+        sel = self._distinct_template(
+            column, len(structs), len(sites), len(units), len(tags)
+        )
+        params = structs + sites + units + tags
+        return sel, params
+
+    def _counts_by_structure(self):
+        """Return dict of numbers of measurements of structures in single query"""
+        sel = """SELECT structype.structure, COUNT(*) FROM structdata
+        INNER JOIN sites ON structdata.id_sites=sites.id
+        INNER JOIN structype ON structype.id = structdata.id_structype
+        INNER JOIN units ON units.id = sites.id_units
+        GROUP BY structype.id ORDER BY structype.pos"""
+        return dict(self.conn.execute(sel).fetchall())
+
+    def _counts_by_tag(self):
+        """Return dict of numbers of tagged measurements in single query"""
+        sel = """SELECT tags.name, COUNT(DISTINCT structdata.id) FROM structdata
+        INNER JOIN sites ON structdata.id_sites=sites.id
+        INNER JOIN structype ON structype.id = structdata.id_structype
+        INNER JOIN units ON units.id = sites.id_units
+        INNER JOIN tagged ON structdata.id = tagged.id_structdata
+        INNER JOIN tags ON tags.id = tagged.id_tags
+        GROUP BY tags.id ORDER BY tags.pos"""
+        return dict(self.conn.execute(sel).fetchall())
+
+    def _count(self, **kwargs):
+        """Return number of measurements selected by kwargs of getset method"""
+        sql, params = self._make_select(**kwargs)
+        return self.conn.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]
+
+    def execsql(self, sql, params=()):
+        return self.conn.execute(sql, params).fetchall()
+
+    def iterexec(self, sql, params=()):
+        """Execute sql and return cursor to iterate over resulting rows"""
+        return self.conn.execute(sql, params)
 
     def structures(self, **kwargs):
         """
@@ -180,12 +338,11 @@ class SDB(object):
         For kwargs see getset method
         """
         if kwargs:
-            dtsel = self._make_select(**kwargs)
-            res = set([el["structure"] for el in self.execsql(dtsel)])
-            return sorted(list(res))
+            dtsel = self._make_distinct("structype.structure", **kwargs)
+            return [el[0] for el in self.iterexec(*dtsel)]
         else:
             dtsel = "SELECT structure FROM structype ORDER BY pos"
-            return [el["structure"] for el in self.execsql(dtsel)]
+            return [el["structure"] for el in self.iterexec(dtsel)]
 
     def sites(self, **kwargs):
         """
@@ -194,12 +351,11 @@ class SDB(object):
         For kwargs see getset method.
         """
         if kwargs:
-            dtsel = self._make_select(**kwargs)
-            res = set([el["name"] for el in self.execsql(dtsel)])
-            return sorted(list(res))
+            dtsel = self._make_distinct("sites.name", **kwargs)
+            return [el[0] for el in self.iterexec(*dtsel)]
         else:
             dtsel = "SELECT name FROM sites ORDER BY id"
-            return [el["name"] for el in self.execsql(dtsel)]
+            return [el["name"] for el in self.iterexec(dtsel)]
 
     def units(self, **kwargs):
         """
@@ -208,12 +364,11 @@ class SDB(object):
         For kwargs see getset method.
         """
         if kwargs:
-            dtsel = self._make_select(**kwargs)
-            res = set([el["unit"] for el in self.execsql(dtsel)])
-            return sorted(list(res))
+            dtsel = self._make_distinct("units.name", **kwargs)
+            return [el[0] for el in self.iterexec(*dtsel)]
         else:
             dtsel = "SELECT name FROM units ORDER BY pos"
-            return [el["name"] for el in self.execsql(dtsel)]
+            return [el["name"] for el in self.iterexec(dtsel)]
 
     def tags(self, **kwargs):
         """
@@ -222,18 +377,20 @@ class SDB(object):
         For kwargs see getset method.
         """
         if kwargs:
-            dtsel = self._make_select(**kwargs)
-            tags = [el["tags"] for el in self.execsql(dtsel) if el["tags"] is not None]
-            return sorted(list(set(",".join(tags).split(","))))
+            dtsel = self._make_distinct("tags.name", **kwargs)
+            return [el[0] for el in self.iterexec(*dtsel)]
         else:
             dtsel = "SELECT name FROM tags ORDER BY pos"
-            return [el["name"] for el in self.execsql(dtsel)]
+            return [el["name"] for el in self.iterexec(dtsel)]
+
+    @cached_property
+    def _planar(self):
+        tpsel = "SELECT structure, planar FROM structype"
+        return {name: planar == 1 for name, planar in self.iterexec(tpsel)}
 
     def is_planar(self, structs):
         if isinstance(structs, str):
-            tpsel = "SELECT planar FROM structype WHERE structure='{}'".format(structs)
-            res = self.execsql(tpsel)
-            return res[0][0] == 1
+            return self._planar[structs]
         elif isinstance(structs, (list, tuple)):
             res = [self.is_planar(s) for s in structs]
             if all(res):
@@ -254,30 +411,36 @@ class SDB(object):
         Keyword Args:
           sites (str): name or list of names of sites to retrieve from
           units (str): name or list of names of units to retrieve from
-          tags (str):  tag or list of tags to retrieve
+          tags (str):  tag or list of tags to retrieve. Tags are matched
+            as substrings of tag names
           labels (bool): if True return also list of sites. Default False
 
         """
         labels = kwargs.pop("labels", False)
-        dtsel = self._make_select(structs=structs, **kwargs)
-        sel = self.execsql(dtsel)
+        # select is built once per number of filter values
+        values = self._filter_values(structs=structs, **kwargs)
+        sql = self._getset_template(*[len(val) for val in values])
+        params = sum(values, ())
+        # plain tuples are cheaper to build and convert than sqlite3.Row
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        sel = cur.execute(sql, params).fetchall()
         if sel:
             if isinstance(structs, str):
                 name = structs
             else:
                 name = " ".join(structs)
-            if self.is_planar(structs):
-                res = FoliationSet(
-                    [Foliation(el["azimuth"], el["inclination"]) for el in sel],
-                    name=name,
-                )
+            sel = np.array(sel, dtype=object)
+            azi, inc, planar = sel[:, :3].astype(float).T
+            if planar.all():
+                fset = FoliationSet
+            elif not planar.any():
+                fset = LineationSet
             else:
-                res = LineationSet(
-                    [Lineation(el["azimuth"], el["inclination"]) for el in sel],
-                    name=name,
-                )
+                raise ValueError("All structures must be either planar or linear.")
+            res = fset.from_array(azi, inc, name=name)
             if labels:
-                return res, [el["name"] for el in sel]
+                return res, sel[:, 3].tolist()
             else:
                 return res
         else:
@@ -31,8 +31,10 @@ def ensure_arguments(*datatypes):
 
 def ensure_first_arg_same(method):
     def arg_check(self, *args):
-        nargs = list(args)
         cls = type(self)
+        if type(args[0]) is cls:
+            return method(self, *args)
+        nargs = list(args)
         if np.asarray(args[0]).shape == cls.__shape__:
             nargs[0] = cls(args[0])
             return method(self, *nargs)
@@ -1,36 +1,179 @@
+import math
 import sys
-from itertools import combinations
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.stats import vonmises
 from scipy.cluster.hierarchy import linkage, fcluster, dendrogram
 
 from apsg.config import apsg_conf
-from apsg.math._vector import Vector2, Vector3
+from apsg.math._vector import Vector2, Vector3, Axial3, _rodrigues, _rodrigues_rows
 from apsg.helpers._math import acosd
+from apsg.helpers._notation import (
+    vecs2geo_linear,
+    vecs2geo_planar,
+    geo2vecs_linear,
+    geo2vecs_planar,
+)
 from apsg.feature._geodata import Lineation, Foliation, Pair, Fault, Cone
 from apsg.feature._tensor3 import OrientationTensor3, Ellipsoid
 from apsg.feature._tensor2 import OrientationTensor2, Ellipse
 from apsg.feature._statistics import KentDistribution, vonMisesFisher
 
 
+def _random_source(rng):
+    """Return source of random numbers.
+
+    Legacy global numpy random state is used when `rng` is None, so results
+    could be reproduced with ``np.random.seed``. Otherwise `rng` is passed to
+    ``np.random.default_rng``, i.e. it could be ``Generator`` or seed.
+    """
+    if rng is None:
+        return np.random
+    return np.random.default_rng(rng)
+
+
+def _csv_columns(filename, cols):
+    """Return (n, len(cols)) float array of columns read from csv file.
+
+    Columns are given by index or by header name. Delimiter and presence of
+    header line are sniffed from the beginning of the file. Files which could
+    not be parsed by ``np.loadtxt`` (e.g. quoted values) are read by csv module.
+    """
+    import csv
+    import warnings
+
+    with open(filename) as csvfile:
+        sample = csvfile.read(1024)
+        has_header = csv.Sniffer().has_header(sample)
+        dialect = csv.Sniffer().sniff(sample)
+        csvfile.seek(0)
+        if not all(isinstance(col, int) for col in cols):
+            if has_header:
+                fieldnames = next(csv.reader(csvfile, dialect=dialect))
+                cols = tuple(
+                    col if isinstance(col, int) else fieldnames.index(col)
+                    for col in cols
+                )
+                csvfile.seek(0)
+            else:
+                raise ValueError("No header line in CSV file...")
+        try:
+            with warnings.catch_warnings():
+                # empty files are reported below
+                warnings.simplefilter("ignore", UserWarning)
+                r = np.loadtxt(
+                    csvfile,
+                    delimiter=dialect.delimiter,
+                    skiprows=int(has_header),
+                    usecols=cols,
+                    ndmin=2,
+                )
+        except ValueError:
+            csvfile.seek(0)
+            reader = csv.reader(csvfile, dialect=dialect)
+            if has_header:
+                next(reader)
+            r = np.array(
+                [[float(row[col]) for col in cols] for row in reader if row],
+                dtype=float,
+            ).reshape(-1, len(cols))
+    if r.size == 0:
+        raise ValueError("No data in CSV file...")
+    return r
+
+
+@lru_cache(maxsize=None)
+def _halfspace_jit():
+    """Return numba compiled halfspace kernel or None if numba is missing."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def kernel(a):
+        n, m = a.shape
+        r = np.zeros(m)
+        while True:
+            r[:] = 0.0
+            for i in range(n):
+                for j in range(m):
+                    r[j] += a[i, j]
+            flipped = False
+            for i in range(n):
+                d = 0.0
+                for j in range(m):
+                    d += a[i, j] * r[j]
+                if d < 0:
+                    for j in range(m):
+                        a[i, j] = -a[i, j]
+                    flipped = True
+            if not flipped:
+                return a
+
+    return kernel
+
+
+def _halfspace(a):
+    """Return copy of array of vectors flipped to the half-space of resultant.
+
+    All vectors with angle > 90 to resultant are flipped at once and resultant
+    is updated until no vector points away from it. For large arrays numba
+    kernel is used when available.
+    """
+    a = np.array(a, dtype=float)
+    if len(a) > 100_000:
+        kernel = _halfspace_jit()
+        if kernel is not None:
+            return kernel(a)
+    r = a.sum(axis=0)
+    flip = np.dot(a, r) < 0
+    while flip.any():
+        a[flip] *= -1
+        r = a.sum(axis=0)
+        flip = np.dot(a, r) < 0
+    return a
+
+
 class FeatureSet:
     """
     Base class for containers
     """
 
-    __slots__ = ("data", "name")
+    __slots__ = ("_data", "name")
 
     def __init__(self, data, name="Default"):
         dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
         assert all(
-            [isinstance(obj, dtype_cls) for obj in data]
+            isinstance(obj, dtype_cls) for obj in data
         ), f"Data must be instances of {type(self).__feature_type__}"
-        # cast to correct instances
-        self.data = tuple([dtype_cls(d) for d in data])
+        # cast to correct instances, features are immutable so exact
+        # instances could be shared
+        self._data = tuple(d if type(d) is dtype_cls else dtype_cls(d) for d in data)
         self.name = name
         self._cache = {}
 
+    @classmethod
+    def _from_array(cls, arr, name="Default"):
+        # fast constructor from (n, dim) array of features, which is kept
+        # as cached array representation. Features are created on first access.
+        arr = np.array(arr, dtype=float)
+        obj = cls.__new__(cls)
+        obj._data = None
+        obj.name = name
+        arr.flags.writeable = False
+        obj._cache = {"array": arr}
+        return obj
+
+    @property
+    def data(self):
+        """Return tuple of features"""
+        if self._data is None:
+            dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+            self._data = tuple(dtype_cls(*r) for r in self._cache["array"].tolist())
+        return self._data
+
     def __copy__(self):
         return type(self)(list(self.data), name=self.name)
 
@@ -48,8 +191,35 @@ class FeatureSet:
         """Return label"""
         return self.name
 
-    def __array__(self, dtype=None):
-        return np.array([np.array(p) for p in self.data], dtype=dtype)
+    def __array__(self, dtype=None, copy=None):
+        # data are immutable, so array representation is created only once
+        # and shared as read-only buffer
+        if "array" not in self._cache:
+            arr = self._pack()
+            arr.flags.writeable = False
+            self._cache["array"] = arr
+        arr = self._cache["array"]
+        if copy or (dtype is not None and np.dtype(dtype) != arr.dtype):
+            return np.array(arr, dtype=dtype)
+        return arr
+
+    def _pack(self):
+        """Return new array of all features"""
+        return np.array([np.array(p) for p in self.data])
+
+    def _unit_array(self):
+        """Return cached float array of normalized features"""
+        if "unit" not in self._cache:
+            a = np.asarray(self, dtype=float)
+            d = np.linalg.norm(a, axis=1, keepdims=True)
+            self._cache["unit"] = a / np.where(d > 0, d, 1)
+        return self._cache["unit"]
+
+    def _unit_resultant(self):
+        """Return cached resultant of normalized features as tuple"""
+        if "unit_resultant" not in self._cache:
+            self._cache["unit_resultant"] = self._resultant(self._unit_array())
+        return self._cache["unit_resultant"]
 
     def __eq__(self, other):
         return NotImplemented
@@ -61,9 +231,14 @@ class FeatureSet:
         return len(self) != 0
 
     def __len__(self):
-        return len(self.data)
+        if self._data is None:
+            return len(self._cache["array"])
+        return len(self._data)
 
     def __getitem__(self, key):
+        if self._data is None and isinstance(key, (slice, np.ndarray)):
+            # features not created yet, so index array representation
+            return type(self)._from_array(self._cache["array"][key])
         if isinstance(key, slice):
             return type(self)(self.data[key])
         # elif isinstance(key, int):
@@ -90,12 +265,14 @@ class FeatureSet:
         """Rotate ``FeatureSet`` object `phi` degress about `axis`."""
         return type(self)([e.rotate(axis, phi) for e in self], name=self.name)
 
-    def bootstrap(self, n=100, size=None):
+    def bootstrap(self, n=100, size=None, rng=None):
         """Return generator of bootstraped samples from ``FeatureSet``.
 
         Args:
           n: number of samples to be generated. Default 100.
           size: number of data in sample. Default is same as ``FeatureSet``.
+          rng: ``numpy.random.Generator`` or seed. Default None uses global
+            numpy random state
 
         Example:
           >>> np.random.seed(6034782)
@@ -108,8 +285,10 @@ class FeatureSet:
         """
         if size is None:
             size = len(self)
+        rng = _random_source(rng)
+        draw = rng.randint if rng is np.random else rng.integers
         for i in range(n):
-            yield self[np.random.choice(range(len(self)), size)]
+            yield self[draw(0, len(self), size)]
 
 
 class Vector2Set(FeatureSet):
@@ -122,24 +301,41 @@ class Vector2Set(FeatureSet):
     def __repr__(self):
         return f"V2({len(self)}) {self.name}"
 
+    def _pack(self):
+        """Return new (n, 2) float array of features"""
+        return np.array([e._coords for e in self.data], dtype=float).reshape(-1, 2)
+
+    def _array(self):
+        """Return (n, 2) float array of features"""
+        return np.asarray(self, dtype=float)
+
     def __abs__(self):
         """Returns array of euclidean norms"""
-        return np.asarray([abs(e) for e in self])
+        if "abs" not in self._cache:
+            r = np.linalg.norm(self._array(), axis=1)
+            r.flags.writeable = False
+            self._cache["abs"] = r
+        return self._cache["abs"]
 
     @property
     def x(self):
         """Return numpy array of x-components"""
-        return np.array([e.x for e in self])
+        return self._array()[:, 0].copy()
 
     @property
     def y(self):
         """Return numpy array of y-components"""
-        return np.array([e.y for e in self])
+        return self._array()[:, 1].copy()
 
     @property
     def direction(self):
         """Return array of direction angles"""
-        return np.asarray([e.direction for e in self]).T
+        if "direction" not in self._cache:
+            a = self._array()
+            r = np.degrees(np.arctan2(a[:, 1], a[:, 0]))
+            r.flags.writeable = False
+            self._cache["direction"] = r
+        return self._cache["direction"]
 
     def proj(self, vec):
         """Return projections of all features in ``Vector2Set`` onto vector."""
@@ -147,7 +343,7 @@ class Vector2Set(FeatureSet):
 
     def dot(self, vec):
         """Return array of dot products of all features in ``Vector2Set`` with vector."""
-        return np.array([e.dot(vec) for e in self])
+        return np.dot(self._array(), np.asarray(vec, dtype=float))
 
     def cross(self, other=None):
         """Return cross products of all features in ``Vector2Set``
@@ -156,16 +352,19 @@ class Vector2Set(FeatureSet):
         If argument is ``Vector2Set`` of same length or single data object
         element-wise cross-products are calculated.
         """
-        res = []
+        a = self._array()
         if other is None:
-            res = [e.cross(f) for e, f in combinations(self.data, 2)]
+            ix, jx = np.triu_indices(len(a), 1)
+            a, b = a[ix], a[jx]
         elif issubclass(type(other), FeatureSet):
-            res = [e.cross(f) for e, f in zip(self, other)]
-        elif issubclass(type(other), Vector3):
-            res = [e.cross(other) for e in self]
+            b = np.asarray(other, dtype=float).reshape(-1, 2)
+            n = min(len(a), len(b))
+            a, b = a[:n], b[:n]
+        elif issubclass(type(other), Vector2):
+            b = np.asarray(other, dtype=float)
         else:
             raise TypeError("Wrong argument type!")
-        return np.asarray(res)
+        return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
 
     __pow__ = cross
 
@@ -176,20 +375,28 @@ class Vector2Set(FeatureSet):
         If argument is ``Vector2Set`` of same length or single data object
         element-wise angles are calculated.
         """
-        res = []
+        a = self._unit_array()
         if other is None:
-            res = [e.angle(f) for e, f in combinations(self.data, 2)]
+            ix, jx = np.triu_indices(len(a), 1)
+            res = np.einsum("ij,ij->i", a[ix], a[jx])
         elif issubclass(type(other), FeatureSet):
-            res = [e.angle(f) for e, f in zip(self, other)]
-        elif issubclass(type(other), Vector3):
-            res = [e.angle(other) for e in self]
+            b = FeatureSet._unit_array(other)
+            n = min(len(a), len(b))
+            res = np.einsum("ij,ij->i", a[:n], b[:n])
+        elif issubclass(type(other), Vector2):
+            res = np.dot(a, np.asarray(other.normalized(), dtype=float))
         else:
             raise TypeError("Wrong argument type!")
-        return np.asarray(res)
+        # res is temporary, so angles are evaluated in place
+        np.clip(res, -1, 1, out=res)
+        return np.degrees(np.arccos(res, out=res), out=res)
 
     def normalized(self):
         """Return ``Vector2Set`` object with normalized (unit length) elements."""
-        return type(self)([e.normalized() for e in self], name=self.name)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        return type(self)(
+            [dtype_cls(*r) for r in self._unit_array().tolist()], name=self.name
+        )
 
     uv = normalized
 
@@ -203,7 +410,11 @@ class Vector2Set(FeatureSet):
           norm: normalize transformed features. True or False. Default False
 
         """
-        return type(self)([e.transform(F, **kwargs) for e in self], name=self.name)
+        r = np.dot(self._array(), np.transpose(F))
+        if kwargs.get("norm", False):
+            d = np.linalg.norm(r, axis=1, keepdims=True)
+            r = r / np.where(d > 0, d, 1)
+        return type(self)._from_array(r, name=self.name)
 
     def R(self, mean=False):
         """Return resultant of data in ``Vector2Set`` object.
@@ -216,11 +427,16 @@ class Vector2Set(FeatureSet):
         Args:
             mean: if True returns mean resultant. Default False
         """
-        R = sum(self)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        R = dtype_cls(*self._resultant(self._array()))
         if mean:
             R = R / len(self)
         return R
 
+    def _resultant(self, a):
+        """Return resultant of (n, 2) array of features as tuple"""
+        return tuple(a.sum(axis=0).tolist())
+
     def fisher_statistics(self):
         """Fisher's statistics
 
@@ -231,7 +447,7 @@ class Vector2Set(FeatureSet):
         """
         stats = {"k": np.inf, "a95": 0, "csd": 0}
         N = len(self)
-        R = abs(self.normalized().R())
+        R = math.hypot(*self._unit_resultant())
         if N != R:
             stats["k"] = (N - 1) / (N - R)
             stats["csd"] = 81 / np.sqrt(stats["k"])
@@ -243,7 +459,7 @@ class Vector2Set(FeatureSet):
 
         var = 1 - abs(R) / n
         """
-        return 1 - abs(self.normalized().R(mean=True))
+        return 1 - math.hypot(*self._unit_resultant()) / len(self)
 
     def delta(self):
         """Cone angle containing ~63% of the data in degrees.
@@ -251,7 +467,7 @@ class Vector2Set(FeatureSet):
         For enough large sample it approach angular standard deviation (csd)
         of Fisher statistics
         """
-        return acosd(abs(self.R(mean=True)))
+        return acosd(math.hypot(*self._resultant(self._array())) / len(self))
 
     def rdegree(self):
         """Degree of preffered orientation of vectors in ``Vector2Set``.
@@ -259,7 +475,8 @@ class Vector2Set(FeatureSet):
         D = 100 * (2 * abs(R) - n) / n
         """
         N = len(self)
-        return 100 * (2 * abs(self.normalized().R()) - N) / N
+        R = math.hypot(*self._unit_resultant())
+        return 100 * (2 * R - N) / N
 
     def ortensor(self):
         """Return orientation tensor ``Ortensor`` of ``Group``."""
@@ -284,17 +501,8 @@ class Vector2Set(FeatureSet):
 
         """
         dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
-        v = Vector3Set(self)
-        v_data = list(v)
-        alldone = np.all(v.angle(v.R()) <= 90)
-        while not alldone:
-            ang = v.angle(v.R())
-            for ix, do in enumerate(ang > 90):
-                if do:
-                    v_data[ix] = -v_data[ix]
-                v = Vector3Set(v_data)
-                alldone = np.all(v.angle(v.R()) <= 90)
-        return type(self)([dtype_cls(vec) for vec in v], name=self.name)
+        a = _halfspace(self._array())
+        return type(self)([dtype_cls(*v) for v in a.tolist()], name=self.name)
 
     @classmethod
     def from_direction(cls, angles, name="Default"):
@@ -309,8 +517,8 @@ class Vector2Set(FeatureSet):
         Example:
           >>> f = vec2set.from_angles([120,130,140,125, 132. 131])
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(a) for a in angles], name=name)
+        a = np.radians(np.asarray(angles, dtype=float))
+        return cls._from_array(np.column_stack((np.cos(a), np.sin(a))), name=name)
 
     @classmethod
     def from_xy(cls, x, y, name="Default"):
@@ -327,8 +535,7 @@ class Vector2Set(FeatureSet):
           >>> v = vec2set.from_xy([-0.4330127, -0.4330127, -0.66793414],
                                   [0.75, 0.25, 0.60141061])
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(xx, yy) for xx, yy in zip(x, y)], name=name)
+        return cls._from_array(np.column_stack((x, y)), name=name)
 
     @classmethod
     def random(cls, n=100, name="Default"):
@@ -344,8 +551,7 @@ class Vector2Set(FeatureSet):
           >>> l = vec2set.random(100)
 
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls.random() for i in range(n)], name=name)
+        return cls.from_direction(360 * np.random.rand(n), name=name)
 
     @classmethod
     def random_vonmises(cls, n=100, position=0, kappa=5, name="Default"):
@@ -361,9 +567,8 @@ class Vector2Set(FeatureSet):
         Example:
           >>> l = linset.random_fisher(position=lin(120,50))
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         angles = np.degrees(vonmises.rvs(kappa, loc=np.radians(position), size=n))
-        return cls([dtype_cls(a) for a in angles], name=name)
+        return cls.from_direction(angles, name=name)
 
 
 class Vector3Set(FeatureSet):
@@ -376,30 +581,37 @@ class Vector3Set(FeatureSet):
     def __repr__(self):
         return f"V3({len(self)}) {self.name}"
 
+    def _pack(self):
+        """Return new (n, 3) float array of features"""
+        return np.array([e._coords for e in self.data], dtype=float).reshape(-1, 3)
+
+    def _array(self):
+        """Return (n, 3) float array of features"""
+        return np.asarray(self, dtype=float)
+
     def __abs__(self):
         """Returns array of euclidean norms"""
-        return np.asarray([abs(e) for e in self])
+        return np.linalg.norm(self._array(), axis=1)
 
     @property
     def x(self):
         """Return numpy array of x-components"""
-        return np.array([e.x for e in self])
+        return self._array()[:, 0].copy()
 
     @property
     def y(self):
         """Return numpy array of y-components"""
-        return np.array([e.y for e in self])
+        return self._array()[:, 1].copy()
 
     @property
     def z(self):
         """Return numpy array of z-components"""
-        return np.array([e.z for e in self])
+        return self._array()[:, 2].copy()
 
     @property
     def geo(self):
         """Return arrays of azi and inc according to apsg_conf['notation']"""
-        azi, inc = np.asarray([e.geo for e in self]).T
-        return azi, inc
+        return vecs2geo_linear(self._array(), signed=True)
 
     def to_lin(self):
         """Return ``LineationSet`` object with all data converted to ``Lineation``."""
@@ -425,7 +637,11 @@ class Vector3Set(FeatureSet):
 
     def dot(self, vec):
         """Return array of dot products of all features in ``FeatureSet`` with vector."""
-        return np.array([e.dot(vec) for e in self])
+        res = np.dot(self._array(), np.asarray(vec, dtype=float))
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if issubclass(dtype_cls, Axial3):
+            res = np.abs(res)
+        return res
 
     def cross(self, other=None):
         """Return cross products of all features in ``FeatureSet``
@@ -434,16 +650,23 @@ class Vector3Set(FeatureSet):
         If argument is ``FeatureSet`` of same length or single data object
         element-wise cross-products are calculated.
         """
-        res = []
+        a = self._array()
         if other is None:
-            res = [e.cross(f) for e, f in combinations(self.data, 2)]
+            ix, jx = np.triu_indices(len(a), 1)
+            res = np.cross(a[ix], a[jx])
         elif issubclass(type(other), FeatureSet):
-            res = [e.cross(f) for e, f in zip(self, other)]
+            b = np.asarray(other, dtype=float).reshape(-1, 3)
+            n = min(len(a), len(b))
+            res = np.cross(a[:n], b[:n])
         elif issubclass(type(other), Vector3):
-            res = [e.cross(other) for e in self]
+            res = np.cross(a, np.asarray(other, dtype=float))
         else:
             raise TypeError("Wrong argument type!")
-        return G(res, name=self.name)
+        # cross product of linear features is planar and vice versa
+        res_cls = {"Lineation": Foliation, "Foliation": Lineation}.get(
+            type(self).__feature_type__, Vector3
+        )
+        return G([res_cls(r) for r in res], name=self.name)
 
     __pow__ = cross
 
@@ -454,23 +677,39 @@ class Vector3Set(FeatureSet):
         If argument is ``FeatureSet`` of same length or single data object
         element-wise angles are calculated.
         """
-        res = []
+        a = self._unit_array()
         if other is None:
-            res = [e.angle(f) for e, f in combinations(self.data, 2)]
+            ix, jx = np.triu_indices(len(a), 1)
+            res = np.einsum("ij,ij->i", a[ix], a[jx])
         elif issubclass(type(other), FeatureSet):
-            res = [e.angle(f) for e, f in zip(self, other)]
+            b = FeatureSet._unit_array(other)
+            n = min(len(a), len(b))
+            res = np.einsum("ij,ij->i", a[:n], b[:n])
         elif issubclass(type(other), Vector3):
-            res = [e.angle(other) for e in self]
+            res = np.dot(a, np.asarray(other.normalized(), dtype=float))
         else:
             raise TypeError("Wrong argument type!")
-        return np.asarray(res)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if issubclass(dtype_cls, Axial3):
+            np.abs(res, out=res)
+        # res is temporary, so angles are evaluated in place
+        np.clip(res, -1, 1, out=res)
+        return np.degrees(np.arccos(res, out=res), out=res)
 
     def normalized(self):
         """Return ``FeatureSet`` object with normalized (unit length) elements."""
-        return type(self)([e.normalized() for e in self], name=self.name)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        return type(self)(
+            [dtype_cls(*r) for r in self._unit_array().tolist()], name=self.name
+        )
 
     uv = normalized
 
+    def rotate(self, axis, phi):
+        """Rotate ``FeatureSet`` object `phi` degress about `axis`."""
+        rotated = _rodrigues(self._array(), axis, phi)
+        return type(self)._from_array(rotated, name=self.name)
+
     def transform(self, F, **kwargs):
         """Return affine transformation of all features ``FeatureSet`` by matrix 'F'.
 
@@ -481,14 +720,23 @@ class Vector3Set(FeatureSet):
           norm: normalize transformed features. True or False. Default False
 
         """
-        return type(self)([e.transform(F, **kwargs) for e in self], name=self.name)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        # all features are transformed by single matrix product
+        if issubclass(dtype_cls, Foliation):
+            r = np.dot(self._array(), np.linalg.inv(F))
+        else:
+            r = np.dot(self._array(), np.transpose(F))
+        if kwargs.get("norm", False):
+            d = np.linalg.norm(r, axis=1, keepdims=True)
+            r = r / np.where(d > 0, d, 1)
+        return type(self)._from_array(r, name=self.name)
 
     def is_upper(self):
         """
         Return boolean array of z-coordinate negative test
         """
 
-        return np.asarray([e.is_upper() for e in self])
+        return self._array()[:, 2] < 0
 
     def R(self, mean=False):
         """Return resultant of data in ``FeatureSet`` object.
@@ -501,11 +749,26 @@ class Vector3Set(FeatureSet):
         Args:
             mean: if True returns mean resultant. Default False
         """
-        R = sum(self)
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        R = dtype_cls(*self._resultant(self._array()))
         if mean:
             R = R / len(self)
         return R
 
+    def _resultant(self, a):
+        """Return resultant of (n, 3) array of features as tuple"""
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if issubclass(dtype_cls, Axial3):
+            # axial features are flipped towards running sum
+            rx = ry = rz = 0.0
+            for x, y, z in a.tolist():
+                if rx * x + ry * y + rz * z < 0:
+                    rx, ry, rz = rx - x, ry - y, rz - z
+                else:
+                    rx, ry, rz = rx + x, ry + y, rz + z
+            return rx, ry, rz
+        return tuple(a.sum(axis=0).tolist())
+
     def fisher_statistics(self):
         """Fisher's statistics
 
@@ -516,7 +779,7 @@ class Vector3Set(FeatureSet):
         """
         stats = {"k": np.inf, "a95": 0, "csd": 0}
         N = len(self)
-        R = abs(self.normalized().R())
+        R = math.hypot(*self._unit_resultant())
         if N != R:
             stats["k"] = (N - 1) / (N - R)
             stats["csd"] = 81 / np.sqrt(stats["k"])
@@ -529,7 +792,8 @@ class Vector3Set(FeatureSet):
         Cone axis is resultant and apical angle is a95 confidence limit
         """
         stats = self.fisher_statistics()
-        return Cone(self.normalized().R(), stats["a95"])
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        return Cone(dtype_cls(*self._unit_resultant()), stats["a95"])
 
     def fisher_cone_csd(self):
         """Angular standard deviation cone based on Fisher's statistics
@@ -537,14 +801,15 @@ class Vector3Set(FeatureSet):
         Cone axis is resultant and apical angle is angular standard deviation
         """
         stats = self.fisher_statistics()
-        return Cone(self.normalized().R(), stats["csd"])
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        return Cone(dtype_cls(*self._unit_resultant()), stats["csd"])
 
     def var(self):
         """Spherical variance based on resultant length (Mardia 1972).
 
         var = 1 - abs(R) / n
         """
-        return 1 - abs(self.normalized().R(mean=True))
+        return 1 - math.hypot(*self._unit_resultant()) / len(self)
 
     def delta(self):
         """Cone angle containing ~63% of the data in degrees.
@@ -552,7 +817,7 @@ class Vector3Set(FeatureSet):
         For enough large sample it approach angular standard deviation (csd)
         of Fisher statistics
         """
-        return acosd(abs(self.R(mean=True)))
+        return acosd(math.hypot(*self._resultant(self._array())) / len(self))
 
     def rdegree(self):
         """Degree of preffered orientation of vectors in ``FeatureSet``.
@@ -560,7 +825,8 @@ class Vector3Set(FeatureSet):
         D = 100 * (2 * abs(R) - n) / n
         """
         N = len(self)
-        return 100 * (2 * abs(self.normalized().R()) - N) / N
+        R = math.hypot(*self._unit_resultant())
+        return 100 * (2 * R - N) / N
 
     def ortensor(self):
         """Return orientation tensor ``Ortensor`` of ``Group``."""
@@ -598,17 +864,8 @@ class Vector3Set(FeatureSet):
 
         """
         dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
-        v = Vector3Set(self)
-        v_data = list(v)
-        alldone = np.all(v.angle(v.R()) <= 90)
-        while not alldone:
-            ang = v.angle(v.R())
-            for ix, do in enumerate(ang > 90):
-                if do:
-                    v_data[ix] = -v_data[ix]
-                v = Vector3Set(v_data)
-                alldone = np.all(v.angle(v.R()) <= 90)
-        return type(self)([dtype_cls(vec) for vec in v], name=self.name)
+        a = _halfspace(self._array())
+        return type(self)([dtype_cls(*v) for v in a.tolist()], name=self.name)
 
     @classmethod
     def from_csv(cls, filename, acol=0, icol=1):
@@ -628,30 +885,9 @@ class Vector3Set(FeatureSet):
 
         """
         from os.path import basename
-        import csv
-
-        with open(filename) as csvfile:
-            has_header = csv.Sniffer().has_header(csvfile.read(1024))
-            csvfile.seek(0)
-            dialect = csv.Sniffer().sniff(csvfile.read(1024))
-            csvfile.seek(0)
-            if isinstance(acol, int) and isinstance(icol, int):
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    aname, iname = reader.fieldnames[acol], reader.fieldnames[icol]
-                    r = [(float(row[aname]), float(row[iname])) for row in reader]
-                else:
-                    reader = csv.reader(csvfile, dialect=dialect)
-                    r = [(float(row[acol]), float(row[icol])) for row in reader]
-            else:
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    r = [(float(row[acol]), float(row[icol])) for row in reader]
-                else:
-                    raise ValueError("No header line in CSV file...")
 
-        azi, inc = zip(*r)
-        return cls.from_array(azi, inc, name=basename(filename))
+        r = _csv_columns(filename, (acol, icol))
+        return cls.from_array(r[:, 0], r[:, 1], name=basename(filename))
 
     def to_csv(self, filename, delimiter=","):
         """Save ``FeatureSet`` object to csv file of azimuths and inclinations
@@ -669,13 +905,11 @@ class Vector3Set(FeatureSet):
 
         n = apsg_conf["ndigits"]
 
+        azi, inc = self.geo
         with open(filename, "w", newline="") as csvfile:
-            fieldnames = ["azi", "inc"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for dt in self:
-                azi, inc = dt.geo
-                writer.writerow({"azi": round(azi, n), "inc": round(inc, n)})
+            writer = csv.writer(csvfile, delimiter=delimiter)
+            writer.writerow(["azi", "inc"])
+            writer.writerows(np.round(np.column_stack((azi, inc)), n).tolist())
 
     @classmethod
     def from_array(cls, azis, incs, name="Default"):
@@ -693,7 +927,11 @@ class Vector3Set(FeatureSet):
           >>> l = linset.from_array([120,130,140], [10,20,30])
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(azi, inc) for azi, inc in zip(azis, incs)], name=name)
+        if issubclass(dtype_cls, Foliation):
+            a = geo2vecs_planar(azis, incs)
+        else:
+            a = geo2vecs_linear(azis, incs)
+        return cls._from_array(a, name=name)
 
     @classmethod
     def from_xyz(cls, x, y, z, name="Default"):
@@ -712,11 +950,12 @@ class Vector3Set(FeatureSet):
                                   [0.75, 0.25, 0.60141061],
                                   [0.5, 0.8660254, 0.43837115])
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(xx, yy, zz) for xx, yy, zz in zip(x, y, z)], name=name)
+        return cls._from_array(np.column_stack((x, y, z)), name=name)
 
     @classmethod
-    def random_normal(cls, n=100, position=Vector3(0, 0, 1), sigma=20, name="Default"):
+    def random_normal(
+        cls, n=100, position=Vector3(0, 0, 1), sigma=20, name="Default", rng=None
+    ):
         """Method to create ``FeatureSet`` of normaly distributed features.
 
         Keyword Args:
@@ -724,6 +963,8 @@ class Vector3Set(FeatureSet):
           position: mean orientation given as ``Vector3``. Default Vector3(0, 0, 1)
           sigma: sigma of normal distribution. Default 20
           name: name of dataset. Default is 'Default'
+          rng: ``numpy.random.Generator`` or seed. Default None uses global
+            numpy random state
 
         Example:
           >>> np.random.seed(58463123)
@@ -732,18 +973,19 @@ class Vector3Set(FeatureSet):
           L:120/39
 
         """
-        data = []
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
+        rng = _random_source(rng)
         orig = Vector3(0, 0, 1)
         ax = orig.cross(position)
         ang = orig.angle(position)
-        for s, r in zip(
-            180 * np.random.uniform(low=0, high=180, size=n),
-            np.random.normal(loc=0, scale=sigma, size=n),
-        ):
-            v = orig.rotate(Vector3(s, 0), r).rotate(ax, ang)
-            data.append(dtype_cls(v))
-        return cls(data, name=name)
+        s = np.radians(180 * rng.uniform(low=0, high=180, size=n))
+        r = np.radians(rng.normal(loc=0, scale=sigma, size=n))
+        # vertical vector rotated by r about horizontal axis with azimuth s
+        v = np.column_stack((np.sin(r) * np.sin(s), -np.sin(r) * np.cos(s), np.cos(r)))
+        if abs(ax) > 0:
+            v = _rodrigues(v, ax, ang)
+        else:
+            v = np.cos(np.radians(ang)) * v
+        return cls._from_array(v, name=name)
 
     @classmethod
     def random_fisher(cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default"):
@@ -759,12 +1001,13 @@ class Vector3Set(FeatureSet):
         Example:
           >>> l = linset.random_fisher(position=lin(120,50))
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         dc = vonMisesFisher(position, kappa, n)
-        return cls([dtype_cls(d) for d in dc], name=name)
+        return cls._from_array(dc, name=name)
 
     @classmethod
-    def random_fisher2(cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default"):
+    def random_fisher2(
+        cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default", rng=None
+    ):
         """Method to create ``FeatureSet`` of vectors distributed according to
         Fisher distribution.
 
@@ -776,18 +1019,21 @@ class Vector3Set(FeatureSet):
           position: mean orientation given as ``Vector3``. Default Vector3(0, 0, 1)
           kappa: precision parameter of the distribution. Default 20
           name: name of dataset. Default is 'Default'
+          rng: ``numpy.random.Generator`` or seed. Default None uses global
+            numpy random state
 
         Example:
           >>> l = linset.random_fisher2(position=lin(120,50))
         """
+        rng = _random_source(rng)
         orig = Vector3(0, 0, 1)
         ax = orig.cross(position)
         ang = orig.angle(position)
         L = np.exp(-2 * kappa)
-        a = np.random.random(n) * (1 - L) + L
+        a = rng.random(n) * (1 - L) + L
         fac = np.sqrt(-np.log(a) / (2 * kappa))
         inc = 90 - 2 * np.degrees(np.arcsin(fac))
-        azi = 360 * np.random.random(n)
+        azi = 360 * rng.random(n)
         return cls.from_array(azi, inc, name=name).rotate(ax, ang)
 
     @classmethod
@@ -807,11 +1053,10 @@ class Vector3Set(FeatureSet):
           >>> l = linset.random_kent(p, n=300, kappa=30)
         """
         assert issubclass(type(p), Pair), "Argument must be Pair object."
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         if beta is None:
             beta = kappa / 2
         kd = KentDistribution(p.lvec, p.fvec.cross(p.lvec), p.fvec, kappa, beta)
-        return cls([dtype_cls(d) for d in kd.rvs(n)], name=name)
+        return cls._from_array(kd.rvs(n), name=name)
 
     @classmethod
     def uniform_sfs(cls, n=100, name="Default"):
@@ -830,14 +1075,13 @@ class Vector3Set(FeatureSet):
           >>> v.ortensor().eigenvalues()
           (0.3334645347163635, 0.33333474915201167, 0.33320071613162483)
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         phi = (1 + np.sqrt(5)) / 2
         i2 = 2 * np.arange(n) - n + 1
         theta = 2 * np.pi * i2 / phi
         sp = i2 / n
         cp = np.sqrt((n + i2) * (n - i2)) / n
         dc = np.array([cp * np.sin(theta), cp * np.cos(theta), sp]).T
-        return cls([dtype_cls(d) for d in dc], name=name)
+        return cls._from_array(dc, name=name)
 
     @classmethod
     def uniform_gss(cls, n=100, name="Default"):
@@ -855,7 +1099,6 @@ class Vector3Set(FeatureSet):
           >>> v.ortensor().eigenvalues()
           (0.33335688569571587, 0.33332315115436933, 0.33331996314991513)
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         inc = np.pi * (3 - np.sqrt(5))
         off = 2 / n
         k = np.arange(n)
@@ -863,7 +1106,7 @@ class Vector3Set(FeatureSet):
         r = np.sqrt(1 - y * y)
         phi = k * inc
         dc = np.array([np.cos(phi) * r, y, np.sin(phi) * r]).T
-        return cls([dtype_cls(d) for d in dc], name=name)
+        return cls._from_array(dc, name=name)
 
 
 class LineationSet(Vector3Set):
@@ -876,6 +1119,11 @@ class LineationSet(Vector3Set):
     def __repr__(self):
         return f"L({len(self)}) {self.name}"
 
+    @property
+    def geo(self):
+        """Return arrays of plunge directions and plunges"""
+        return vecs2geo_linear(self._array())
+
 
 class FoliationSet(Vector3Set):
     """
@@ -887,9 +1135,15 @@ class FoliationSet(Vector3Set):
     def __repr__(self):
         return f"S({len(self)}) {self.name}"
 
+    @property
+    def geo(self):
+        """Return arrays of azi and inc according to apsg_conf['notation']"""
+        return vecs2geo_planar(self._array())
+
     def dipvec(self):
         """Return ``FeatureSet`` object with plane dip vector."""
-        return Vector3Set([e.dipvec() for e in self], name=self.name)
+        dv = geo2vecs_linear(*vecs2geo_planar(self._array()))
+        return Vector3Set._from_array(dv, name=self.name)
 
 
 class PairSet(FeatureSet):
@@ -902,33 +1156,41 @@ class PairSet(FeatureSet):
     def __repr__(self):
         return f"P({len(self)}) {self.name}"
 
-    def __array__(self, dtype=None):
-        return np.array([np.array(p) for p in self.data], dtype=dtype)
+    def _pack(self):
+        """Return new (n, 6) float array of features"""
+        return np.array(
+            [e.fvec._coords + e.lvec._coords for e in self.data], dtype=float
+        ).reshape(-1, 6)
+
+    def _fl(self):
+        """Return (n, 3) float arrays of planar and linear vectors"""
+        a = np.asarray(self, dtype=float)
+        return a[:, :3], a[:, 3:6]
 
     @property
     def fol(self):
         """Return Foliations of pairs as FoliationSet"""
-        return FoliationSet([e.fol for e in self], name=self.name)
+        return FoliationSet._from_array(self._fl()[0], name=self.name)
 
     @property
     def fvec(self):
         """Return planar normal vectors of pairs as Vector3Set"""
-        return Vector3Set([e.fvec for e in self], name=self.name)
+        return Vector3Set._from_array(self._fl()[0], name=self.name)
 
     @property
     def lin(self):
         """Return Lineation of pairs as LineationSet"""
-        return LineationSet([e.lin for e in self], name=self.name)
+        return LineationSet._from_array(self._fl()[1], name=self.name)
 
     @property
     def lvec(self):
         """Return lineation vectors of pairs as Vector3Set"""
-        return Vector3Set([e.lvec for e in self], name=self.name)
+        return Vector3Set._from_array(self._fl()[1], name=self.name)
 
     @property
     def misfit(self):
         """Return array of misfits"""
-        return np.array([f.misfit for f in self])
+        return np.fromiter((f.misfit for f in self), dtype=float, count=len(self))
 
     @property
     def rax(self):
@@ -936,7 +1198,8 @@ class PairSet(FeatureSet):
         Return vectors perpendicular to both planar and linear parts of
         pairs as Vector3Set
         """
-        return Vector3Set([e.rax for e in self], name=self.name)
+        f, lv = self._fl()
+        return Vector3Set._from_array(np.cross(lv, f), name=self.name)
 
     @property
     def ortensor(self):
@@ -957,60 +1220,9 @@ class PairSet(FeatureSet):
         """Read ``PairSet`` from csv file"""
 
         from os.path import basename
-        import csv
 
-        with open(filename) as csvfile:
-            has_header = csv.Sniffer().has_header(csvfile.read(1024))
-            csvfile.seek(0)
-            dialect = csv.Sniffer().sniff(csvfile.read(1024))
-            csvfile.seek(0)
-            if (
-                isinstance(facol, int)
-                and isinstance(ficol, int)
-                and isinstance(lacol, int)
-                and isinstance(licol, int)
-            ):
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    faname, finame = reader.fieldnames[facol], reader.fieldnames[ficol]
-                    laname, liname = reader.fieldnames[lacol], reader.fieldnames[licol]
-                    r = [
-                        (
-                            float(row[faname]),
-                            float(row[finame]),
-                            float(row[laname]),
-                            float(row[liname]),
-                        )
-                        for row in reader
-                    ]
-                else:
-                    reader = csv.reader(csvfile, dialect=dialect)
-                    r = [
-                        (
-                            float(row[facol]),
-                            float(row[ficol]),
-                            float(row[lacol]),
-                            float(row[licol]),
-                        )
-                        for row in reader
-                    ]
-            else:
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    r = [
-                        (
-                            float(row[facol]),
-                            float(row[ficol]),
-                            float(row[lacol]),
-                            float(row[licol]),
-                        )
-                        for row in reader
-                    ]
-                else:
-                    raise ValueError("No header line in CSV file...")
-
-        fazi, finc, lazi, linc = zip(*r)
-        return cls.from_array(fazi, finc, lazi, linc, name=basename(filename))
+        r = _csv_columns(filename, (facol, ficol, lacol, licol))
+        return cls.from_array(*r.T, name=basename(filename))
 
     def to_csv(self, filename, delimiter=","):
         """Save ``PairSet`` object to csv file
@@ -1057,13 +1269,9 @@ class PairSet(FeatureSet):
         """
 
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls(
-            [
-                dtype_cls(fazi, finc, lazi, linc)
-                for fazi, finc, lazi, linc in zip(fazis, fincs, lazis, lincs)
-            ],
-            name=name,
-        )
+        fvecs = geo2vecs_planar(fazis, fincs)
+        lvecs = geo2vecs_linear(lazis, lincs)
+        return cls(dtype_cls._from_arrays(fvecs, lvecs), name=name)
 
 
 class FaultSet(PairSet):
@@ -1076,40 +1284,61 @@ class FaultSet(PairSet):
     def __repr__(self):
         return f"F({len(self)}) {self.name}"
 
+    def _pack(self):
+        """Return new (n, 7) float array of features"""
+        a = super()._pack()
+        f, lv = a[:, :3], a[:, 3:]
+        # sense is +1 when rax is same as rax of lower hemisphere vectors
+        rax = np.cross(lv, f)
+        georax = np.cross(
+            np.where(lv[:, 2:] < 0, -lv, lv), np.where(f[:, 2:] < 0, -f, f)
+        )
+        same = np.all(abs(rax - georax) <= 1e-08 + 1e-05 * abs(georax), axis=1)
+        return np.column_stack((a, np.where(same, 1.0, -1.0)))
+
+    def _pt(self, ptangle):
+        """Return (n, 3) float array of fvec rotated by ptangle/2 around rax"""
+        f, lv = self._fl()
+        return _rodrigues_rows(f, np.cross(lv, f), ptangle / 2)
+
     @property
     def sense(self):
         """Return array of sense values"""
-        return np.array([f.sense for f in self])
+        return np.asarray(self)[:, 6].astype(int)
 
     @property
     def p_vector(self, ptangle=90):
         """Return p-axes of FaultSet as Vector3Set"""
-        return Vector3Set([e.p_vector(ptangle) for e in self], name=self.name)
+        return Vector3Set._from_array(self._pt(-ptangle), name=self.name)
 
     @property
     def t_vector(self, ptangle=90):
         """Return t-axes of FaultSet as Vector3Set"""
-        return Vector3Set([e.t_vector(ptangle) for e in self], name=self.name)
+        return Vector3Set._from_array(self._pt(ptangle), name=self.name)
 
     @property
     def p(self):
         """Return p-axes of FaultSet as LineationSet"""
-        return LineationSet([e.p for e in self], name=self.name + "-P")
+        return LineationSet._from_array(self._pt(-90), name=self.name + "-P")
 
     @property
     def t(self):
         """Return t-axes of FaultSet as LineationSet"""
-        return LineationSet([e.t for e in self], name=self.name + "-T")
+        return LineationSet._from_array(self._pt(90), name=self.name + "-T")
 
     @property
     def m(self):
         """Return m-planes of FaultSet as FoliationSet"""
-        return FoliationSet([e.m for e in self], name=self.name + "-M")
+        f, lv = self._fl()
+        return FoliationSet._from_array(np.cross(lv, f), name=self.name + "-M")
 
     @property
     def d(self):
         """Return dihedra planes of FaultSet as FoliationSet"""
-        return FoliationSet([e.d for e in self], name=self.name + "-D")
+        f, lv = self._fl()
+        return FoliationSet._from_array(
+            np.cross(np.cross(lv, f), f), name=self.name + "-D"
+        )
 
     @classmethod
     def random(cls, n=25):
@@ -1123,65 +1352,9 @@ class FaultSet(PairSet):
         """Read ``FaultSet`` from csv file"""
 
         from os.path import basename
-        import csv
 
-        with open(filename) as csvfile:
-            has_header = csv.Sniffer().has_header(csvfile.read(1024))
-            csvfile.seek(0)
-            dialect = csv.Sniffer().sniff(csvfile.read(1024))
-            csvfile.seek(0)
-            if (
-                isinstance(facol, int)
-                and isinstance(ficol, int)
-                and isinstance(lacol, int)
-                and isinstance(licol, int)
-                and isinstance(scol, int)
-            ):
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    faname, finame = reader.fieldnames[facol], reader.fieldnames[ficol]
-                    laname, liname = reader.fieldnames[lacol], reader.fieldnames[licol]
-                    sname = reader.fieldnames[scol]
-                    r = [
-                        (
-                            float(row[faname]),
-                            float(row[finame]),
-                            float(row[laname]),
-                            float(row[liname]),
-                            int(row[sname]),
-                        )
-                        for row in reader
-                    ]
-                else:
-                    reader = csv.reader(csvfile, dialect=dialect)
-                    r = [
-                        (
-                            float(row[facol]),
-                            float(row[ficol]),
-                            float(row[lacol]),
-                            float(row[licol]),
-                            int(row[scol]),
-                        )
-                        for row in reader
-                    ]
-            else:
-                if has_header:
-                    reader = csv.DictReader(csvfile, dialect=dialect)
-                    r = [
-                        (
-                            float(row[facol]),
-                            float(row[ficol]),
-                            float(row[lacol]),
-                            float(row[licol]),
-                            int(row[scol]),
-                        )
-                        for row in reader
-                    ]
-                else:
-                    raise ValueError("No header line in CSV file...")
-
-        fazi, finc, lazi, linc, sense = zip(*r)
-        return cls.from_array(fazi, finc, lazi, linc, sense, name=basename(filename))
+        r = _csv_columns(filename, (facol, ficol, lacol, licol, scol))
+        return cls.from_array(*r.T, name=basename(filename))
 
     def to_csv(self, filename, delimiter=","):
         """Save ``FaultSet`` object to csv file
@@ -1229,15 +1402,10 @@ class FaultSet(PairSet):
         """
 
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls(
-            [
-                dtype_cls(fazi, finc, lazi, linc, sense)
-                for fazi, finc, lazi, linc, sense in zip(
-                    fazis, fincs, lazis, lincs, senses
-                )
-            ],
-            name=name,
-        )
+        fvecs = geo2vecs_planar(fazis, fincs)
+        lvecs = geo2vecs_linear(lazis, lincs)
+        lvecs[np.asarray(senses) < 0] *= -1
+        return cls(dtype_cls._from_arrays(fvecs, lvecs), name=name)
 
 
 class ConeSet(FeatureSet):
@@ -1263,49 +1431,49 @@ class EllipseSet(FeatureSet):
         """
         Return the array of maximum principal stretches.
         """
-        return np.array([e.S1 for e in self])
+        return np.fromiter((e.S1 for e in self), dtype=float, count=len(self))
 
     @property
     def S2(self) -> np.ndarray:
         """
         Return the array of minimum principal stretches.
         """
-        return np.array([e.S2 for e in self])
+        return np.fromiter((e.S2 for e in self), dtype=float, count=len(self))
 
     @property
     def e1(self) -> np.ndarray:
         """
         Return the maximum natural principal strains.
         """
-        return np.array([e.e1 for e in self])
+        return np.fromiter((e.e1 for e in self), dtype=float, count=len(self))
 
     @property
     def e2(self) -> np.ndarray:
         """
         Return the array of minimum natural principal strains.
         """
-        return np.array([e.e2 for e in self])
+        return np.fromiter((e.e2 for e in self), dtype=float, count=len(self))
 
     @property
     def ar(self) -> np.ndarray:
         """
         Return the array of axial ratios.
         """
-        return np.array([e.ar for e in self])
+        return np.fromiter((e.ar for e in self), dtype=float, count=len(self))
 
     @property
     def orientation(self) -> np.ndarray:
         """
         Return the array of orientations of the maximum eigenvector.
         """
-        return np.array([e.orientation for e in self])
+        return np.fromiter((e.orientation for e in self), dtype=float, count=len(self))
 
     @property
     def e12(self) -> np.ndarray:
         """
         Return the array of differences between natural principal strains.
         """
-        return np.array([e.e12 for e in self])
+        return np.fromiter((e.e12 for e in self), dtype=float, count=len(self))
 
 
 class OrientationTensor2Set(EllipseSet):
@@ -1323,208 +1491,244 @@ class EllipsoidSet(FeatureSet):
 
     __feature_type__ = "Ellipsoid"
 
+    def _eigenvalues(self):
+        """Return cached (n, 3) array of eigenvalues of all tensors"""
+        if "eig" not in self._cache:
+            eig = np.array([e.eigenvalues() for e in self], dtype=float)
+            self._cache["eig"] = eig.reshape(-1, 3)
+        return self._cache["eig"]
+
+    def _stretches(self):
+        """Return (n, 3) array of principal stretches"""
+        with np.errstate(invalid="ignore"):
+            return np.sqrt(self._eigenvalues())
+
+    def _strains(self):
+        """Return (n, 3) array of natural principal strains"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log(self._stretches())
+
     @property
     def strength(self) -> np.ndarray:
         """
         Return the array of the Woodcock strength.
         """
-        return np.array([e.strength for e in self])
+        return self.e13
 
     @property
     def shape(self) -> np.ndarray:
         """
         Return the array of the Woodcock shape.
         """
-        return np.array([e.shape for e in self])
+        return self.K
 
     @property
     def S1(self) -> np.ndarray:
         """
         Return the array of maximum principal stretches.
         """
-        return np.array([e.S1 for e in self])
+        return self._stretches()[:, 0]
 
     @property
     def S2(self) -> np.ndarray:
         """
         Return the array of middle principal stretches.
         """
-        return np.array([e.S2 for e in self])
+        return self._stretches()[:, 1]
 
     @property
     def S3(self) -> np.ndarray:
         """
         Return the array of minimum principal stretches.
         """
-        return np.array([e.S3 for e in self])
+        return self._stretches()[:, 2]
 
     @property
     def e1(self) -> np.ndarray:
         """
         Return the array of the maximum natural principal strain.
         """
-        return np.array([e.e1 for e in self])
+        return self._strains()[:, 0]
 
     @property
     def e2(self) -> np.ndarray:
         """
         Return the array of the middle natural principal strain.
         """
-        return np.array([e.e2 for e in self])
+        return self._strains()[:, 1]
 
     @property
     def e3(self) -> np.ndarray:
         """
         Return the array of the minimum natural principal strain.
         """
-        return np.array([e.e3 for e in self])
+        return self._strains()[:, 2]
 
     @property
     def Rxy(self) -> np.ndarray:
         """
         Return the array of the Rxy ratios.
         """
-        return np.array([e.Rxy for e in self])
+        S1, S2, _ = self._stretches().T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(S2 != 0, S1 / S2, np.inf)
 
     @property
     def Ryz(self) -> np.ndarray:
         """
         Return the array of the Ryz ratios.
         """
-        return np.array([e.Ryz for e in self])
+        _, S2, S3 = self._stretches().T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(S3 != 0, S2 / S3, np.inf)
 
     @property
     def e12(self) -> np.ndarray:
         """
         Return the array of the e1 - e2 values.
         """
-        return np.array([e.e12 for e in self])
+        e1, e2, _ = self._strains().T
+        return e1 - e2
 
     @property
     def e13(self) -> np.ndarray:
         """
         Return the array of the e1 - e3 values.
         """
-        return np.array([e.e13 for e in self])
+        e1, _, e3 = self._strains().T
+        return e1 - e3
 
     @property
     def e23(self) -> np.ndarray:
         """
         Return the array of the e2 - e3 values.
         """
-        return np.array([e.e23 for e in self])
+        _, e2, e3 = self._strains().T
+        return e2 - e3
 
     @property
     def k(self) -> np.ndarray:
         """
         Return the array of the strain symmetries.
         """
-        return np.array([e.k for e in self])
+        Rxy, Ryz = self.Rxy, self.Ryz
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(Ryz > 1, (Rxy - 1) / (Ryz - 1), np.inf)
 
     @property
     def d(self) -> np.ndarray:
         """
         Return the array of the strain intensities.
         """
-        return np.array([e.d for e in self])
+        return np.sqrt((self.Rxy - 1) ** 2 + (self.Ryz - 1) ** 2)
 
     @property
     def K(self) -> np.ndarray:
         """
         Return the array of the strain symmetries K (Ramsay, 1983).
         """
-        return np.array([e.K for e in self])
+        e12, e23 = self.e12, self.e23
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(e23 > 0, e12 / e23, np.inf)
 
     @property
     def D(self) -> np.ndarray:
         """
         Return the array of the strain intensities D (Ramsay, 1983)..
         """
-        return np.array([e.D for e in self])
+        return self.e12**2 + self.e23**2
 
     @property
     def r(self) -> np.ndarray:
         """
         Return the array of the strain intensities (Watterson, 1968).
         """
-        return np.array([e.r for e in self])
+        return self.Rxy + self.Ryz - 1
 
     @property
     def goct(self) -> np.ndarray:
         """
         Return the array of the natural octahedral unit shears (Nadai, 1963).
         """
-        return np.array([e.goct for e in self])
+        return 2 * np.sqrt(self.e12**2 + self.e23**2 + self.e13**2) / 3
 
     @property
     def eoct(self) -> np.ndarray:
         """
         Return the array of the natural octahedral unit strains (Nadai, 1963).
         """
-        return np.array([e.eoct for e in self])
+        return np.sqrt(3) * self.goct / 2
 
     @property
     def lode(self) -> np.ndarray:
         """
         Return the array of Lode parameters (Lode, 1926).
         """
-        return np.array([e.lode for e in self])
+        e1, e2, e3 = self._strains().T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(e1 - e3 > 0, (2 * e2 - e1 - e3) / (e1 - e3), 0.0)
 
     @property
     def P(self) -> np.ndarray:
         """
         Return the array of Point indexes (Vollmer, 1990).
         """
-        return np.array([e.P for e in self])
+        E1, E2, _ = self._eigenvalues().T
+        return E1 - E2
 
     @property
     def G(self) -> np.ndarray:
         """
         Return the array of Girdle indexes (Vollmer, 1990).
         """
-        return np.array([e.G for e in self])
+        _, E2, E3 = self._eigenvalues().T
+        return 2 * (E2 - E3)
 
     @property
     def R(self) -> np.ndarray:
         """
         Return the array of Random indexes (Vollmer, 1990).
         """
-        return np.array([e.R for e in self])
+        return 3 * self._eigenvalues()[:, 2]
 
     @property
     def B(self) -> np.ndarray:
         """
         Return the array of Cylindricity indexes (Vollmer, 1990).
         """
-        return np.array([e.B for e in self])
+        return self.P + self.G
 
     @property
     def Intensity(self) -> np.ndarray:
         """
         Return the array of Intensity indexes (Lisle, 1985).
         """
-        return np.array([e.Intensity for e in self])
+        return 7.5 * np.sum((self._eigenvalues() - 1 / 3) ** 2, axis=1)
 
     @property
     def aMAD_l(self) -> np.ndarray:
         """
         Return approximate angular deviation from the major axis along E1.
         """
-        return np.array([e.aMAD_l for e in self])
+        E1 = self._eigenvalues()[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.degrees(np.arctan(np.sqrt((1 - E1) / E1)))
 
     @property
     def aMAD_p(self) -> np.ndarray:
         """
         Return approximate deviation from the plane normal to E3.
         """
-        return np.array([e.aMAD_p for e in self])
+        E3 = self._eigenvalues()[:, 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.degrees(np.arctan(np.sqrt(E3 / (1 - E3))))
 
     @property
     def aMAD(self) -> np.ndarray:
         """
         Return approximate deviation according to the shape
         """
-        return np.array([e.aMAD for e in self])
+        return np.where(self.shape > 1, self.aMAD_l, self.aMAD_p)
 
     @property
     def MAD_l(self) -> np.ndarray:
@@ -1532,7 +1736,9 @@ class EllipsoidSet(FeatureSet):
         Return maximum angular deviation (MAD) of linearly distributed vectors.
         Kirschvink 1980
         """
-        return np.array([e.MAD_l for e in self])
+        E1, E2, E3 = self._eigenvalues().T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.degrees(np.arctan(np.sqrt((E2 + E3) / E1)))
 
     @property
     def MAD_p(self) -> np.ndarray:
@@ -1540,14 +1746,16 @@ class EllipsoidSet(FeatureSet):
         Return maximum angular deviation (MAD) of planarly distributed vectors.
         Kirschvink 1980
         """
-        return np.array([e.MAD_p for e in self])
+        E1, E2, E3 = self._eigenvalues().T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.degrees(np.arctan(np.sqrt(E3 / E2 + E3 / E1)))
 
     @property
     def MAD(self) -> np.ndarray:
         """
         Return approximate deviation according to shape
         """
-        return np.array([e.MAD for e in self])
+        return np.where(self.shape > 1, self.MAD_l, self.MAD_p)
 
 
 class OrientationTensor3Set(EllipsoidSet):
@@ -1627,6 +1835,7 @@ class ClusterSet(object):
 
         See ``scipy.cluster.hierarchy.dendrogram`` for possible kwargs.
         """
+        import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots(figsize=apsg_conf["figsize"])
         dendrogram(self.Z, ax=ax, **kwargs)
@@ -1651,6 +1860,8 @@ class ClusterSet(object):
             within_grp_var.append(var)
             mean_var.append(np.mean(var))
         if not no_plot:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=apsg_conf["figsize"])
             ax.boxplot(within_grp_var, positions=nclust)
             ax.plot(nclust, mean_var, "k")
@@ -1667,6 +1878,22 @@ class ClusterSet(object):
         return type(self.data)([group.R() for group in self.groups])
 
 
+# feature type to container dispatch table used by G
+_FEATURESET_TYPES = {
+    Vector3: Vector3Set,
+    Vector2: Vector2Set,
+    Lineation: LineationSet,
+    Foliation: FoliationSet,
+    Pair: PairSet,
+    Fault: FaultSet,
+    Cone: ConeSet,
+    Ellipsoid: EllipsoidSet,
+    OrientationTensor3: OrientationTensor3Set,
+    Ellipse: EllipseSet,
+    OrientationTensor2: OrientationTensor2Set,
+}
+
+
 def G(lst, name="Default"):
     """
     Function to create appropriate container (FeatueSet) from list of features.
@@ -1685,32 +1912,13 @@ def G(lst, name="Default"):
     """
     if hasattr(lst, "__len__"):
         dtype_cls = type(lst[0])
-        assert all([isinstance(obj, dtype_cls) for obj in lst])
-        if dtype_cls is Vector3:
-            return Vector3Set(lst, name=name)
-        elif dtype_cls is Vector2:
-            return Vector2Set(lst, name=name)
-        elif dtype_cls is Lineation:
-            return LineationSet(lst, name=name)
-        elif dtype_cls is Foliation:
-            return FoliationSet(lst, name=name)
-        elif dtype_cls is Pair:
-            return PairSet(lst, name=name)
-        elif dtype_cls is Fault:
-            return FaultSet(lst, name=name)
-        elif dtype_cls is Cone:
-            return ConeSet(lst, name=name)
-        elif dtype_cls is Ellipsoid:
-            return EllipsoidSet(lst, name=name)
-        elif dtype_cls is OrientationTensor3:
-            return OrientationTensor3Set(lst, name=name)
-        elif dtype_cls is Ellipse:
-            return EllipseSet(lst, name=name)
-        elif dtype_cls is OrientationTensor2:
-            return OrientationTensor2Set(lst, name=name)
-        else:
+        set_cls = _FEATURESET_TYPES.get(dtype_cls)
+        if set_cls is None:
             raise TypeError("Wrong datatype to create FeatureSet")
+        if not all(isinstance(obj, dtype_cls) for obj in lst):
+            raise TypeError("All features must be of the same type")
+        return set_cls(lst, name=name)
 
 
 def angle_metric(u, v):
-    return np.degrees(np.arccos(np.abs(np.dot(u, v))))
+    return np.degrees(np.arccos(np.clip(np.abs(np.dot(u, v)), 0, 1)))
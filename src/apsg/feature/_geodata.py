@@ -9,7 +9,7 @@ from apsg.helpers._notation import (
     vec2geo_linear_signed,
 )
 from apsg.decorator._decorator import ensure_first_arg_same, ensure_arguments
-from apsg.math._vector import Vector3, Axial3
+from apsg.math._vector import Vector3, Axial3, _rodrigues_rows
 
 
 class Lineation(Axial3):
@@ -164,7 +164,7 @@ class Foliation(Axial3):
             >>> f.transform(F)
             S:315/20
         """
-        r = np.dot(self, np.linalg.inv(F))
+        r = Vector3(np.dot(self, np.linalg.inv(F)))
         if kwargs.get("norm", False):
             r = r.normalized()
         return type(self)(r)
@@ -246,6 +246,33 @@ class Pair:
         self.lvec = Vector3(lvec.rotate(ax, -ang))
         self.misfit = misfit
 
+    @classmethod
+    def _from_arrays(cls, fvecs, lvecs):
+        # batch constructor from (n, 3) arrays of planar normals and linear
+        # vectors. Misfit correction is evaluated for all rows at once.
+        f = np.asarray(fvecs, dtype=float).reshape(-1, 3)
+        lv = np.asarray(lvecs, dtype=float).reshape(-1, 3)
+        fu = f / np.linalg.norm(f, axis=1, keepdims=True)
+        lu = lv / np.linalg.norm(lv, axis=1, keepdims=True)
+        ang = np.degrees(np.arccos(np.clip(np.einsum("ij,ij->i", fu, lu), -1, 1)))
+        misfits = abs(90 - ang)
+        for misfit in misfits[misfits > 20]:
+            warnings.warn(f"Warning: Misfit angle is {misfit:.1f} degrees.")
+        ax = np.cross(f, lv)
+        theta = (ang - 90) / 2
+        res = []
+        for fr, lr, misfit in zip(
+            _rodrigues_rows(f, ax, theta).tolist(),
+            _rodrigues_rows(lv, ax, -theta).tolist(),
+            misfits.tolist(),
+        ):
+            p = cls.__new__(cls)
+            p.fvec = Vector3(*fr)
+            p.lvec = Vector3(*lr)
+            p.misfit = misfit
+            res.append(p)
+        return res
+
     def __repr__(self):
         fazi, finc = self.fol.geo
         lazi, linc = self.lin.geo
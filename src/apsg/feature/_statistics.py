@@ -417,10 +417,13 @@ class KentDistribution(object):
         """
 
         num_samples = 1 if n_samples is None else n_samples
-        rvs = self._cached_rvs
-        while len(rvs) < num_samples:
+        chunks = [self._cached_rvs]
+        available = len(self._cached_rvs)
+        while available < num_samples:
             new_rvs = self._rvs_helper()
-            rvs = np.concatenate([rvs, new_rvs])
+            chunks.append(new_rvs)
+            available += len(new_rvs)
+        rvs = np.concatenate(chunks)
         if n_samples is None:
             self._cached_rvs = rvs[1:]
             return rvs[0]
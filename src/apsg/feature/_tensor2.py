@@ -85,19 +85,19 @@ class DeformationGradient2(Matrix2):
     def R(self):
         """Return rotation part of ``DeformationGradient2`` from polar decomposition."""
         R, _ = spla.polar(self)
-        return type(self)(R)
+        return self._from_array(R)
 
     @property
     def U(self):
         """Return stretching part of ``DeformationGradient2`` from right polar decomposition."""
         _, U = spla.polar(self, "right")
-        return type(self)(U)
+        return self._from_array(U)
 
     @property
     def V(self):
         """Return stretching part of ``DeformationGradient2`` from left polar decomposition."""
         _, V = spla.polar(self, "left")
-        return type(self)(V)
+        return self._from_array(V)
 
     def angle(self):
         """Return rotation part of ``DeformationGradient2`` as angle."""
@@ -108,7 +108,7 @@ class DeformationGradient2(Matrix2):
         """Return ``VelocityGradient2`` for given time"""
         from scipy.linalg import logm
 
-        return VelocityGradient2(logm(np.asarray(self)) / time)
+        return VelocityGradient2(logm(self._coefs) / time)
 
 
 class VelocityGradient2(Matrix2):
@@ -140,25 +140,25 @@ class VelocityGradient2(Matrix2):
 
         if steps > 1:  # FIX once container for matrix will be implemented
             return [
-                DeformationGradient2(expm(np.asarray(self) * t))
+                DeformationGradient2(expm(self._coefs * t))
                 for t in np.linspace(0, time, steps)
             ]
         else:
-            return DeformationGradient2(expm(np.asarray(self) * time))
+            return DeformationGradient2(expm(self._coefs * time))
 
     def rate(self):
         """
         Return rate of deformation tensor
         """
 
-        return type(self)((self + self.T) / 2)
+        return (self + self.T) / 2
 
     def spin(self):
         """
         Return spin tensor
         """
 
-        return type(self)((self - self.T) / 2)
+        return (self - self.T) / 2
 
 
 class Tensor2(Matrix2):
@@ -215,7 +215,7 @@ class Stress2(Tensor2):
         Mean hydrostatic stress tensor component
         """
 
-        return type(self)(np.diag(self.mean_stress * np.ones(2)))
+        return self._from_array(np.diag(self.mean_stress * np.ones(2)))
 
     @property
     def deviatoric(self):
@@ -223,7 +223,7 @@ class Stress2(Tensor2):
         A stress deviator tensor component
         """
 
-        return type(self)(self - self.hydrostatic)
+        return self - self.hydrostatic
 
     @property
     def sigma1(self):
@@ -306,7 +306,7 @@ class Stress2(Tensor2):
         coordinate system to the principal one.
         """
         return (
-            type(self)(np.diag(self.eigenvalues())),
+            self._from_array(np.diag(self.eigenvalues())),
             DeformationGradient2(self.eigenvectors()),
         )
 
@@ -509,4 +509,5 @@ class OrientationTensor2(Ellipse):
 
         """
 
-        return cls(np.dot(np.array(g).T, np.array(g)) / len(g))
+        a = np.asarray(g, dtype=float)
+        return cls._from_array(np.dot(a.T, a) / len(a))
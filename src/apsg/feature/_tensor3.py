@@ -196,21 +196,21 @@ class DeformationGradient3(Matrix3):
     def R(self):
         """Return rotation part of ``DeformationGradient3`` from polar decomposition."""
         R, _ = spla.polar(self)
-        return type(self)(R)
+        return self._from_array(R)
 
     @property
     def U(self):
         """Return stretching part of ``DeformationGradient3`` from right polar
         decomposition."""
         _, U = spla.polar(self, "right")
-        return type(self)(U)
+        return self._from_array(U)
 
     @property
     def V(self):
         """Return stretching part of ``DeformationGradient3`` from left polar
         decomposition."""
         _, V = spla.polar(self, "left")
-        return type(self)(V)
+        return self._from_array(V)
 
     def axisangle(self):
         """Return rotation part of ``DeformationGradient3`` as axis, angle tuple."""
@@ -256,7 +256,7 @@ class DeformationGradient3(Matrix3):
         """
         from scipy.linalg import logm
 
-        return VelocityGradient3(logm(np.asarray(self)) / time)
+        return VelocityGradient3(logm(self._coefs) / time)
 
 
 class VelocityGradient3(Matrix3):
@@ -287,25 +287,25 @@ class VelocityGradient3(Matrix3):
 
         if steps > 1:  # FIX once container for matrix will be implemented
             return [
-                DeformationGradient3(expm(np.asarray(self) * t))
+                DeformationGradient3(expm(self._coefs * t))
                 for t in np.linspace(0, time, steps)
             ]
         else:
-            return DeformationGradient3(expm(np.asarray(self) * time))
+            return DeformationGradient3(expm(self._coefs * time))
 
     def rate(self):
         """
         Return rate of deformation tensor
         """
 
-        return type(self)((self + self.T) / 2)
+        return (self + self.T) / 2
 
     def spin(self):
         """
         Return spin tensor
         """
 
-        return type(self)((self - self.T) / 2)
+        return (self - self.T) / 2
 
 
 class Tensor3(Matrix3):
@@ -404,7 +404,7 @@ class Stress3(Tensor3):
         Mean hydrostatic stress tensor component
         """
 
-        return type(self)(np.diag(self.mean_stress * np.ones(3)))
+        return self._from_array(np.diag(self.mean_stress * np.ones(3)))
 
     @property
     def deviatoric(self):
@@ -412,7 +412,7 @@ class Stress3(Tensor3):
         A stress deviator tensor component
         """
 
-        return type(self)(self - self.hydrostatic)
+        return self - self.hydrostatic
 
     def effective(self, fp):
         """
@@ -422,7 +422,7 @@ class Stress3(Tensor3):
             fp (flot): fluid pressure
         """
 
-        return type(self)(self + fp * Stress3())
+        return self + fp * Stress3()
 
     @property
     def sigma1(self):
@@ -531,7 +531,7 @@ class Stress3(Tensor3):
 
         """
         return (
-            type(self)(np.diag(self.eigenvalues())),
+            self._from_array(np.diag(self.eigenvalues())),
             DeformationGradient3(self.eigenvectors()),
         )
 
@@ -679,9 +679,9 @@ class Ellipsoid(Tensor3):
                   Default is 'left'.
         """
         if form in ("left", "B"):
-            return cls(np.dot(F, np.transpose(F)), **kwargs)
+            return cls(F @ F.T, **kwargs)
         elif form in ("right", "C"):
-            return cls(np.dot(np.transpose(F), F), **kwargs)
+            return cls(F.T @ F, **kwargs)
         else:
             raise TypeError("Wrong form argument")
 
@@ -1008,7 +1008,8 @@ class OrientationTensor3(Ellipsoid):
 
         """
 
-        return cls(np.dot(np.array(g).T, np.array(g)) / len(g))
+        a = np.asarray(g, dtype=float)
+        return cls._from_array(np.dot(a.T, a) / len(a))
 
     @classmethod
     def from_pairs(cls, p, shift=True) -> "OrientationTensor3":
@@ -7,6 +7,10 @@ from apsg.helpers._notation import (
     geo2vec_linear,
     vec2geo_planar,
     vec2geo_linear,
+    vecs2geo_planar,
+    vecs2geo_linear,
+    geo2vecs_planar,
+    geo2vecs_linear,
 )
 
 __all__ = (
@@ -25,4 +29,8 @@ __all__ = (
     "geo2vec_linear",
     "vec2geo_planar",
     "vec2geo_linear",
+    "vecs2geo_planar",
+    "vecs2geo_linear",
+    "geo2vecs_planar",
+    "geo2vecs_linear",
 )
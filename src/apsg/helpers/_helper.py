@@ -1,7 +1,34 @@
 # some utils
+import json
+import pickle
+
+import numpy as np
 
 
 def eformat(f, prec):
     s = "{:e}".format(f)
     m, e = s.split("e")
     return "{:.{:d}f}E{:0d}".format(float(m), prec, int(e))
+
+
+def _json_default(obj):
+    # numpy values could appear in plot kwargs
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def save_json(data, filename):
+    """Save JSON dict to file"""
+    with open(filename, "w") as f:
+        json.dump(data, f, default=_json_default)
+
+
+def load_json(filename):
+    """Load JSON dict from file. Files saved as pickle are still supported."""
+    with open(filename, "rb") as f:
+        if f.peek(1)[:1] == b"\x80":
+            return pickle.load(f)
+        return json.load(f)
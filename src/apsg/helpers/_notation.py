@@ -1,17 +1,27 @@
+import math
+
+import numpy as np
+
 from apsg.config import apsg_conf
-from apsg.helpers._math import sind, cosd, asind, atan2d
+from apsg.helpers._math import asind, atan2d
 
 # NOTATION TRANSORMATIONS
 
 
 def fol2vec_dd(azi, inc):
-    return -cosd(azi) * sind(inc), -sind(azi) * sind(inc), cosd(inc)
+    azi, inc = math.radians(azi), math.radians(inc)
+    si = math.sin(inc)
+    return -math.cos(azi) * si, -math.sin(azi) * si, math.cos(inc)
 
 
 def fol2vec_rhr(strike, dip):
     return fol2vec_dd(strike + 90, dip)
 
 
+# notation dispatch tables are created once, not on every call
+_GEO2VEC_PLANAR = {"dd": fol2vec_dd, "rhr": fol2vec_rhr}
+
+
 def geo2vec_planar(*args):
     """
     Function to transform geological measurement of plane to normal vector
@@ -22,14 +32,16 @@ def geo2vec_planar(*args):
         azi (float): dip direction or strike
         inc (float): dip
     """
-    return {"dd": fol2vec_dd, "rhr": fol2vec_rhr}[apsg_conf["notation"]](*args)
+    return _GEO2VEC_PLANAR[apsg_conf["notation"]](*args)
 
 
 ##############################
 
 
 def lin2vec_dd(azi, inc):
-    return cosd(azi) * cosd(inc), sind(azi) * cosd(inc), sind(inc)
+    azi, inc = math.radians(azi), math.radians(inc)
+    ci = math.cos(inc)
+    return math.cos(azi) * ci, math.sin(azi) * ci, math.sin(inc)
 
 
 def geo2vec_linear(*args):
@@ -70,10 +82,12 @@ def vec2fol_rhr_signed(v):
     return (atan2d(n.y, n.x) + 90) % 360, 90 - asind(n.z)
 
 
+_VEC2GEO_PLANAR_SIGNED = {"dd": vec2fol_dd_signed, "rhr": vec2fol_rhr_signed}
+_VEC2GEO_PLANAR = {"dd": vec2fol_dd, "rhr": vec2fol_rhr}
+
+
 def vec2geo_planar_signed(arg):
-    return {"dd": vec2fol_dd_signed, "rhr": vec2fol_rhr_signed}[apsg_conf["notation"]](
-        arg
-    )
+    return _VEC2GEO_PLANAR_SIGNED[apsg_conf["notation"]](arg)
 
 
 def vec2geo_planar(arg):
@@ -85,7 +99,7 @@ def vec2geo_planar(arg):
     Args:
         v (Vector3): ``Vector3`` like object
     """
-    return {"dd": vec2fol_dd, "rhr": vec2fol_rhr}[apsg_conf["notation"]](arg)
+    return _VEC2GEO_PLANAR[apsg_conf["notation"]](arg)
 
 
 ##############################
@@ -103,10 +117,11 @@ def vec2lin_dd_signed(v):
     return atan2d(n.y, n.x) % 360, asind(n.z)
 
 
+_VEC2GEO_LINEAR_SIGNED = {"dd": vec2lin_dd_signed, "rhr": vec2lin_dd_signed}
+
+
 def vec2geo_linear_signed(arg):
-    return {"dd": vec2lin_dd_signed, "rhr": vec2lin_dd_signed}[apsg_conf["notation"]](
-        arg
-    )
+    return _VEC2GEO_LINEAR_SIGNED[apsg_conf["notation"]](arg)
 
 
 def vec2geo_linear(arg):
@@ -117,3 +132,95 @@ def vec2geo_linear(arg):
         v (Vector3): ``Vector3`` like object
     """
     return vec2lin_dd(arg)
+
+
+##############################
+# Vectorized transformations of (n, 3) arrays
+
+_GEO2VEC_OFFSET = {"dd": 0, "rhr": 90}
+_VEC2GEO_OFFSET = {"dd": 180, "rhr": 90}
+
+
+def geo2vecs_linear(azi, inc):
+    """
+    Function to transform arrays of geological measurements of lines to
+    (n, 3) array of vectors
+
+    Args:
+        azi (array_like): plunge directions
+        inc (array_like): plunges
+    """
+    azi, inc = np.radians(azi, dtype=float), np.radians(inc, dtype=float)
+    ci = np.cos(inc)
+    return np.column_stack((np.cos(azi) * ci, np.sin(azi) * ci, np.sin(inc)))
+
+
+def geo2vecs_planar(azi, inc):
+    """
+    Function to transform arrays of geological measurements of planes to
+    (n, 3) array of normal vectors
+
+    Conversion is done according to `notation` configuration
+
+    Args:
+        azi (array_like): dip directions or strikes
+        inc (array_like): dips
+    """
+    offset = _GEO2VEC_OFFSET[apsg_conf["notation"]]
+    azi = np.radians(np.asarray(azi, dtype=float) + offset)
+    inc = np.radians(inc, dtype=float)
+    si = np.sin(inc)
+    return np.column_stack((-np.cos(azi) * si, -np.sin(azi) * si, np.cos(inc)))
+
+
+def _unit_rows(a, signed):
+    a = np.asarray(a, dtype=float).reshape(-1, 3)
+    d = np.linalg.norm(a, axis=1, keepdims=True)
+    n = a / np.where(d > 0, d, 1)
+    if not signed:
+        n = np.where(n[:, 2:] < 0, -n, n)
+    return n
+
+
+def vecs2geo_linear(a, signed=False):
+    """
+    Function to transform array of vectors to geological measurements of lines
+
+    Args:
+        a (array_like): (n, 3) array of vectors
+
+    Keyword Args:
+        signed (bool): if True, upward pointing vectors have negative plunge.
+            Default False
+
+    Returns:
+        tuple of arrays of plunge directions and plunges
+    """
+    n = _unit_rows(a, signed)
+    azi = np.degrees(np.arctan2(n[:, 1], n[:, 0])) % 360
+    inc = np.degrees(np.arcsin(np.clip(n[:, 2], -1, 1)))
+    return azi, inc
+
+
+def vecs2geo_planar(a, signed=False):
+    """
+    Function to transform array of normal vectors to geological measurements
+    of planes
+
+    Conversion is done according to `notation` configuration
+
+    Args:
+        a (array_like): (n, 3) array of normal vectors
+
+    Keyword Args:
+        signed (bool): if True, upward pointing normals are not flipped.
+            Default False
+
+    Returns:
+        tuple of arrays of dip directions (or strikes) and dips
+    """
+    n = _unit_rows(a, signed)
+    offset = _VEC2GEO_OFFSET[apsg_conf["notation"]]
+    azi = (np.degrees(np.arctan2(n[:, 1], n[:, 0])) + offset) % 360
+    inc = 90 - np.degrees(np.arcsin(np.clip(n[:, 2], -1, 1)))
+    return azi, inc
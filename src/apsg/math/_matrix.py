@@ -9,100 +9,182 @@ TO BE ADDED
 """
 
 
+def _readonly_eye(n):
+    eye = np.eye(n)
+    eye.flags.writeable = False
+    return eye
+
+
+# shared read-only identity buffers for default constructed matrices
+_IDENTITY = {2: _readonly_eye(2), 3: _readonly_eye(3)}
+
+
+def _is_int(obj):
+    if isinstance(obj, Matrix):
+        return obj._int_repr
+    return np.asarray(obj).dtype.kind in "iub"
+
+
 class Matrix:
     """Base class for Matrix2 and Matrix3"""
 
     __slots__ = "_coefs"
 
-    def __init__(self):
+    _int_repr = False
+
+    def __init__(self, *args):
         self._cache = {}
+        if len(args) == 0:
+            self._coefs = _IDENTITY[self.__shape__[0]]
+            self._int_repr = True
+        elif len(args) == 1:
+            try:
+                arr = np.asarray(args[0])
+                coefs = arr.astype(float)
+            except (TypeError, ValueError):
+                coefs = None
+            if coefs is None or coefs.shape != self.__shape__:
+                raise TypeError(f"Not valid arguments for {type(self).__name__}")
+            self._set_coefs(coefs)
+            # integer input is shown as integers when not converted to floats
+            self._int_repr = self._keep_int and (
+                arr.dtype.kind in "iub" or getattr(args[0], "_int_repr", False)
+            )
+        else:
+            raise TypeError(f"Not valid arguments for {type(self).__name__}")
+
+    def _set_coefs(self, coefs):
+        # coefficients are stored as read-only contiguous float64 buffer,
+        # adding zero turns negative zeros to positive ones
+        coefs = np.asarray(coefs, dtype=float) + 0.0
+        coefs.flags.writeable = False
+        self._coefs = coefs
+
+    @classmethod
+    def _from_array(cls, arr):
+        # fast constructor for results of internal array operations
+        obj = cls.__new__(cls)
+        obj._cache = {}
+        obj._set_coefs(arr)
+        return obj
+
+    def _derived(self, arr, *operands):
+        # integer matrices keep integer display under operations which keep
+        # integer dtype for integer operands
+        obj = self._from_array(arr)
+        if self._int_repr and self._keep_int:
+            obj._int_repr = all(_is_int(o) for o in operands)
+        return obj
 
     def __copy__(self):
-        return type(self)(self._coefs)
+        return self._derived(self._coefs)
 
     copy = __copy__
 
     @property
     def flat_coefs(self):
-        return tuple(c for row in self._coefs for c in row)
+        return tuple(self._coefs.ravel().tolist())
 
     def __repr__(self):
-        n = apsg_conf["ndigits"]
-        m = [[round(e, n) for e in row] for row in self._coefs]
-        return f"{type(self).__name__}\n{str(np.array(m))}"
+        m = np.round(self._coefs, apsg_conf["ndigits"])
+        if self._int_repr:
+            m = m.astype(int)
+        return f"{type(self).__name__}\n{str(m)}"
 
     def label(self):
         return str(type(self).__name__)
 
     def __hash__(self):
-        return hash((type(self).__name__,) + self._coefs)
+        if "hash" not in self._cache:
+            self._cache["hash"] = hash((type(self), self._coefs.tobytes()))
+        return self._cache["hash"]
 
     def to_json(self):
-        return {"datatype": type(self).__name__, "args": (self._coefs,)}
+        return {"datatype": type(self).__name__, "args": (self._coefs.tolist(),)}
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
+        # writable copy is returned, the read-only buffer of coefficients is
+        # shared only when copy=False is requested explicitly
+        if copy is False and (dtype is None or np.dtype(dtype) == self._coefs.dtype):
+            return self._coefs
         return np.array(self._coefs, dtype=dtype)
 
     def __nonzero__(self):
-        return not np.allclose(self, np.zeros(self.__shape__))
+        return not np.allclose(self._coefs, 0)
 
     def __add__(self, other):
-        return type(self)(np.add(self, other))
+        return self._derived(np.add(self._coefs, other), other)
 
     __radd__ = __add__
 
     def __sub__(self, other):
-        return type(self)(np.subtract(self, other))
+        return self._derived(np.subtract(self._coefs, other), other)
 
     def __rsub__(self, other):
-        return type(self)(np.subtract(other, self))
+        return self._derived(np.subtract(other, self._coefs), other)
+
+    def __neg__(self):
+        return self._derived(-self._coefs)
 
     def __mul__(self, other):
-        return type(self)(np.multiply(self, other))
+        return self._derived(np.multiply(self._coefs, other), other)
 
     __rmul__ = __mul__
 
     def __div__(self, other):
-        return type(self)(np.divide(self, other))
+        return self._from_array(np.divide(self._coefs, other))
 
     def __rdiv__(self, other):
-        return type(self)(np.divide(other, self))
+        return self._from_array(np.divide(other, self._coefs))
 
     def __floordiv__(self, other):
-        return type(self)(np.floor_divide(self, other))
+        return self._derived(np.floor_divide(self._coefs, other), other)
 
     def __rfloordiv__(self, other):
-        return type(self)(np.floor_divide(other, self))
+        return self._derived(np.floor_divide(other, self._coefs), other)
 
     def __truediv__(self, other):
-        return type(self)(np.true_divide(self, other))
+        return self._from_array(np.true_divide(self._coefs, other))
 
     def __rtruediv__(self, other):
-        return type(self)(np.true_divide(other, self))
+        return self._from_array(np.true_divide(other, self._coefs))
 
     pos__ = __copy__
 
+    @property
+    def _rows(self):
+        # rows as tuples of floats are created only once
+        if "rows" not in self._cache:
+            self._cache["rows"] = tuple(tuple(row) for row in self._coefs.tolist())
+        return self._cache["rows"]
+
     def __getitem__(self, key):
         if isinstance(key, tuple):
-            return self._coefs[key[0]][key[1]]
+            try:
+                return self._coefs.item(key)
+            except TypeError:
+                # slices are delegated to numpy indexing
+                return self._coefs[key].copy()
         else:
-            return self._coefs[key]
+            return self._rows[key]
 
     def __iter__(self):
         # what we want to iterate?
-        return iter(self._coefs)
-
-    def __mul__(self, other):
-        return type(self)(np.multiply(self, other))
+        return iter(self._rows)
 
-    __rmul__ = __mul__
+    def __len__(self):
+        return self.__shape__[0]
 
     def __pow__(self, n):
-        return type(self)(np.linalg.matrix_power(self, n))
+        return self._derived(np.linalg.matrix_power(self._coefs, n), max(n, 0))
 
     @ensure_first_arg_same
     def __eq__(self, other):
-        return np.allclose(self, other)
+        a, b = self._coefs, other._coefs
+        # identical buffers are compared bytewise, otherwise np.allclose tolerance
+        if a.tobytes() == b.tobytes():
+            return True
+        return bool(np.all(np.abs(a - b) <= 1e-08 + 1e-05 * np.abs(b)))
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -110,30 +192,30 @@ class Matrix:
     @property
     def xx(self):
         """Return xx-element of the matrix"""
-        return self._coefs[0][0]
+        return self._coefs.item(0, 0)
 
     @property
     def xy(self):
         """Return xy-element of the matrix"""
-        return self._coefs[0][1]
+        return self._coefs.item(0, 1)
 
     @property
     def yx(self):
         """Return yx-element of the matrix"""
-        return self._coefs[1][0]
+        return self._coefs.item(1, 0)
 
     @property
     def yy(self):
         """Return yy-element of the matrix"""
-        return self._coefs[1][1]
+        return self._coefs.item(1, 1)
 
     @property
     def I(self):
-        return type(self)(np.linalg.inv(self))
+        return self._from_array(np.linalg.inv(self._coefs))
 
     @property
     def T(self):
-        return type(self)(np.array(self).T)
+        return self._derived(self._coefs.T)
 
     @ensure_first_arg_same
     def transform(self, other):
@@ -142,7 +224,7 @@ class Matrix:
 
         Using rotation matrix it returns ``A' = R * A * R . T``.
         """
-        return type(self)(other @ self @ other.T)
+        return self._derived(other @ self @ other.T, other)
 
     @property
     def _eigh(self):
@@ -211,16 +293,7 @@ class Matrix2(Matrix):
     """
 
     __shape__ = (2, 2)
-
-    def __init__(self, *args):
-        super().__init__()
-        if len(args) == 0:
-            coefs = ((1, 0), (0, 1))
-        elif len(args) == 1 and np.asarray(args[0]).shape == Matrix2.__shape__:
-            coefs = [[float(v) for v in row] for row in args[0]]
-        else:
-            raise TypeError("Not valid arguments for Matrix2")
-        self._coefs = tuple(coefs[0]), tuple(coefs[1])
+    _keep_int = False
 
     @classmethod
     def from_comp(cls, xx=1, xy=0, yx=0, yy=1):
@@ -243,23 +316,33 @@ class Matrix2(Matrix):
 
         return cls([[xx, xy], [yx, yy]])
 
-    def __len__(self):
-        return 2
+    @property
+    def det(self):
+        """Determinant"""
+
+        (a, b), (c, d) = self._coefs.tolist()
+        return a * d - b * c
 
     def dot(self, other):
-        return Vector2(np.dot(np.array(self), other))
+        if isinstance(other, Vector2):
+            (a, b), (c, d) = self._rows
+            x, y = other._coords
+            return Vector2(a * x + b * y, c * x + d * y)
+        return Vector2(np.dot(self._coefs, other))
 
     def __matmul__(self, other):
-        r = np.dot(np.array(self), other)
-        if np.asarray(r).shape == Matrix2.__shape__:
-            return type(self)(r)
+        if isinstance(other, Vector2):
+            return self.dot(other)
+        r = np.dot(self._coefs, other)
+        if np.shape(r) == Matrix2.__shape__:
+            return self._from_array(r)
         else:
             return Vector2(r)
 
     def __rmatmul__(self, other):
-        r = np.dot(other, np.array(self))
-        if np.asarray(r).shape == Matrix2.__shape__:
-            return type(self)(r)
+        r = np.dot(other, self._coefs)
+        if np.shape(r) == Matrix2.__shape__:
+            return self._from_array(r)
         else:
             return Vector2(r)
 
@@ -298,16 +381,7 @@ class Matrix3(Matrix):
     """
 
     __shape__ = (3, 3)
-
-    def __init__(self, *args):
-        super().__init__()
-        if len(args) == 0:
-            coefs = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
-        elif len(args) == 1 and np.asarray(args[0]).shape == Matrix3.__shape__:
-            coefs = np.asarray(args[0]).tolist()
-        else:
-            raise TypeError("Not valid arguments for Matrix3")
-        self._coefs = tuple(coefs[0]), tuple(coefs[1]), tuple(coefs[2])
+    _keep_int = True
 
     @classmethod
     def from_comp(cls, xx=1, xy=0, xz=0, yx=0, yy=1, yz=0, zx=0, zy=0, zz=1):
@@ -336,50 +410,62 @@ class Matrix3(Matrix):
 
         return cls([[xx, xy, xz], [yx, yy, yz], [zx, zy, zz]])
 
-    def __len__(self):
-        return 3
+    @property
+    def det(self):
+        """Determinant"""
+
+        (a, b, c), (d, e, f), (g, h, i) = self._coefs.tolist()
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
 
     def dot(self, other):
-        return Vector3(np.dot(np.array(self), other))
+        if isinstance(other, Vector3):
+            (a, b, c), (d, e, f), (g, h, i) = self._rows
+            x, y, z = other._coords
+            return Vector3(
+                a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z
+            )
+        return Vector3(np.dot(self._coefs, other))
 
     def __matmul__(self, other):
-        r = np.dot(np.array(self), other)
-        if np.asarray(r).shape == Matrix3.__shape__:
-            return type(self)(r)
+        if isinstance(other, Vector3):
+            return self.dot(other)
+        r = np.dot(self._coefs, other)
+        if np.shape(r) == Matrix3.__shape__:
+            return self._derived(r, other)
         else:
             return Vector3(r)
 
     def __rmatmul__(self, other):
-        r = np.dot(other, np.array(self))
-        if np.asarray(r).shape == Matrix3.__shape__:
-            return type(self)(r)
+        r = np.dot(other, self._coefs)
+        if np.shape(r) == Matrix3.__shape__:
+            return self._derived(r, other)
         else:
             return Vector3(r)
 
     @property
     def xz(self):
         """Return xz-element of the matrix"""
-        return self._coefs[0][2]
+        return self._coefs.item(0, 2)
 
     @property
     def yz(self):
         """Return yz-element of the matrix"""
-        return self._coefs[1][2]
+        return self._coefs.item(1, 2)
 
     @property
     def zx(self):
         """Return zx-element of the matrix"""
-        return self._coefs[2][0]
+        return self._coefs.item(2, 0)
 
     @property
     def zy(self):
         """Return zy-element of the matrix"""
-        return self._coefs[2][1]
+        return self._coefs.item(2, 1)
 
     @property
     def zz(self):
         """Return zz-element of the matrix"""
-        return self._coefs[2][2]
+        return self._coefs.item(2, 2)
 
     @property
     def E3(self):
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 
 import numpy as np
 
@@ -11,6 +12,102 @@ from apsg.helpers._notation import (
 from apsg.decorator._decorator import ensure_first_arg_same
 
 
+def _rodrigues(v, axis, theta):
+    """Rotate vector(s) `v` around `axis` through angle(s) `theta` in degrees.
+
+    Both `v` (shape (3,) or (n, 3)) and `theta` (scalar or shape (n,)) are
+    broadcasted, so many rotations are evaluated in single pass.
+    """
+    k = np.asarray(axis, dtype=float)
+    k = k / np.linalg.norm(k)
+    theta = np.radians(np.asarray(theta, dtype=float))[..., None]
+    c, s = np.cos(theta), np.sin(theta)
+    return c * v + s * np.cross(k, v) + (1 - c) * np.dot(v, k)[..., None] * k
+
+
+@lru_cache(maxsize=None)
+def _rotate_fan_jit():
+    """Return numba compiled rotation fan kernel or None if numba is missing.
+
+    The kernel evaluates Rodrigues formula for all vectors and angles in single
+    fused loop, so no temporary arrays are created.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(v, axes, c, s):
+        n, m = v.shape[0], c.shape[0]
+        res = np.empty((n, m, 3))
+        for i in prange(n):
+            kx, ky, kz = axes[i, 0], axes[i, 1], axes[i, 2]
+            d = np.sqrt(kx * kx + ky * ky + kz * kz)
+            kx, ky, kz = kx / d, ky / d, kz / d
+            x, y, z = v[i, 0], v[i, 1], v[i, 2]
+            cx, cy, cz = ky * z - kz * y, kz * x - kx * z, kx * y - ky * x
+            kv = kx * x + ky * y + kz * z
+            for j in range(m):
+                t = (1 - c[j]) * kv
+                res[i, j, 0] = c[j] * x + s[j] * cx + t * kx
+                res[i, j, 1] = c[j] * y + s[j] * cy + t * ky
+                res[i, j, 2] = c[j] * z + s[j] * cz + t * kz
+        return res
+
+    return kernel
+
+
+def _rotate_fan(v, axes, c, s):
+    """Rotate each row of (n, 3) array `v` around corresponding row of `axes`
+    through angles given by cosines `c` and sines `s`. Returns (n, m, 3) array.
+
+    Angles of shape (m,) are used for all rows, angles of shape (n, m) are
+    given for each row. For large number of rotations of all rows numba kernel
+    is used when available.
+    """
+    if np.ndim(c) == 1 and len(v) * len(c) > 100_000:
+        kernel = _rotate_fan_jit()
+        if kernel is not None:
+            return kernel(v, axes, c, s)
+    k = axes / np.linalg.norm(axes, axis=1, keepdims=True)
+    c, s = np.asarray(c)[..., None], np.asarray(s)[..., None]
+    kv = np.einsum("ij,ij->i", k, v)[:, None, None]
+    return (
+        c * v[:, None, :]
+        + s * np.cross(k, v)[:, None, :]
+        + (1 - c) * kv * k[:, None, :]
+    )
+
+
+def _rodrigues_rows(v, axes, theta):
+    """Rotate each row of (n, 3) array `v` around corresponding row of `axes`
+    through single angle (or angle of each row) `theta` in degrees."""
+    theta = np.radians(np.broadcast_to(theta, (len(v),)).astype(float))[:, None]
+    return _rotate_fan(v, axes, np.cos(theta), np.sin(theta))[:, 0]
+
+
+def _slerp(a, b, t):
+    """Return (n, 3) array of spherical linear interpolations between vectors
+    `a` and `b` for all fractions `t`."""
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    cos = np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+    theta = np.arccos(np.clip(cos, -1, 1))
+    t = np.asarray(t, dtype=float)[:, None]
+    return (np.sin((1 - t) * theta) * a + np.sin(t * theta) * b) / np.sin(theta)
+
+
+def _allclose(a, b):
+    """Return True if coordinate tuples are equal within np.allclose tolerance."""
+    return all(x == y or abs(x - y) <= 1e-08 + 1e-05 * abs(y) for x, y in zip(a, b))
+
+
+def _axial_flip(u, v):
+    """Return coordinates of vector `v` flipped to the half-space of `u`."""
+    s = 1 - 2 * (sum(a * b for a, b in zip(u._coords, v._coords)) < 0)
+    return tuple(s * b for b in v._coords)
+
+
 class Vector:
     """
     Base class for Vector2 and Vector3
@@ -34,7 +131,7 @@ class Vector:
 
     @ensure_first_arg_same
     def __eq__(self, other):
-        return np.allclose(self, other)
+        return _allclose(self._coords, other._coords)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -48,18 +145,32 @@ class Vector:
     #    def __iter__(self):
     #        return iter(self._coords)
 
+    def _same_dim(self, other):
+        return isinstance(other, Vector) and len(other._coords) == len(self._coords)
+
     def __add__(self, other):
+        if self._same_dim(other):
+            return type(self)(*(a + b for a, b in zip(self._coords, other._coords)))
         return type(self)(np.add(self, other))
 
     __radd__ = __add__
 
     def __sub__(self, other):
+        if self._same_dim(other):
+            return type(self)(*(a - b for a, b in zip(self._coords, other._coords)))
         return type(self)(np.subtract(self, other))
 
     def __rsub__(self, other):
+        if self._same_dim(other):
+            return type(self)(*(b - a for a, b in zip(self._coords, other._coords)))
         return type(self)(np.subtract(other, self))
 
+    def __neg__(self):
+        return type(self)(*(-c for c in self._coords))
+
     def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return type(self)(*(other * c for c in self._coords))
         return type(self)(np.multiply(self, other))
 
     __rmul__ = __mul__
@@ -77,6 +188,8 @@ class Vector:
         return type(self)(np.floor_divide(other, self))
 
     def __truediv__(self, other):
+        if isinstance(other, (int, float)) and other:
+            return type(self)(*(c / other for c in self._coords))
         return type(self)(np.true_divide(self, other))
 
     def __rtruediv__(self, other):
@@ -172,8 +285,10 @@ class Vector2(Vector):
         if len(args) == 0:
             coords = (1, 0)
         if len(args) == 1:
-            if np.asarray(args[0]).shape == Vector2.__shape__:
-                coords = tuple(c.item() for c in np.asarray(args[0]))
+            if isinstance(args[0], Vector) and len(args[0]._coords) == 2:
+                coords = args[0]._coords
+            elif np.shape(args[0]) == Vector2.__shape__:
+                coords = np.asarray(args[0]).tolist()
             elif isinstance(args[0], str):
                 if args[0].lower() == "x":
                     coords = (1, 0)
@@ -196,14 +311,11 @@ class Vector2(Vector):
     def __len__(self):
         return 3
 
-    def __neg__(self):
-        return type(self)(-self.x, -self.y)
-
     def normalized(self):
         """Returns normalized (unit length) vector"""
         d = self.magnitude()
         if d:
-            return type(self)(self.x / d, self.y / d)
+            return type(self)(*(c / d for c in self._coords))
         return self.copy()
 
     uv = normalized
@@ -314,26 +426,28 @@ class Axial2(Vector2):  # Do we need it?
 
     @ensure_first_arg_same
     def __eq__(self, other):
-        return np.allclose(self, other) or np.allclose(self, -other)
+        return _allclose(self._coords, other._coords) or _allclose(
+            self._coords, tuple(-c for c in other._coords)
+        )
 
     def __add__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(x + y for x, y in zip(self._coords, b)))
         return type(self)(np.add(self, other))
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(x - y for x, y in zip(self._coords, b)))
         return type(self)(np.subtract(self, other))
 
     def __rsub__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(y - x for x, y in zip(self._coords, b)))
         return type(self)(np.subtract(other, self))
 
     def dot(self, other):
@@ -374,8 +488,10 @@ class Vector3(Vector):
         if len(args) == 0:
             coords = (1, 0, 0)
         elif len(args) == 1:
-            if np.asarray(args[0]).shape == Vector3.__shape__:
-                coords = tuple(c.item() for c in np.asarray(args[0]))
+            if isinstance(args[0], Vector) and len(args[0]._coords) == 3:
+                coords = args[0]._coords
+            elif np.shape(args[0]) == Vector3.__shape__:
+                coords = np.asarray(args[0]).tolist()
             elif isinstance(args[0], str):
                 if args[0].lower() == "x":
                     coords = (1, 0, 0)
@@ -411,9 +527,6 @@ class Vector3(Vector):
     def __len__(self):
         return 3
 
-    def __neg__(self):
-        return type(self)(-self.x, -self.y, -self.z)
-
     def __abs__(self):
         return math.sqrt(self.x**2 + self.y**2 + self.z**2)
 
@@ -421,7 +534,7 @@ class Vector3(Vector):
         """Returns normalized (unit length) vector"""
         d = self.magnitude()
         if d:
-            return type(self)(self.x / d, self.y / d, self.z / d)
+            return type(self)(*(c / d for c in self._coords))
         return self.copy()
 
     uv = normalized
@@ -460,11 +573,9 @@ class Vector3(Vector):
         Args:
             other (Vector3): other vector
         """
-        return type(self)(
-            self.y * other.z - self.z * other.y,
-            -self.x * other.z + self.z * other.x,
-            self.x * other.y - self.y * other.x,
-        )
+        ax, ay, az = self._coords
+        bx, by, bz = other._coords
+        return type(self)(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
 
     def lower(self):
         """Change vector direction to point towards positive Z direction"""
@@ -511,14 +622,29 @@ class Vector3(Vector):
         """Return the vector rotated around axis through angle theta. Right-hand rule
         applies
         """
-        v = Vector3(self)  # ensure vector
-        k = Vector3(axis.uv())
+        x, y, z = self._coords
+        kx, ky, kz = axis.uv()._coords
+        c, s = cosd(theta), sind(theta)
+        d = (1 - c) * (kx * x + ky * y + kz * z)
         return type(self)(
-            cosd(theta) * v
-            + sind(theta) * k.cross(v)
-            + (1 - cosd(theta)) * k * (k.dot(v))
+            c * x + s * (ky * z - kz * y) + d * kx,
+            c * y + s * (kz * x - kx * z) + d * ky,
+            c * z + s * (kx * y - ky * x) + d * kz,
         )
 
+    def rotate_batch(self, axis, thetas):
+        """Return array of vectors rotated around axis through all angles thetas.
+        Right-hand rule applies
+
+        Args:
+            axis (Vector3): axis of rotation
+            thetas (array_like): angles of rotation in degrees
+
+        Returns:
+            numpy.ndarray of shape (len(thetas), 3)
+        """
+        return _rodrigues(np.asarray(self, dtype=float), axis, np.atleast_1d(thetas))
+
     @ensure_first_arg_same
     def angle(self, other):
         """Return the angle to the vector other"""
@@ -561,26 +687,28 @@ class Axial3(Vector3):
 
     @ensure_first_arg_same
     def __eq__(self, other):
-        return np.allclose(self, other) or np.allclose(self, -other)
+        return _allclose(self._coords, other._coords) or _allclose(
+            self._coords, tuple(-c for c in other._coords)
+        )
 
     def __add__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(x + y for x, y in zip(self._coords, b)))
         return type(self)(np.add(self, other))
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(x - y for x, y in zip(self._coords, b)))
         return type(self)(np.subtract(self, other))
 
     def __rsub__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
-                other = -other
+            b = _axial_flip(self, other)
+            return type(self)(*(y - x for x, y in zip(self._coords, b)))
         return type(self)(np.subtract(other, self))
 
     def dot(self, other):
@@ -1,10 +1,7 @@
-import pickle
-
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
 
 from apsg.config import apsg_conf
+from apsg.helpers._helper import save_json, load_json
 from apsg.plotting._plot_artists import FabricPlotArtistFactory
 from apsg.feature import feature_from_json
 
@@ -45,27 +42,26 @@ class FabricPlot(object):
 
     def save(self, filename):
         """
-        Save fabric plot to pickle file
+        Save fabric plot to JSON file
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "wb") as f:
-            pickle.dump(self.to_json(), f, pickle.HIGHEST_PROTOCOL)
+        save_json(self.to_json(), filename)
 
     @classmethod
     def load(cls, filename):
         """
-        Load fabric plot from pickle file
+        Load fabric plot from JSON file (or pickle file saved by older versions)
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "rb") as f:
-            data = pickle.load(f)
-        return cls.from_json(data)
+        return cls.from_json(load_json(filename))
 
     def init_figure(self):
+        import matplotlib.pyplot as plt
+
         self.fig = plt.figure(
             0,
             figsize=apsg_conf["figsize"],
@@ -107,6 +103,8 @@ class FabricPlot(object):
 
     def show(self):
         """Show deformation plot"""
+        import matplotlib.pyplot as plt
+
         plt.close(0)  # close previously rendered figure
         self.init_figure()
         self._render()
@@ -120,12 +118,21 @@ class FabricPlot(object):
             filename (str): filename
 
         All others kwargs are passed to matplotlib `Figure.savefig`
+
+        Figure is rendered by Agg canvas independently on pyplot backend,
+        so no GUI window is created. Use `show` for interactive backend.
         """
-        plt.close(0)  # close previously rendered figure
-        self.init_figure()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig = Figure(
+            figsize=apsg_conf["figsize"],
+            dpi=apsg_conf["dpi"],
+            facecolor=apsg_conf["facecolor"],
+        )
+        FigureCanvasAgg(self.fig)
         self._render()
         self.fig.savefig(filename, **kwargs)
-        plt.close(0)
 
 
 class VollmerPlot(FabricPlot):
@@ -162,6 +169,8 @@ class VollmerPlot(FabricPlot):
         super().__init__(**kwargs)
 
     def _draw_layout(self):
+        from matplotlib.patches import Polygon
+
         self.ax = self.fig.add_subplot(111)
         self.ax.format_coord = self.format_coord
         self.ax.set_aspect("equal")
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from apsg.config import apsg_conf
 from apsg.plotting._stereonet import StereoNet
 
 
 def zijderveld_plot(core, kind="geo"):
+    import matplotlib.pyplot as plt
+
     def onpick(core, event, fig):
         fig.suptitle("{}".format(core.steps[event.ind[0]]))
         fig.canvas.draw()
@@ -44,6 +45,8 @@ def zijderveld_plot(core, kind="geo"):
 
 
 def demag_plot(core):
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=apsg_conf["figsize"])
     ax.plot(core.nsteps[0], core.MAG[0] / core.MAG.max(), "k+", markersize=14)
     ax.plot(core.nsteps, core.MAG / core.MAG.max(), "ko-")
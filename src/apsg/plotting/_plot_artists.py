@@ -17,6 +17,13 @@ from apsg.feature._container import (
 # StereoNet
 
 
+def _stack_xyz(args):
+    # features of point-like artists are stacked once, when artist is created
+    xyz = np.vstack([np.asarray(arg, dtype=float) for arg in args])
+    xyz.flags.writeable = False
+    return xyz
+
+
 class StereoNet_Artists:
     def __init__(self, factory, *args, **kwargs):
         self.factory = factory
@@ -39,6 +46,7 @@ class StereoNet_Point(StereoNet_Artists):
         super().__init__(factory, *args, **kwargs)
         self.stereonet_method = "_line"
         self.args = args
+        self.xyz = _stack_xyz(args)
         self.parse_kwargs(kwargs)
 
     def parse_kwargs(self, kwargs):
@@ -56,6 +64,7 @@ class StereoNet_Pole(StereoNet_Artists):
         super().__init__(factory, *args, **kwargs)
         self.stereonet_method = "_line"
         self.args = args
+        self.xyz = _stack_xyz(args)
         self.parse_kwargs(kwargs)
 
     def parse_kwargs(self, kwargs):
@@ -73,6 +82,7 @@ class StereoNet_Vector(StereoNet_Artists):
         super().__init__(factory, *args, **kwargs)
         self.stereonet_method = "_vector"
         self.args = args
+        self.xyz = _stack_xyz(args)
         self.parse_kwargs(kwargs)
 
     def parse_kwargs(self, kwargs):
@@ -90,6 +100,7 @@ class StereoNet_Scatter(StereoNet_Artists):
         super().__init__(factory, *args, **kwargs)
         self.stereonet_method = "_scatter"
         self.args = args
+        self.xyz = _stack_xyz(args)
         self.parse_kwargs(kwargs)
 
     def parse_kwargs(self, kwargs):
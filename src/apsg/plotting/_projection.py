@@ -1,11 +1,52 @@
+from functools import lru_cache
+
 import numpy as np
 
-from apsg.helpers._math import sqrt2
 from apsg.math._vector import Vector3
 from apsg.feature._geodata import Lineation, Foliation, Pair
 from apsg.feature._tensor3 import DeformationGradient3
 
 
+class _OverlaySpec:
+    """Projection wrapped with hashable key of settings defining grid overlay"""
+
+    __slots__ = ("proj", "key")
+
+    def __init__(self, proj):
+        self.proj = proj
+        self.key = (
+            type(proj),
+            proj.R.tobytes(),
+            proj.clip_pole,
+            proj.overlay_step,
+            proj.overlay_resolution,
+            proj.overlay_cross_size,
+        )
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+@lru_cache(maxsize=32)
+def _shared_overlay(spec):
+    """Return read-only grid overlay shared by projections with same settings.
+
+    Grid overlays are data independent, so only recently used ones are kept.
+    """
+    ov = spec.proj._grid_overlay()
+    for d in ov.values():
+        for v in d.values():
+            if isinstance(v, dict):
+                v["x"].flags.writeable = False
+                v["y"].flags.writeable = False
+            else:
+                v.flags.writeable = False
+    return ov
+
+
 class Projection:
     def __init__(self, **kwargs):
         self.rotate_data = kwargs.get("rotate_data", False)
@@ -38,19 +79,43 @@ class Projection:
                 Y[outside] = np.nan
             return X, Y
 
+    def project_data_both(self, x, y, z, clip_inside=True):
+        # data and its antipodes are projected at once. Returned arrays hold
+        # projections of data followed by projections of antipodes
+        return self.project_data(*_with_antipodes(x, y, z), clip_inside=clip_inside)
+
+    def project_data_hemispheres(self, x, y, z):
+        # every vector is projected only once, either itself or its antipode
+        # whichever lies in displayed hemisphere. Horizontal vectors lie on
+        # primitive, so both ends are projected. Returned idx holds indexes of
+        # data for projected points
+        if self.rotate_data:
+            x, y, z = self.R.dot((x, y, z))
+        x, y, z = np.atleast_1d(x, y, z)
+        n = np.size(z)
+        idx = np.concatenate((np.arange(n), np.flatnonzero(np.isclose(z, 0))))
+        x, y, z = x[idx], y[idx], z[idx]
+        if self.hemisphere == "upper":
+            sign = np.where(z > 0, -1, 1)
+            sign[n:] *= -1
+            X, Y = self._project(-sign * x, -sign * y, -sign * z)
+            return -X, -Y, idx
+        else:
+            sign = np.where(z < 0, -1, 1)
+            sign[n:] *= -1
+            X, Y = self._project(sign * x, sign * y, sign * z)
+            return X, Y, idx
+
     def project_data_antipodal(self, x, y, z, clip_inside=True):
         if self.rotate_data:
             x, y, z = self.R.dot((x, y, z))
-        X1, Y1 = self._project(x, y, z)
-        X2, Y2 = self._project(-x, -y, -z)
+        n = np.size(x)
+        X, Y = self._project(*_with_antipodes(x, y, z))
         if clip_inside:
-            outside1 = X1 * X1 + Y1 * Y1 > 1.0
-            outside2 = X2 * X2 + Y2 * Y2 > 1.0
-            X1[outside1] = np.nan
-            Y1[outside1] = np.nan
-            X2[outside2] = np.nan
-            Y2[outside2] = np.nan
-        return X1, Y1, -X2, -Y2
+            outside = X * X + Y * Y > 1.0
+            X[outside] = np.nan
+            Y[outside] = np.nan
+        return X[:n], Y[:n], -X[n:], -Y[n:]
 
     def inverse_data(self, X, Y):
         if X * X + Y * Y > 1.0:
@@ -69,6 +134,9 @@ class Projection:
         return X, Y
 
     def get_grid_overlay(self):
+        return _shared_overlay(_OverlaySpec(self))
+
+    def _grid_overlay(self):
         angles_gc = np.linspace(-90 + 1e-7, 90 - 1e-7, int(self.overlay_resolution / 2))
         angles_gc_clipped = np.linspace(
             -90 + self.clip_pole + 1e-7,
@@ -88,31 +156,19 @@ class Projection:
             f = Foliation(90, dip)
             if f.transform(self.R).angle(Foliation(0, 0)) > 0.1:
                 fdv = f.dipvec()
-                X, Y = self.project_overlay(
-                    *np.array(
-                        [np.asarray(fdv.rotate(f, a)) for a in angles_gc_clipped]
-                    ).T
-                )
+                X, Y = self.project_overlay(*fdv.rotate_batch(f, angles_gc_clipped).T)
                 lat_e[dip] = dict(x=X, y=Y)
                 X, Y = self.project_overlay(
-                    *np.array(
-                        [-np.asarray(fdv.rotate(f, a)) for a in angles_gc_clipped]
-                    ).T
+                    *(-fdv.rotate_batch(f, angles_gc_clipped)).T
                 )
                 lat_e[-dip] = dict(x=X, y=Y)
             f = Foliation(270, dip)
             if f.transform(self.R).angle(Foliation(0, 0)) > 0.1:
                 fdv = f.dipvec()
-                X, Y = self.project_overlay(
-                    *np.array(
-                        [np.asarray(fdv.rotate(f, a)) for a in angles_gc_clipped]
-                    ).T
-                )
+                X, Y = self.project_overlay(*fdv.rotate_batch(f, angles_gc_clipped).T)
                 lat_w[dip] = dict(x=X, y=Y)
                 X, Y = self.project_overlay(
-                    *np.array(
-                        [-np.asarray(fdv.rotate(f, a)) for a in angles_gc_clipped]
-                    ).T
+                    *(-fdv.rotate_batch(f, angles_gc_clipped)).T
                 )
                 lat_w[-dip] = dict(x=X, y=Y)
 
@@ -122,62 +178,35 @@ class Projection:
             if dip >= self.clip_pole:
                 lon = Vector3(0, dip)
                 X, Y = self.project_overlay(
-                    *np.array(
-                        [np.asarray(lon.rotate(Lineation(0, 0), a)) for a in angles_sc]
-                    ).T
+                    *lon.rotate_batch(Lineation(0, 0), angles_sc).T
                 )
                 lon_n[dip] = dict(x=X, y=Y)
                 lon = Vector3(180, dip)
                 X, Y = self.project_overlay(
-                    *np.array(
-                        [
-                            np.asarray(lon.rotate(Lineation(180, 0), a))
-                            for a in angles_sc
-                        ]
-                    ).T
+                    *lon.rotate_batch(Lineation(180, 0), angles_sc).T
                 )
                 lon_s[dip] = dict(x=X, y=Y)
 
         # pole holes rims
         if self.clip_pole > 0:
             lon = Vector3(0, self.clip_pole)
-            X, Y = self.project_overlay(
-                *np.array(
-                    [np.asarray(lon.rotate(Vector3(0, 0), a)) for a in angles_sc]
-                ).T
-            )
+            X, Y = self.project_overlay(*lon.rotate_batch(Vector3(0, 0), angles_sc).T)
             polehole_n = dict(x=X, y=Y)
             lon = Vector3(180, self.clip_pole)
-            X, Y = self.project_overlay(
-                *np.array(
-                    [np.asarray(lon.rotate(Vector3(180, 0), a)) for a in angles_sc]
-                ).T
-            )
+            X, Y = self.project_overlay(*lon.rotate_batch(Vector3(180, 0), angles_sc).T)
             polehole_s = dict(x=X, y=Y)
         else:
             polehole_n, polehole_s = {}, {}
 
         # Principal axis X
         X = Vector3(1, 0, 0)
-        X1, Y1 = self.project_overlay(
-            *np.array(
-                [np.asarray(X.rotate(Vector3(0, 1, 0), a)) for a in angles_cross]
-            ).T
-        )
-        X2, Y2 = self.project_overlay(
-            *np.array(
-                [np.asarray(X.rotate(Vector3(0, 0, 1), a)) for a in angles_cross]
-            ).T
-        )
+        X1, Y1 = self.project_overlay(*X.rotate_batch(Vector3(0, 1, 0), angles_cross).T)
+        X2, Y2 = self.project_overlay(*X.rotate_batch(Vector3(0, 0, 1), angles_cross).T)
         X3, Y3 = self.project_overlay(
-            *np.array(
-                [-np.asarray(X.rotate(Vector3(0, 1, 0), a)) for a in angles_cross]
-            ).T
+            *(-X.rotate_batch(Vector3(0, 1, 0), angles_cross)).T
         )
         X4, Y4 = self.project_overlay(
-            *np.array(
-                [-np.asarray(X.rotate(Vector3(0, 0, 1), a)) for a in angles_cross]
-            ).T
+            *(-X.rotate_batch(Vector3(0, 0, 1), angles_cross)).T
         )
         main_x = dict(
             x=np.hstack((X1, np.nan, X2, np.nan, X3, np.nan, X4)),
@@ -185,25 +214,13 @@ class Projection:
         )
         # Principal axis Y
         Y = Vector3(0, 1, 0).transform(self.R).lower().transform(self.Ri)
-        X1, Y1 = self.project_overlay(
-            *np.array(
-                [np.asarray(Y.rotate(Vector3(1, 0, 0), a)) for a in angles_cross]
-            ).T
-        )
-        X2, Y2 = self.project_overlay(
-            *np.array(
-                [np.asarray(Y.rotate(Vector3(0, 0, 1), a)) for a in angles_cross]
-            ).T
-        )
+        X1, Y1 = self.project_overlay(*Y.rotate_batch(Vector3(1, 0, 0), angles_cross).T)
+        X2, Y2 = self.project_overlay(*Y.rotate_batch(Vector3(0, 0, 1), angles_cross).T)
         X3, Y3 = self.project_overlay(
-            *np.array(
-                [-np.asarray(Y.rotate(Vector3(1, 0, 0), a)) for a in angles_cross]
-            ).T
+            *(-Y.rotate_batch(Vector3(1, 0, 0), angles_cross)).T
         )
         X4, Y4 = self.project_overlay(
-            *np.array(
-                [-np.asarray(Y.rotate(Vector3(0, 0, 1), a)) for a in angles_cross]
-            ).T
+            *(-Y.rotate_batch(Vector3(0, 0, 1), angles_cross)).T
         )
         main_y = dict(
             x=np.hstack((X1, np.nan, X2, np.nan, X3, np.nan, X4)),
@@ -211,25 +228,13 @@ class Projection:
         )
         # Principal axis Z
         Z = Vector3(0, 0, 1).transform(self.R).lower().transform(self.Ri)
-        X1, Y1 = self.project_overlay(
-            *np.array(
-                [np.asarray(Z.rotate(Vector3(1, 0, 0), a)) for a in angles_cross]
-            ).T
-        )
-        X2, Y2 = self.project_overlay(
-            *np.array(
-                [np.asarray(Z.rotate(Vector3(0, 1, 0), a)) for a in angles_cross]
-            ).T
-        )
+        X1, Y1 = self.project_overlay(*Z.rotate_batch(Vector3(1, 0, 0), angles_cross).T)
+        X2, Y2 = self.project_overlay(*Z.rotate_batch(Vector3(0, 1, 0), angles_cross).T)
         X3, Y3 = self.project_overlay(
-            *np.array(
-                [-np.asarray(Z.rotate(Vector3(1, 0, 0), a)) for a in angles_cross]
-            ).T
+            *(-Z.rotate_batch(Vector3(1, 0, 0), angles_cross)).T
         )
         X4, Y4 = self.project_overlay(
-            *np.array(
-                [-np.asarray(Z.rotate(Vector3(0, 1, 0), a)) for a in angles_cross]
-            ).T
+            *(-Z.rotate_batch(Vector3(0, 1, 0), angles_cross)).T
         )
         main_z = dict(
             x=np.hstack((X1, np.nan, X2, np.nan, X3, np.nan, X4)),
@@ -240,9 +245,7 @@ class Projection:
         f = Foliation(90, 90)
         if f.transform(self.R).angle(Foliation(0, 0)) > 0.1:
             fdv = f.transform(self.R).dipvec().transform(self.Ri)
-            X, Y = self.project_overlay(
-                *np.array([np.asarray(fdv.rotate(f, a)) for a in angles_gc]).T
-            )
+            X, Y = self.project_overlay(*fdv.rotate_batch(f, angles_gc).T)
             main_xz = dict(x=X, y=Y)
         else:
             main_xz = {}
@@ -250,9 +253,7 @@ class Projection:
         f = Foliation(0, 90)
         if f.transform(self.R).angle(Foliation(0, 0)) > 0.1:
             fdv = f.transform(self.R).dipvec().transform(self.Ri)
-            X, Y = self.project_overlay(
-                *np.array([np.asarray(fdv.rotate(f, a)) for a in angles_gc]).T
-            )
+            X, Y = self.project_overlay(*fdv.rotate_batch(f, angles_gc).T)
             main_yz = dict(x=X, y=Y)
         else:
             main_yz = {}
@@ -260,9 +261,7 @@ class Projection:
         f = Foliation(0, 0)
         if f.transform(self.R).angle(Foliation(0, 0)) > 0.1:
             fdv = f.transform(self.R).dipvec().transform(self.Ri)
-            X, Y = self.project_overlay(
-                *np.array([np.asarray(fdv.rotate(f, a)) for a in angles_gc]).T
-            )
+            X, Y = self.project_overlay(*fdv.rotate_batch(f, angles_gc).T)
             main_xy = dict(x=X, y=Y)
         else:
             main_xy = {}
@@ -299,11 +298,9 @@ class EqualAreaProj(Projection):
             return y * sqz, x * sqz
 
     def _inverse(self, X, Y):
-        X, Y = X * sqrt2, Y * sqrt2
-        x = np.sqrt(1 - (X * X + Y * Y) / 4.0) * Y
-        y = np.sqrt(1 - (X * X + Y * Y) / 4.0) * X
-        z = 1.0 - (X * X + Y * Y) / 2
-        return x, y, z
+        r2 = X * X + Y * Y
+        s = np.sqrt(np.clip(2 - r2, 0, None))
+        return s * Y, s * X, 1.0 - r2
 
 
 class EqualAngleProj(Projection):
@@ -316,11 +313,19 @@ class EqualAngleProj(Projection):
         if any(d == 0):
             return np.nan, np.nan
         else:
-            z[np.isclose(1 + z, np.zeros_like(z))] = 1e-7 - 1
+            z = np.where(np.isclose(1 + z, 0), 1e-7 - 1, z)
             return y / (1 + z), x / (1 + z)
 
     def _inverse(self, X, Y):
-        x = 2.0 * Y / (1.0 + X * X + Y * Y)
-        y = 2.0 * X / (1.0 + X * X + Y * Y)
-        z = (1.0 - X * X + Y * Y) / (1.0 + X * X + Y * Y)
-        return x, y, z
+        r2 = X * X + Y * Y
+        d = 1.0 / (1.0 + r2)
+        return 2.0 * Y * d, 2.0 * X * d, (1.0 - r2) * d
+
+
+def _with_antipodes(x, y, z):
+    # (3, 2n) buffer holding coordinates of data followed by antipodes
+    n = np.size(x)
+    xyz = np.empty((3, 2 * n))
+    xyz[0, :n], xyz[1, :n], xyz[2, :n] = x, y, z
+    np.negative(xyz[:, :n], out=xyz[:, n:])
+    return xyz
@@ -1,10 +1,11 @@
-import pickle
+from functools import lru_cache
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import vonmises, circmean
+from scipy.special import i0e
+from scipy.stats import circmean
 
 from apsg.config import apsg_conf
+from apsg.helpers._helper import save_json, load_json
 from apsg.plotting._plot_artists import RosePlotArtistFactory
 from apsg.feature import feature_from_json
 
@@ -76,27 +77,26 @@ class RosePlot(object):
 
     def save(self, filename):
         """
-        Save stereonet to pickle file
+        Save stereonet to JSON file
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "wb") as f:
-            pickle.dump(self.to_json(), f, pickle.HIGHEST_PROTOCOL)
+        save_json(self.to_json(), filename)
 
     @classmethod
     def load(cls, filename):
         """
-        Load stereonet from pickle file
+        Load stereonet from JSON file (or pickle file saved by older versions)
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "rb") as f:
-            data = pickle.load(f)
-        return cls.from_json(data)
+        return cls.from_json(load_json(filename))
 
     def init_figure(self):
+        import matplotlib.pyplot as plt
+
         self.fig = plt.figure(
             0,
             figsize=apsg_conf["figsize"],
@@ -139,6 +139,8 @@ class RosePlot(object):
 
     def show(self):
         """Show rose plot"""
+        import matplotlib.pyplot as plt
+
         plt.close(0)  # close previously rendered figure
         self.init_figure()
         self._render()
@@ -152,12 +154,21 @@ class RosePlot(object):
             filename (str): filename
 
         All others kwargs are passed to matplotlib `Figure.savefig`
+
+        Figure is rendered by Agg canvas independently on pyplot backend,
+        so no GUI window is created. Use `show` for interactive backend.
         """
-        plt.close(0)  # close previously rendered figure
-        self.init_figure()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig = Figure(
+            figsize=apsg_conf["figsize"],
+            dpi=apsg_conf["dpi"],
+            facecolor=apsg_conf["facecolor"],
+        )
+        FigureCanvasAgg(self.fig)
         self._render()
         self.fig.savefig(filename, **kwargs)
-        plt.close(0)
 
     ########################################
     # PLOTTING METHODS                     #
@@ -245,23 +256,15 @@ class RosePlot(object):
         bottom = np.zeros_like(self._kwargs["bins"])
         width = 2 * np.pi / self._kwargs["bins"]
         legend = kwargs.pop("legend")
+        bin_centre = np.arange(self._kwargs["bins"]) * width
         for arg in args:
-            if self._kwargs["axial"]:
-                ang = np.concatenate((arg.direction % 360, (arg.direction + 180) % 360))
-                weights = np.concatenate((abs(arg), abs(arg)))
-            else:
-                ang = arg.direction % 360
-                weights = abs(arg)
-            num, bin_edges = np.histogram(
-                np.radians(ang),
-                bins=self._kwargs["bins"] + 1,
-                range=(-width / 2, 2 * np.pi + width / 2),
-                weights=weights,
-                density=self._kwargs["density"],
+            num = _rose_histogram(
+                arg.direction,
+                abs(arg),
+                self._kwargs["bins"],
+                self._kwargs["axial"],
+                self._kwargs["density"],
             )
-            num[0] += num[-1]
-            num = num[:-1]
-            bin_centre = (bin_edges[1:-1] + bin_edges[:-2]) / 2
             if self._kwargs["scaled"]:
                 num = np.sqrt(num)
             if legend:
@@ -279,24 +282,9 @@ class RosePlot(object):
         for arg in args:
             ang = arg.direction % 360
             # weights = abs(arg)
-            radii = np.zeros_like(theta)
-            if self._kwargs["axial"]:
-                for a in ang:
-                    radii += (
-                        vonmises.pdf(theta, self._kwargs["kappa"], loc=np.radians(a))
-                        / 2
-                    )
-                    radii += (
-                        vonmises.pdf(
-                            theta, self._kwargs["kappa"], loc=np.radians(a + 180)
-                        )
-                        / 2
-                    )
-            else:
-                for a in ang:
-                    radii += vonmises.pdf(
-                        theta, self._kwargs["kappa"], loc=np.radians(a)
-                    )
+            radii = _vonmises_sum(
+                theta, ang, self._kwargs["kappa"], self._kwargs["axial"]
+            )
             radii /= len(ang)
             radii *= weight
             if self._kwargs["scaled"]:
@@ -314,36 +302,30 @@ class RosePlot(object):
         n_resamples = kwargs.pop("n_resamples")
         # calculate mean and CI
         if self._kwargs["axial"]:
-            mu = circmean(2 * ang) / 2
-            ang_shift = ang + np.pi / 2 - mu
-            bsmu = [
-                circmean(np.random.choice(2 * ang_shift, size=len(ang_shift)))
-                for i in range(n_resamples)
-            ]
+            # doubled angles are shifted in place, so mean is at pi
+            ang2 = 2 * ang
+            mu = circmean(ang2) / 2
+            ang2 += np.pi - 2 * mu
+            # all resamples are drawn at once and averaged along rows
+            bsmu = circmean(
+                np.random.choice(ang2, size=(n_resamples, len(ang2))), axis=1
+            )
             low = np.percentile(bsmu, 100 - conflevel) / 2 + mu - np.pi / 2
             high = np.percentile(bsmu, conflevel) / 2 + mu - np.pi / 2
         else:
             mu = circmean(ang)
             ang_shift = ang + np.pi - mu
-            bsmu = [
-                circmean(np.random.choice(ang_shift, size=len(ang_shift)))
-                for i in range(n_resamples)
-            ]
+            bsmu = circmean(
+                np.random.choice(ang_shift, size=(n_resamples, len(ang_shift))),
+                axis=1,
+            )
             low = np.percentile(bsmu, (100 - conflevel) / 2) + mu - np.pi
             high = np.percentile(bsmu, 100 - (100 - conflevel) / 2) + mu - np.pi
         radii = []
         for arg in args:
-            p = 0
-            if self._kwargs["axial"]:
-                for a in arg.direction:
-                    p += vonmises.pdf(mu, self._kwargs["kappa"], loc=np.radians(a)) / 2
-                    p += (
-                        vonmises.pdf(mu, self._kwargs["kappa"], loc=np.radians(a + 180))
-                        / 2
-                    )
-            else:
-                for a in arg.direction:
-                    p += vonmises.pdf(mu, self._kwargs["kappa"], loc=np.radians(a))
+            p = _vonmises_sum(
+                mu, arg.direction, self._kwargs["kappa"], self._kwargs["axial"]
+            )
             radii.append(p / len(arg))
         if self._kwargs["scaled"]:
             radii = np.sqrt(radii)
@@ -354,6 +336,69 @@ class RosePlot(object):
         self.ax.plot(ci_angles + np.pi, mur * np.ones_like(ci_angles), **kwargs)
 
 
+@lru_cache(maxsize=None)
+def _axial_histogram_jit():
+    """Return numba compiled axial histogram kernel or None if numba is missing."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def kernel(ang, weights, edges):
+        bins = edges.size - 2
+        num = np.zeros(bins)
+        for i in range(ang.size):
+            a = np.radians(ang[i] % 360)
+            num[(np.searchsorted(edges, a, side="right") - 1) % bins] += weights[i]
+            a = np.radians((ang[i] + 180) % 360)
+            num[(np.searchsorted(edges, a, side="right") - 1) % bins] += weights[i]
+        return num
+
+    return kernel
+
+
+def _rose_histogram(ang, weights, bins, axial, density):
+    """Return weighted histogram of directions `ang` (degrees) in `bins` sectors
+    centred on multiples of sector width. For axial data, both directions are
+    counted. For large axial data numba kernel is used when available."""
+    width = 2 * np.pi / bins
+    # explicit sector edges as used by np.histogram, so directions lying on
+    # sector boundary are assigned consistently. Last sector wraps to first.
+    edges = np.linspace(-width / 2, 2 * np.pi + width / 2, bins + 2)
+    kernel = _axial_histogram_jit() if axial and len(ang) > 100_000 else None
+    if kernel is not None:
+        num = kernel(
+            np.asarray(ang, dtype=float), np.asarray(weights, dtype=float), edges
+        )
+    else:
+        idx = np.searchsorted(edges, np.radians(ang % 360), side="right") - 1
+        num = np.bincount(idx % bins, weights=weights, minlength=bins)
+        if axial:
+            idx = np.searchsorted(edges, np.radians((ang + 180) % 360), side="right")
+            num += np.bincount((idx - 1) % bins, weights=weights, minlength=bins)
+    if density:
+        num = num / (num.sum() * width)
+    return num
+
+
+def _vonmises_sum(x, ang, kappa, axial):
+    """Return sum of von Mises densities centred on directions `ang` (degrees)
+    evaluated at angles `x` (radians). All directions are evaluated in single
+    broadcasted call, antipodal directions are added with half weight for axial
+    data."""
+    x = np.asarray(x)
+    # closed form of density with exponentially scaled normalization, which
+    # does not overflow for large kappa. Antipodes have negated cosines.
+    cos = np.cos(x.ravel() - np.radians(ang)[:, None])
+    res = np.exp(kappa * (cos - 1)).sum(axis=0)
+    if axial:
+        res += np.exp(-kappa * (cos + 1)).sum(axis=0)
+        res /= 2
+    res /= 2 * np.pi * i0e(kappa)
+    return res.reshape(x.shape)
+
+
 def roseartist_from_json(obj_json):
     args = tuple([feature_from_json(arg_json) for arg_json in obj_json["args"]])
     return getattr(RosePlotArtistFactory, obj_json["factory"])(
@@ -1,7 +1,8 @@
+import math
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.tri as tri
-from matplotlib.patches import Circle
-import matplotlib.pyplot as plt
+from scipy.spatial import cKDTree
 
 from apsg.config import apsg_conf
 from apsg.feature._geodata import Lineation
@@ -9,6 +10,90 @@ from apsg.feature._container import Vector3Set
 from apsg.plotting._projection import EqualAreaProj, EqualAngleProj
 
 
+@lru_cache(maxsize=None)
+def _exp_kamb_jit():
+    """Return numba compiled exponential Kamb kernel or None if numba is missing.
+
+    The kernel fuses dot product, exponential and summation into single pass,
+    so the full matrix of cosines is never created.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(grid, features, k):
+        res = np.zeros(grid.shape[0])
+        for g in prange(grid.shape[0]):
+            s = 0.0
+            for i in range(features.shape[0]):
+                d = (
+                    grid[g, 0] * features[i, 0]
+                    + grid[g, 1] * features[i, 1]
+                    + grid[g, 2] * features[i, 2]
+                )
+                s += math.exp(k * (abs(d) - 1.0))
+            res[g] = s
+        return res
+
+    return kernel
+
+
+@lru_cache(maxsize=16)
+def _counting_grid(grid_type, n):
+    """Return counting grid of given type and size.
+
+    Grid does not depend on data, so it is created only once and shared.
+    """
+    if grid_type == "gss":
+        return Vector3Set.uniform_gss(n=n)
+    else:
+        return Vector3Set.uniform_sfs(n=n)
+
+
+def _exp_kamb(grid, features, k):
+    """Sum of exponential Kamb weights of features on every grid point.
+
+    Large evaluations with high k and unit features use kd-tree pruning, other
+    large evaluations use numba kernel when available. Otherwise cosines are
+    computed with single matrix product and the exponential kernel is evaluated
+    in place to avoid temporary arrays.
+    """
+    large = grid.shape[0] * features.shape[0] > 10_000_000
+    if large and k > 150:
+        norms = np.linalg.norm(features, axis=1)
+        if np.allclose(norms, 1):
+            return _exp_kamb_pruned(grid, features, k)
+    kernel = _exp_kamb_jit() if large else None
+    if kernel is not None:
+        return kernel(grid, features, float(k))
+    cnt = np.dot(grid, features.T)
+    np.abs(cnt, out=cnt)
+    cnt -= 1
+    cnt *= k
+    np.exp(cnt, out=cnt)
+    return cnt.sum(axis=1)
+
+
+def _exp_kamb_pruned(grid, features, k):
+    """Sum of exponential Kamb weights using only features close to grid points.
+
+    The weight exp(k * (cos - 1)) of unit vectors is exp(-k * c**2 / 2), where c
+    is chord distance, so features farther than c = sqrt(30 / k) contribute
+    less than exp(-15) and are skipped. Features are mirrored to handle axial
+    data, so only the closer of f and -f is found within the cutoff. It pays
+    off only for high k, when the cutoff cap is small.
+    """
+    both = np.vstack((features, -features))
+    pairs = cKDTree(grid).sparse_distance_matrix(
+        cKDTree(both), np.sqrt(30.0 / k), output_type="ndarray"
+    )
+    return np.bincount(
+        pairs["i"], weights=np.exp(-0.5 * k * pairs["v"] ** 2), minlength=len(grid)
+    )
+
+
 class StereoGrid:
     """
     The class to store values with associated uniformly positions.
@@ -37,16 +122,18 @@ class StereoGrid:
     Note: Euclidean norms are used as weights. Normalize data if you dont want to use
     weigths.
 
+    Note: For more than 10M grid-feature pairs and k > 150 unit features farther
+    than sqrt(30 / k) chord distance from a grid point are skipped in density
+    calculation. Each skipped weight is below exp(-15), so the absolute error of
+    the sum is below n * exp(-15) (about 3e-7 * n) for n features.
+
     """
 
     def __init__(self, **kwargs):
         # parse options
         self.grid_n = kwargs.get("grid_n", 2000)
         # grid type
-        if kwargs.get("grid_type", "gss") == "gss":
-            self.grid = Vector3Set.uniform_gss(n=self.grid_n)
-        else:
-            self.grid = Vector3Set.uniform_sfs(n=self.grid_n)
+        self.grid = _counting_grid(kwargs.get("grid_type", "gss"), self.grid_n)
         # projection
         kind = str(kwargs.get("kind", "equal-area")).lower()
         if kind in ["equal-area", "schmidt", "earea"]:
@@ -60,6 +147,7 @@ class StereoGrid:
         self.calculated = False
         self.density_params = None
         self.features = None
+        self._triangulation = None
 
     def __repr__(self):
         if self.calculated:
@@ -87,6 +175,25 @@ class StereoGrid:
         """Returns position of maximum value of the grid as ``Lineation``"""
         return Lineation(self.grid[self.values.argmax()])
 
+    def triangulation(self):
+        """Returns matplotlib ``Triangulation`` of projected grid points.
+
+        Triangulation depends only on grid and projection, so it is created
+        once and reused for all contour plots.
+        """
+        key = (
+            id(self.grid),
+            self.proj.hemisphere,
+            self.proj.rotate_data,
+            self.proj.R.tobytes(),
+        )
+        if self._triangulation is None or self._triangulation[0] != key:
+            import matplotlib.tri as tri
+
+            X, Y = self.proj.project_data(*np.asarray(self.grid).T, clip_inside=False)
+            self._triangulation = (key, tri.Triangulation(X, Y))
+        return self._triangulation[1]
+
     def calculate_density(self, features, **kwargs):
         """Calculate density distribution of vectors from ``FeatureSet`` object.
 
@@ -102,7 +209,7 @@ class StereoGrid:
         """
         # parse options
         sigma = kwargs.get("sigma", None)
-        self.features = np.atleast_2d(features)
+        self.features = np.ascontiguousarray(np.atleast_2d(features), dtype=float)
         n = len(self.features)
         if sigma is None:
             # k = estimate_k(features)
@@ -118,8 +225,8 @@ class StereoGrid:
         sigmanorm = kwargs.get("sigmanorm", True)
         # do calc
         scale = np.sqrt(n * (k / 2.0 - 1) / k**2)
-        cnt = np.exp(k * (np.abs(np.dot(self.grid, self.features.T)) - 1))
-        self.values = cnt.sum(axis=1) / scale
+        grid = np.ascontiguousarray(self.grid, dtype=float)
+        self.values = _exp_kamb(grid, self.features, k) / scale
         if sigmanorm:
             self.values /= sigma
         self.values[self.values < 0] = 0
@@ -179,6 +286,9 @@ class StereoGrid:
             alpha (float): transparency. Default None
             antialiased (bool): Default True
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Circle
+
         colorbar = kwargs.get("colorbar", False)
         parsed = {}
         parsed["alpha"] = kwargs.get("alpha", 1)
@@ -227,6 +337,9 @@ class StereoGrid:
             linewidths (float): contour lines width
             linestyles (str): contour lines style
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Circle
+
         colorbar = kwargs.get("colorbar", False)
         parsed = {}
         parsed["alpha"] = kwargs.get("alpha", 1)
@@ -264,6 +377,9 @@ class StereoGrid:
 
     def plotcountgrid(self, **kwargs):
         """Show counting grid."""
+        import matplotlib.pyplot as plt
+        import matplotlib.tri as tri
+        from matplotlib.patches import Circle
 
         proj = EqualAreaProj(**kwargs)
 
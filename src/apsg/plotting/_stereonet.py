@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
 
-import pickle
+from functools import lru_cache
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
 
 from apsg.config import apsg_conf
-from apsg.math._vector import Vector3
+from apsg.helpers._helper import save_json, load_json
+from apsg.math._vector import Vector3, _slerp, _rotate_fan
 from apsg.feature._geodata import Lineation, Foliation, Pair, Fault, Cone
 from apsg.feature._container import (
     Vector3Set,
@@ -70,6 +69,9 @@ class StereoNet:
         self.angles_sc = np.linspace(
             -180 + 1e-7, 180 - 1e-7, self.proj.overlay_resolution
         )
+        self._trig_gc = _angles_trig(
+            -90 + 1e-7, 90 - 1e-7, int(self.proj.overlay_resolution / 2)
+        )
 
         self.clear()
 
@@ -78,57 +80,54 @@ class StereoNet:
         self._artists = []
 
     def _draw_layout(self):
+        from matplotlib.collections import LineCollection
+        from matplotlib.patches import Circle
+
         # overlay
         if self._kwargs["overlay"]:
             ov = self.proj.get_grid_overlay()
-            for dip, d in ov["lat_e"].items():
-                self.ax.plot(d["x"], d["y"], "k:", lw=1)
-            for dip, d in ov["lat_w"].items():
-                self.ax.plot(d["x"], d["y"], "k:", lw=1)
-            for dip, d in ov["lon_n"].items():
-                self.ax.plot(d["x"], d["y"], "k:", lw=1)
-            for dip, d in ov["lon_s"].items():
-                self.ax.plot(d["x"], d["y"], "k:", lw=1)
-            if ov["main_xz"]:
-                self.ax.plot(ov["main_xz"]["x"], ov["main_xz"]["y"], "k:", lw=1)
-            if ov["main_yz"]:
-                self.ax.plot(ov["main_yz"]["x"], ov["main_yz"]["y"], "k:", lw=1)
-            if ov["main_xy"]:
-                self.ax.plot(ov["main_xy"]["x"], ov["main_xy"]["y"], "k:", lw=1)
-            if ov["polehole_n"]:
-                self.ax.plot(ov["polehole_n"]["x"], ov["polehole_n"]["y"], "k", lw=1)
-            if ov["polehole_s"]:
-                self.ax.plot(ov["polehole_s"]["x"], ov["polehole_s"]["y"], "k", lw=1)
-            if ov["main_x"]:
-                self.ax.plot(ov["main_x"]["x"], ov["main_x"]["y"], "k", lw=2)
-            if ov["main_y"]:
-                self.ax.plot(ov["main_y"]["x"], ov["main_y"]["y"], "k", lw=2)
-            if ov["main_z"]:
-                self.ax.plot(ov["main_z"]["x"], ov["main_z"]["y"], "k", lw=2)
+            grid = [
+                *ov["lat_e"].values(),
+                *ov["lat_w"].values(),
+                *ov["lon_n"].values(),
+                *ov["lon_s"].values(),
+                ov["main_xz"],
+                ov["main_yz"],
+                ov["main_xy"],
+            ]
+            self._add_overlay_lines(grid, linestyles=":", linewidths=1)
+            self._add_overlay_lines(
+                [ov["polehole_n"], ov["polehole_s"]],
+                linestyles="-",
+                linewidths=1,
+                capstyle="projecting",
+            )
+            self._add_overlay_lines(
+                [ov["main_x"], ov["main_y"], ov["main_z"]],
+                linestyles="-",
+                linewidths=2,
+                capstyle="projecting",
+            )
 
         # Projection circle frame
         theta = np.linspace(0, 2 * np.pi, 200)
         self.ax.plot(np.cos(theta), np.sin(theta), "k", lw=2)
-        # Minor ticks
-        if self._kwargs["minor_ticks"] is not None:
-            ticks = np.array([1, 1.02])
-            theta = np.arange(0, 2 * np.pi, np.radians(self._kwargs["minor_ticks"]))
-            self.ax.plot(
-                np.outer(ticks, np.cos(theta)),
-                np.outer(ticks, np.sin(theta)),
-                "k",
-                lw=1,
-            )
-        # Major ticks
-        if self._kwargs["major_ticks"] is not None:
-            ticks = np.array([1, 1.03])
-            theta = np.arange(0, 2 * np.pi, np.radians(self._kwargs["major_ticks"]))
-            self.ax.plot(
-                np.outer(ticks, np.cos(theta)),
-                np.outer(ticks, np.sin(theta)),
-                "k",
-                lw=1.5,
-            )
+        # Minor and major ticks, each drawn as single collection
+        for step, length, lw in (
+            (self._kwargs["minor_ticks"], 1.02, 1),
+            (self._kwargs["major_ticks"], 1.03, 1.5),
+        ):
+            if step is not None:
+                theta = np.arange(0, 2 * np.pi, np.radians(step))
+                cs = np.column_stack((np.cos(theta), np.sin(theta)))
+                self.ax.add_collection(
+                    LineCollection(
+                        np.stack((cs, length * cs), axis=1),
+                        colors="k",
+                        linewidths=lw,
+                        capstyle="projecting",
+                    )
+                )
         # add clipping circle
         self.primitive = Circle(
             (0, 0),
@@ -139,10 +138,49 @@ class StereoNet:
         )
         self.ax.add_patch(self.primitive)
 
+    def _add_overlay_lines(self, curves, **kwargs):
+        # all curves are drawn by single collection, nans split curves to parts
+        from matplotlib.collections import LineCollection
+
+        segments = []
+        for d in curves:
+            if d:
+                segments.extend(_nan_segments(d["x"], d["y"]))
+        self.ax.add_collection(LineCollection(segments, colors="k", **kwargs))
+
+    def _add_points(self, x, y, **kwargs):
+        # all points are drawn by single clipped Line2D
+        h = self.ax.plot(x, y, **kwargs)[0]
+        h.set_clip_path(self.primitive)
+        return [h]
+
+    def _add_curves(self, x, y, **kwargs):
+        # curves separated by nans are drawn as single clipped collection. Style
+        # is resolved by ax.plot of empty line, so color cycle and Line2D
+        # keyword arguments are handled as for plotted lines.
+        from matplotlib.collections import LineCollection
+
+        (line,) = self.ax.plot([], [], **kwargs)
+        line.remove()
+        lc = LineCollection(
+            _nan_segments(x, y),
+            colors=line.get_color(),
+            linestyles=line.get_linestyle(),
+            linewidths=line.get_linewidth(),
+            alpha=line.get_alpha(),
+            label=line.get_label(),
+            zorder=line.get_zorder(),
+            capstyle=line.get_solid_capstyle(),
+            joinstyle=line.get_solid_joinstyle(),
+        )
+        lc.set_clip_path(self.primitive)
+        self.ax.add_collection(lc)
+        return [lc]
+
     def _plot_artists(self):
         for artist in self._artists:
             plot_method = getattr(self, artist.stereonet_method)
-            plot_method(*artist.args, **artist.kwargs)
+            plot_method(*_artist_args(artist), **artist.kwargs)
 
     def to_json(self):
         """Return stereonet as JSON dict"""
@@ -160,27 +198,26 @@ class StereoNet:
 
     def save(self, filename):
         """
-        Save stereonet to pickle file
+        Save stereonet to JSON file
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "wb") as f:
-            pickle.dump(self.to_json(), f, pickle.HIGHEST_PROTOCOL)
+        save_json(self.to_json(), filename)
 
     @classmethod
     def load(cls, filename):
         """
-        Load stereonet from pickle file
+        Load stereonet from JSON file (or pickle file saved by older versions)
 
         Args:
-            filename (str): name of picke file
+            filename (str): name of JSON file
         """
-        with open(filename, "rb") as f:
-            data = pickle.load(f)
-        return cls.from_json(data)
+        return cls.from_json(load_json(filename))
 
     def init_figure(self):
+        import matplotlib.pyplot as plt
+
         self.fig = plt.figure(
             0,
             figsize=apsg_conf["figsize"],
@@ -236,6 +273,8 @@ class StereoNet:
 
     def show(self):
         """Show stereonet"""
+        import matplotlib.pyplot as plt
+
         plt.close(0)  # close previously rendered figure
         self.init_figure()
         self._render()
@@ -250,12 +289,21 @@ class StereoNet:
             filename (str): filename
 
         All others kwargs are passed to matplotlib `Figure.savefig`
+
+        Figure is rendered by Agg canvas independently on pyplot backend,
+        so no GUI window is created. Use `show` for interactive backend.
         """
-        plt.close(0)  # close previously rendered figure
-        self.init_figure()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig = Figure(
+            figsize=apsg_conf["figsize"],
+            dpi=apsg_conf["dpi"],
+            facecolor=apsg_conf["facecolor"],
+        )
+        FigureCanvasAgg(self.fig)
         self._render()
         self.fig.savefig(filename, **kwargs)
-        plt.close(0)
 
     ########################################
     # PLOTTING METHODS                     #
@@ -596,37 +644,20 @@ class StereoNet:
     ########################################
 
     def _line(self, *args, **kwargs):
-        x_lower, y_lower = self.proj.project_data(*np.vstack(args).T)
-        x_upper, y_upper = self.proj.project_data(*(-np.vstack(args).T))
-        handles = self.ax.plot(
-            np.hstack((x_lower, x_upper)), np.hstack((y_lower, y_upper)), **kwargs
-        )
-        for h in handles:
-            h.set_clip_path(self.primitive)
-        return handles
+        x, y = self.proj.project_data_both(*_stack(args).T)
+        return self._add_points(x, y, **kwargs)
 
     def _vector(self, *args, **kwargs):
         x_lower, y_lower, x_upper, y_upper = self.proj.project_data_antipodal(
-            *np.vstack(args).T
+            *_stack(args).T
         )
+        u_kwargs = kwargs.copy()
+        u_kwargs["mfc"] = "none"
         if len(x_lower) > 0:
-            handles = self.ax.plot(x_lower, y_lower, **kwargs)
-            for h in handles:
-                h.set_clip_path(self.primitive)
-            u_kwargs = kwargs.copy()
+            h = self._add_points(x_lower, y_lower, **kwargs)
             u_kwargs["label"] = "_upper"
-            u_kwargs["mec"] = h.get_color()
-            u_kwargs["mfc"] = "none"
-            handles = self.ax.plot(x_upper, y_upper, **u_kwargs)
-            for h in handles:
-                h.set_clip_path(self.primitive)
-        else:
-            u_kwargs = kwargs.copy()
-            u_kwargs["mfc"] = "none"
-            handles = self.ax.plot(x_upper, y_upper, **u_kwargs)
-            for h in handles:
-                h.set_clip_path(self.primitive)
-        return handles
+            u_kwargs["mec"] = h[0].get_color()
+        return self._add_points(x_upper, y_upper, **u_kwargs)
 
     def _great_circle(self, *args, **kwargs):
         X, Y = [], []
@@ -635,39 +666,29 @@ class StereoNet:
                 fdv = arg.transform(self.proj.R).dipvec().transform(self.proj.Ri)
             else:
                 fdv = arg.dipvec()
-            # iterate
-            for fol, dv in zip(np.atleast_2d(arg), np.atleast_2d(fdv)):
-                # plot on lower
-                x, y = self.proj.project_data(
-                    *np.array(
-                        [
-                            np.asarray(Vector3(dv).rotate(Vector3(fol), a))
-                            for a in self.angles_gc
-                        ]
-                    ).T
-                )
-                X.append(np.hstack((x, np.nan)))
-                Y.append(np.hstack((y, np.nan)))
-                # plot on upper
-                x, y = self.proj.project_data(
-                    *np.array(
-                        [
-                            -np.asarray(Vector3(dv).rotate(Vector3(fol), a))
-                            for a in self.angles_gc
-                        ]
-                    ).T
-                )
-                X.append(np.hstack((x, np.nan)))
-                Y.append(np.hstack((y, np.nan)))
-        handles = self.ax.plot(np.hstack(X), np.hstack(Y), **kwargs)
-        for h in handles:
-            h.set_clip_path(self.primitive)
-        return handles
+            # all great circles are rotated at once
+            dc = _rotate_fan(_as_rows(fdv), _as_rows(arg), *self._trig_gc)
+            x, y = self._project_curves(dc.reshape(-1, 3))
+            X.append(x)
+            Y.append(y)
+        return self._add_curves(np.hstack(X), np.hstack(Y), **kwargs)
+
+    def _project_curves(self, dc, n=None):
+        # project (m * n, 3) array of m curves of n points on lower and upper
+        # hemisphere and return coordinates of curves separated by nans
+        if n is None:
+            n = len(self.angles_gc)
+        x, y = self.proj.project_data_both(*dc.T)
+        xy = np.full((len(dc) // n, 2, 2, n + 1), np.nan)
+        xy[:, :, 0, :n] = x.reshape(2, -1, n).swapaxes(0, 1)
+        xy[:, :, 1, :n] = y.reshape(2, -1, n).swapaxes(0, 1)
+        return xy[:, :, 0].ravel(), xy[:, :, 1].ravel()
 
     def _arc(self, *args, **kwargs):
         X_lower, Y_lower = [], []
         X_upper, Y_upper = [], []
-        antipodal = any([type(arg) is Vector3 for arg in args])
+        # exact type test, axial subclasses like Lineation are not antipodal
+        antipodal = any(type(arg) is Vector3 for arg in args)
         u_kwargs = kwargs.copy()
         u_kwargs["ls"] = "--"
         u_kwargs["label"] = "_upper"
@@ -675,52 +696,33 @@ class StereoNet:
             steps = max(2, int(arg1.angle(arg2)))
             # plot on lower
             x_lower, y_lower, x_upper, y_upper = self.proj.project_data_antipodal(
-                *np.array(
-                    [np.asarray(arg1.slerp(arg2, t)) for t in np.linspace(0, 1, steps)]
-                ).T
+                *_slerp(arg1, arg2, np.linspace(0, 1, steps)).T
             )
             X_lower.append(np.hstack((x_lower, np.nan)))
             Y_lower.append(np.hstack((y_lower, np.nan)))
             X_upper.append(np.hstack((x_upper, np.nan)))
             Y_upper.append(np.hstack((y_upper, np.nan)))
-        handles = self.ax.plot(np.hstack(X_lower), np.hstack(Y_lower), **kwargs)
-        for h in handles:
-            h.set_clip_path(self.primitive)
+        handles = self._add_curves(np.hstack(X_lower), np.hstack(Y_lower), **kwargs)
         if antipodal:
-            u_kwargs["color"] = h.get_color()
-            handles_2 = self.ax.plot(np.hstack(X_upper), np.hstack(Y_upper), **u_kwargs)
-            for h in handles_2:
-                h.set_clip_path(self.primitive)
+            u_kwargs["color"] = handles[0].get_edgecolor()[0]
+            self._add_curves(np.hstack(X_upper), np.hstack(Y_upper), **u_kwargs)
         return handles
 
     def _scatter(self, *args, **kwargs):
         legend = kwargs.pop("legend")
         num = kwargs.pop("num")
-        x_lower, y_lower = self.proj.project_data(*np.vstack(args).T)
-        # mask_lower = ~np.isnan(x_lower)
-        x_upper, y_upper = self.proj.project_data(*(-np.vstack(args).T))
-        # mask_upper = ~np.isnan(x_upper)
-        # x_lower, y_lower, x_upper, y_upper = self.proj.project_data_antipodal(
-        #    *np.vstack(args).T
-        # )
+        # sizes and colors of data are picked for projected points, which are
+        # duplicated for horizontal vectors
+        data = _stack(args)
+        x, y, idx = self.proj.project_data_hemispheres(*data.T)
         prop = "sizes"
-        if kwargs["s"] is not None:
-            s = np.atleast_1d(kwargs["s"])
-            # kwargs["s"] = np.hstack((s[mask_lower], s[mask_upper]))
-            kwargs["s"] = np.hstack((s, s))
+        for key in ("s", "c"):
+            val = kwargs[key]
+            if val is not None and np.ndim(val) > 0 and len(val) == len(data):
+                kwargs[key] = np.asarray(val)[idx]
         if kwargs["c"] is not None:
-            c = np.atleast_1d(kwargs["c"])
-            # kwargs["c"] = np.hstack((c[mask_lower], c[mask_upper]))
-            kwargs["c"] = np.hstack((c, c))
             prop = "colors"
-        sc = self.ax.scatter(
-            # np.hstack((x_lower[mask_lower], x_upper[mask_upper])),
-            # np.hstack((y_lower[mask_lower], y_upper[mask_upper])),
-            # **kwargs,
-            np.hstack((x_lower, x_upper)),
-            np.hstack((y_lower, y_upper)),
-            **kwargs,
-        )
+        sc = self.ax.scatter(x, y, **kwargs)
         if legend:
             self.ax.legend(
                 *sc.legend_elements(prop, num=num),
@@ -765,34 +767,19 @@ class StereoNet:
 
     def _cone(self, *args, **kwargs):
         X, Y = [], []
-        # get scalar arguments from kwargs
         for arg in args:
-            if issubclass(type(arg), Cone):
-                cones = [arg]
-            else:
-                cones = arg
+            cones = [arg] if isinstance(arg, Cone) else arg
             for c in cones:
-                # plot on lower
-                angles = np.linspace(0, c.revangle, max(2, abs(int(c.revangle))))
-                x, y = self.proj.project_data(
-                    *np.array(
-                        [np.asarray(c.secant.rotate(c.axis, a)) for a in angles]
-                    ).T
-                )
-                X.append(np.hstack((x, np.nan)))
-                Y.append(np.hstack((y, np.nan)))
-                # plot on upper
-                x, y = self.proj.project_data(
-                    *np.array(
-                        [-np.asarray(c.secant.rotate(c.axis, a)) for a in angles]
-                    ).T
-                )
-                X.append(np.hstack((x, np.nan)))
-                Y.append(np.hstack((y, np.nan)))
-        handles = self.ax.plot(np.hstack(X), np.hstack(Y), **kwargs)
-        for h in handles:
-            h.set_clip_path(self.primitive)
-        return handles
+                n = max(2, abs(int(c.revangle)))
+                dc = _rotate_fan(
+                    np.asarray(c.secant, dtype=float)[None, :],
+                    np.asarray(c.axis, dtype=float)[None, :],
+                    *_angles_trig(0, c.revangle, n),
+                )[0]
+                x, y = self._project_curves(dc, n)
+                X.append(x)
+                Y.append(y)
+        return self._add_curves(np.hstack(X), np.hstack(Y), **kwargs)
 
     def _pair(self, *args, **kwargs):
         line_marker = kwargs.pop("line_marker")
@@ -801,8 +788,8 @@ class StereoNet:
             *[arg.lin for arg in args],
             marker=line_marker,
             ls="none",
-            mfc=h[0].get_color(),
-            mec=h[0].get_color(),
+            mfc=h[0].get_edgecolor()[0],
+            mec=h[0].get_edgecolor()[0],
             ms=kwargs.get("ms"),
         )
 
@@ -810,7 +797,7 @@ class StereoNet:
         h = self._great_circle(*[arg.fol for arg in args], **kwargs)
         quiver_kwargs = apsg_conf["stereonet_default_arrow_kwargs"]
         quiver_kwargs["pivot"] = "tail"
-        quiver_kwargs["color"] = h[0].get_color()
+        quiver_kwargs["color"] = h[0].get_edgecolor()[0]
         for arg in args:
             self._arrow(arg.lin, sense=arg.sense, **quiver_kwargs)
 
@@ -822,31 +809,16 @@ class StereoNet:
             self._arrow(arg.fol, arg.lin, sense=arg.sense, **quiver_kwargs)
 
     def _arrow(self, *args, **kwargs):
-        sense = kwargs.pop("sense") * np.ones(
-            np.atleast_2d(np.asarray(args[0])).shape[0]
-        )
-        x_lower, y_lower = self.proj.project_data(
-            *np.vstack(np.atleast_2d(np.asarray(args[0]))).T
-        )
-        x_upper, y_upper = self.proj.project_data(
-            *(-np.vstack(np.atleast_2d(np.asarray(args[0]))).T)
-        )
-        x = np.hstack((x_lower, x_upper))
-        y = np.hstack((y_lower, y_upper))
+        dc = _as_rows(args[0])
+        sense = kwargs.pop("sense") * np.ones(len(dc))
+        x, y = self.proj.project_data_both(*dc.T)
         sense = np.hstack((sense, sense))
         inside = ~np.isnan(x)
         x = x[inside]
         y = y[inside]
         sense = sense[inside]
         if len(args) > 1:
-            x_lower, y_lower = self.proj.project_data(
-                *np.vstack(np.atleast_2d(np.asarray(args[1]))).T
-            )
-            x_upper, y_upper = self.proj.project_data(
-                *(-np.vstack(np.atleast_2d(np.asarray(args[1]))).T)
-            )
-            dx = np.hstack((x_lower, x_upper))
-            dy = np.hstack((y_lower, y_upper))
+            dx, dy = self.proj.project_data_both(*_as_rows(args[1]).T)
             dx = dx[~np.isnan(dx)]
             dy = dy[~np.isnan(dy)]
         else:
@@ -898,19 +870,18 @@ class StereoNet:
                 )
             else:
                 return None
-        dcgrid = np.asarray(self.grid.grid).T
-        X, Y = self.proj.project_data(*dcgrid, clip_inside=False)
-        cf = self.ax.tricontourf(X, Y, self.grid.values, **kwargs)
-        for collection in cf.collections:
-            collection.set_clip_path(self.primitive)
+        # counting grids are spirals, not lattices, so triangulation is needed,
+        # but it is cached on grid and reused by all contours and renders
+        triang = self.grid.triangulation()
+        cf = self.ax.tricontourf(triang, self.grid.values, **kwargs)
+        _clip_contours(cf, self.primitive)
         if clines:
             kwargs["cmap"] = None
             kwargs["colors"] = "k"
             kwargs["linewidths"] = linewidths
             kwargs["linestyles"] = linestyles
-            cl = self.ax.tricontour(X, Y, self.grid.values, **kwargs)
-            for collection in cl.collections:
-                collection.set_clip_path(self.primitive)
+            cl = self.ax.tricontour(triang, self.grid.values, **kwargs)
+            _clip_contours(cl, self.primitive)
         if show_data:
             artist = StereoNetArtistFactory.create_point(*args[0], **data_kws)
             self._line(*artist.args, **artist.kwargs)
@@ -919,6 +890,60 @@ class StereoNet:
         # plt.colorbar(cf, format="%3.2f", spacing="proportional")
 
 
+def _artist_args(artist):
+    # point-like artists keep their features as preassembled array
+    return (artist.xyz,) if hasattr(artist, "xyz") else artist.args
+
+
+def _clip_contours(cs, primitive):
+    # since matplotlib 3.8 ContourSet is single collection
+    if hasattr(cs, "set_clip_path"):
+        cs.set_clip_path(primitive)
+    else:
+        for collection in cs.collections:
+            collection.set_clip_path(primitive)
+
+
+def _stack(args):
+    """Return (n, 3) array of features, arrays passed alone are not copied"""
+    if len(args) == 1 and isinstance(args[0], np.ndarray):
+        # artists keep C-contiguous (n, 3) float arrays, see _stack_xyz
+        assert args[0].flags.c_contiguous and args[0].ndim == 2
+        return args[0]
+    return np.vstack(args)
+
+
+def _as_rows(arg):
+    """Return feature or features as (n, 3) float array, view when possible"""
+    return np.asarray(arg, dtype=float).reshape(-1, 3)
+
+
+def _nan_segments(x, y):
+    """Return list of (n, 2) arrays of curve parts separated by nans"""
+    xy = np.column_stack((x, y))
+    valid = ~np.isnan(xy).any(axis=1)
+    breaks = np.flatnonzero(np.diff(valid)) + 1
+    return [
+        part
+        for part, ok in zip(np.split(xy, breaks), np.split(valid, breaks))
+        if ok[0] and len(part) > 1
+    ]
+
+
+@lru_cache(maxsize=64)
+def _angles_trig(start, stop, num):
+    """Return read-only cosines and sines of evenly spaced angles in degrees.
+
+    Tables depend only on overlay resolution or cone angle, so they are
+    created once and shared.
+    """
+    theta = np.radians(np.linspace(start, stop, num))
+    c, s = np.cos(theta), np.sin(theta)
+    c.flags.writeable = False
+    s.flags.writeable = False
+    return c, s
+
+
 def stereonetartist_from_json(obj_json):
     args = tuple([feature_from_json(arg_json) for arg_json in obj_json["args"]])
     return getattr(StereoNetArtistFactory, obj_json["factory"])(
@@ -926,6 +951,28 @@ def stereonetartist_from_json(obj_json):
     )
 
 
+def _quicknet_planar(s, arg, fol_as_pole):
+    if fol_as_pole:
+        s.pole(arg)
+    else:
+        s.great_circle(arg)
+
+
+_QUICKNET_DISPATCH = {
+    Vector3: lambda s, arg, fol_as_pole: s.vector(arg),
+    Foliation: _quicknet_planar,
+    Lineation: lambda s, arg, fol_as_pole: s.line(arg),
+    Pair: lambda s, arg, fol_as_pole: s.pair(arg),
+    Fault: lambda s, arg, fol_as_pole: s.fault(arg),
+    Cone: lambda s, arg, fol_as_pole: s.cone(arg),
+    Vector3Set: lambda s, arg, fol_as_pole: s.vector(arg),
+    FoliationSet: _quicknet_planar,
+    LineationSet: lambda s, arg, fol_as_pole: s.line(arg),
+    PairSet: lambda s, arg, fol_as_pole: s.pair(arg),
+    FaultSet: lambda s, arg, fol_as_pole: s.fault(arg),
+}
+
+
 def quicknet(*args, **kwargs):
     """
     Function to quickly show or save ``StereoNet`` from args
@@ -953,36 +1000,12 @@ def quicknet(*args, **kwargs):
     fol_as_pole = kwargs.get("fol_as_pole", False)
     s = StereoNet(**kwargs)
     for arg in args:
-        if isinstance(arg, Vector3):
-            if isinstance(arg, Foliation):
-                if fol_as_pole:
-                    s.pole(arg)
-                else:
-                    s.great_circle(arg)
-            elif isinstance(arg, Lineation):
-                s.line(arg)
-            else:
-                s.vector(arg)
-        elif isinstance(arg, Fault):
-            s.fault(arg)
-        elif isinstance(arg, Pair):
-            s.pair(arg)
-        elif isinstance(arg, Cone):
-            s.cone(arg)
-        elif isinstance(arg, Vector3Set):
-            if isinstance(arg, FoliationSet):
-                if fol_as_pole:
-                    s.pole(arg)
-                else:
-                    s.great_circle(arg)
-            elif isinstance(arg, LineationSet):
-                s.line(arg)
-            else:
-                s.vector(arg)
-        elif isinstance(arg, FaultSet):
-            s.fault(arg)
-        elif isinstance(arg, PairSet):
-            s.pair(arg)
+        # most specific registered class of argument selects plotting method
+        for cls in type(arg).__mro__:
+            handler = _QUICKNET_DISPATCH.get(cls)
+            if handler is not None:
+                handler(s, arg, fol_as_pole)
+                break
         else:
             print(f"{type(arg)} not supported.")
     if savefig:
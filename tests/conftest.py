@@ -2,7 +2,17 @@
 Several test helper functions.
 """
 
+import os
+
+# BLAS thread pools only add overhead to 3x3 linear algebra, so they are
+# capped before numpy is first imported
+for _var in ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "OMP_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 import pytest
+import numpy as np
+
+from apsg import lin, fol, pair, vecset, linset, defgrad
 
 
 class Helpers:
@@ -34,3 +44,45 @@ class Helpers:
 @pytest.fixture
 def helpers():
     return Helpers
+
+
+@pytest.fixture(scope="session")
+def rand():
+    """Pool of random features shared by tests, drawn once from fixed seed."""
+    state = np.random.get_state()
+    np.random.seed(0)
+    pool = dict(
+        lin=lin.random(),
+        lin_pair=(lin.random(), lin.random()),
+        fol=fol.random(),
+        fol_pair=(fol.random(), fol.random()),
+        pair=pair.random(),
+        vecset=vecset.random_fisher(),
+        linset=linset.random_fisher(),
+    )
+    np.random.set_state(state)
+    return pool
+
+
+@pytest.fixture(scope="session")
+def D60():
+    return defgrad.from_axisangle(lin(45, 45), 60)
+
+
+@pytest.fixture
+def sdb_file(tmp_path):
+    """Small PySDB database with planar data, two of them tagged."""
+    from apsg.database import SDBSession
+
+    filename = str(tmp_path / "test.sdb")
+    db = SDBSession(filename, create=True)
+    site = db.site("A", unit=db.unit("Default"))
+    S = db.structype("S")
+    tags = [db.tag("fold", description=""), db.tag("folded", description="")]
+    for (azi, inc), tag in zip([(120, 30), (200, 60), (10, 10)], tags + [None]):
+        data = db.add_structdata(site, S, azi, inc)
+        if tag is not None:
+            data.tags.append(tag)
+    db.commit()
+    db.close()
+    return filename
@@ -14,32 +14,35 @@ Proper unit tests should fail for exactly one reason
 (that’s why you usually should be using one assert per unit test.)
 """
 
+import math
+import operator
 
 import pytest
 import numpy as np
 
 from apsg.config import apsg_conf
 from apsg import vec, fol, lin, fault, pair
-from apsg import vecset, linset, folset
+from apsg import vecset, linset, folset, pairset, faultset
 from apsg import defgrad
 
 atol = 1e-05  # safe tests
 
+
 # ############################################################################
 # Vectors
 # ############################################################################
 
 
 class TestVector:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def x(self):
         return vec(1, 0, 0)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def y(self):
         return vec(0, 1, 0)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def z(self):
         return vec(0, 0, 1)
 
@@ -52,28 +55,28 @@ class TestVector:
 
         assert current == expects
 
-    def test_that_vec_string_gets_three_digits_when_vec2dd_settings_is_false(self):
-        apsg_conf["vec2geo"] = False
-
-        v = vec(1, 2, 3)
-
-        current = str(v)
-        expects = "Vector3(1, 2, 3)"
-
-        assert current == expects
-
-    def test_that_vec_string_gets_dip_and_dir_when_vec2dd_settings_is_true(self):
-        apsg_conf["vec2geo"] = True
-
+    # global settings are restored after each test, so tests do not depend on
+    # their order and could be distributed between pytest-xdist workers
+    @pytest.fixture
+    def vec2geo(self, request):
+        old = apsg_conf["vec2geo"]
+        apsg_conf["vec2geo"] = request.param
+        yield request.param
+        apsg_conf["vec2geo"] = old
+
+    @pytest.mark.parametrize(
+        "vec2geo, expects",
+        [(False, "Vector3(1, 2, 3)"), (True, "V:63/53")],
+        indirect=["vec2geo"],
+        ids=["vec2geo_false", "vec2geo_true"],
+    )
+    def test_vec_string_depends_on_vec2geo_settings(self, vec2geo, expects):
         v = vec(1, 2, 3)
 
         current = str(v)
-        expects = "V:63/53"
 
         assert current == expects
 
-        apsg_conf["vec2geo"] = False
-
     # ``==`` operator
 
     def test_that_equality_operator_is_reflexive(self):
@@ -103,6 +106,7 @@ class TestVector:
         rhs = vec([1.00000000000000009] * 3)
 
         assert lhs == rhs
+        assert np.allclose(lhs, rhs)
 
     # ``!=`` operator
 
@@ -142,18 +146,20 @@ class TestVector:
 
     def test_absolute_value(self):
         current = abs(vec(1, 2, 3))
-        expects = 3.7416573867739413
+        expects = math.sqrt(14)
 
-        assert current == expects
+        assert math.isclose(current, expects, rel_tol=1e-12)
 
     # ``uv`` property
 
     def test_that_vector_is_normalized(self):
         current = vec(1, 2, 3).normalized()
         current_alias = vec(1, 2, 3).uv()
-        expects = vec(0.26726124191242442, 0.5345224838248488, 0.8017837257372732)
+        expects = np.array([1, 2, 3]) / math.sqrt(14)
 
-        assert current == current_alias == expects
+        np.testing.assert_allclose(
+            [current, current_alias], [expects, expects], rtol=1e-12
+        )
 
     # ``geo`` property
 
@@ -169,17 +175,20 @@ class TestVector:
 
     def test_lin_conversion(self):
         assert str(lin(vec(1, 1, 1))) == str(lin(45, 35))  # `Vec` to `lin`
-        assert str(lin(vec(lin(110, 37)))) == str(
-            lin(110, 37)
-        )  # `lin` to `Vec` to `lin`
 
     # ``asfol`` property
 
     def test_fol_conversion(self):
         assert str(fol(vec(1, 1, 1))) == str(fol(225, 55))  # `Vec` to `fol`
-        assert str(fol(vec(fol(213, 52)))) == str(
-            fol(213, 52)
-        )  # `fol` to `Vec` to `fol`
+
+    # `lin` or `fol` to `Vec` and back
+    AZDIP = np.array([[110, 37], [213, 52], [120, 30]])
+
+    @pytest.mark.parametrize("kind", [lin, fol], ids=["lin", "fol"])
+    def test_geo_vector_round_trip(self, kind):
+        current = np.array([kind(vec(kind(*ad))).geo for ad in self.AZDIP])
+
+        assert np.allclose(current, self.AZDIP)
 
     # ``asvec`` property
 
@@ -190,30 +199,17 @@ class TestVector:
         assert abs(vec(10 * vec(120, 50))) == 10
 
     # ``angle`` property
-    def test_that_angle_between_vectors_is_0_degrees_when_they_are_collinear(self):
-        lhs = vec(1, 0, 0)
-        rhs = vec(2, 0, 0)
-
-        current = lhs.angle(rhs)
-        expects = 0
-
-        assert current == expects
-
-    def test_that_angle_between_vectors_is_90_degrees_when_they_are_perpendicular(self):
-        lhs = vec(1, 0, 0)
-        rhs = vec(0, 1, 1)
-
-        current = lhs.angle(rhs)
-        expects = 90  # degrees
-
-        assert current == expects
-
-    def test_that_angle_between_vectors_is_180_degrees_when_they_are_opposite(self):
-        lhs = vec(1, 0, 0)
-        rhs = vec(-1, 0, 0)
-
+    @pytest.mark.parametrize(
+        "lhs, rhs, expects",
+        [
+            (vec(1, 0, 0), vec(2, 0, 0), 0),  # collinear
+            (vec(1, 0, 0), vec(0, 1, 1), 90),  # perpendicular
+            (vec(1, 0, 0), vec(-1, 0, 0), 180),  # opposite
+        ],
+        ids=["collinear", "perpendicular", "opposite"],
+    )
+    def test_angle_between_vectors(self, lhs, rhs, expects):
         current = lhs.angle(rhs)
-        expects = 180  # degrees
 
         assert current == expects
 
@@ -232,33 +228,15 @@ class TestVector:
 
         assert x.cross(y + z) == x.cross(y) + x.cross(z)
 
-    def test_that_vector_product_is_zero_vector_when_they_are_collinear(self):
-        lhs = vec(1, 0, 0)
-        rhs = vec(2, 0, 0)
-
-        current = lhs.cross(rhs)
-        expects = vec(0, 0, 0)
-
-        assert current == expects
-
-    def test_that_vector_product_is_zero_vector_when_they_are_opposite(self):
-
-        lhs = vec(1, 0, 0)
-        rhs = vec(-1, 0, 0)
-
-        current = lhs.cross(rhs)
-        expects = vec(0, 0, 0)
-
-        assert current == expects
-
-    def test_vector_product_of_orthonormal_vectors(self):
-        e1 = vec(1, 0, 0)
-        e2 = vec(0, 1, 0)
+    # cases are collinear, opposite, orthonormal and general vectors
+    LHS = np.array([[1, 0, 0], [1, 0, 0], [1, 0, 0], [1, 2, 3]])
+    RHS = np.array([[2, 0, 0], [-1, 0, 0], [0, 1, 0], [3, 1, 2]])
 
-        current = e1.cross(e2)
-        expects = vec(0, 0, 1)
+    def test_vector_product_agrees_with_numpy(self):
+        current = np.array([vec(a).cross(vec(b)) for a, b in zip(self.LHS, self.RHS)])
+        expects = np.cross(self.LHS, self.RHS)
 
-        assert current == expects
+        np.testing.assert_allclose(current, expects, atol=atol)
 
     # ``dot`` method
 
@@ -267,34 +245,30 @@ class TestVector:
 
         assert np.isclose(i.dot(i), abs(i) ** 2, atol=atol)
 
-    def test_scalar_product_of_orthonornal_vectors(self):
-        i = vec(1, 0, 0)
-        j = vec(0, 1, 0)
+    def test_scalar_product_agrees_with_numpy(self):
+        current = np.array([vec(a).dot(vec(b)) for a, b in zip(self.LHS, self.RHS)])
+        expects = np.einsum("ij,ij->i", self.LHS, self.RHS)
 
-        assert np.isclose(i.dot(j), 0, atol=atol)
+        np.testing.assert_allclose(current, expects, atol=atol)
 
     # ``rotate`` method
 
-    def test_rotation_by_90_degrees_around_axis(self, z):
+    def test_rotation_around_z_axis(self, z):
         v = vec(1, 1, 1)
-        current = v.rotate(z, 90)
-        expects = vec(-1, 1, 1)
-
-        assert current == expects
+        current = np.stack([v.rotate(z, a) for a in [90, 180, 360]])
+        expects = np.array([[-1, 1, 1], [-1, -1, 1], [1, 1, 1]])
 
-    def test_rotation_by_180_degrees_around_axis(self, z):
-        v = vec(1, 1, 1)
-        current = v.rotate(z, 180)
-        expects = vec(-1, -1, 1)
+        np.testing.assert_allclose(current, expects, atol=1e-10)
 
-        assert current == expects
+    def test_rotate_batch_is_same_as_rotate(self):
+        v = vec(1, 2, 3)
+        k = lin(40, 30)
+        angles = [0, 45, 120, 270]
 
-    def test_rotation_by_360_degrees_around_axis(self, z):
-        v = vec(1, 1, 1)
-        current = v.rotate(z, 360)
-        expects = vec(1, 1, 1)
+        current = v.rotate_batch(k, angles)
+        expects = np.array([v.rotate(k, a) for a in angles])
 
-        assert current == expects
+        assert np.allclose(current, expects)
 
     # ``proj`` method
 
@@ -322,30 +296,17 @@ class TestVector:
 
         assert current == expects
 
-    def test_add_operator(self):
-        lhs = vec(1, 1, 1)
-        rhs = vec(1, 1, 1)
-
-        current = lhs + rhs
-        expects = vec(2, 2, 2)
-
-        assert current == expects
-
-    def test_sub_operator(self):
-        lhs = vec(1, 2, 3)
-        rhs = vec(3, 1, 2)
-
-        current = lhs - rhs
-        expects = vec(-2, 1, 1)
-
-        assert current == expects
-
-    def test_pow_operator_with_scalar(self):
-        lhs = vec(1, 2, 3)
-        rhs = 2
-
-        current = lhs**rhs
-        expects = vec(1, 4, 9)
+    @pytest.mark.parametrize(
+        "op, lhs, rhs, expects",
+        [
+            (operator.add, vec(1, 1, 1), vec(1, 1, 1), vec(2, 2, 2)),
+            (operator.sub, vec(1, 2, 3), vec(3, 1, 2), vec(-2, 1, 1)),
+            (operator.pow, vec(1, 2, 3), 2, vec(1, 4, 9)),
+        ],
+        ids=["add", "sub", "pow_with_scalar"],
+    )
+    def test_binary_operator(self, op, lhs, rhs, expects):
+        current = op(lhs, rhs)
 
         assert current == expects
 
@@ -372,56 +333,50 @@ class Testlineation:
     def test_str(self, x):
         assert str(x) == "L:0/0"
 
-    def test_equality_for_oposite_dir(self):
-        l1 = lin.random()
+    def test_equality_for_oposite_dir(self, rand):
+        l1 = rand["lin"]
         assert l1 == -l1
 
-    def test_anlge_for_oposite_dir(self):
-        l1 = lin.random()
+    def test_anlge_for_oposite_dir(self, rand):
+        l1 = rand["lin"]
         assert np.isclose(l1.angle(-l1), 0, atol=atol)
 
     def test_that_azimuth_0_is_same_as_360(self):
         assert lin(0, 20) == lin(360, 20)
 
-    def test_scalar_product(self):
-        l1 = lin.random()
+    def test_scalar_product(self, rand):
+        l1 = rand["lin"]
         assert np.isclose(l1.dot(l1), 1, atol=atol)
 
-    def test_cross_product(self):
-        l1 = lin.random()
-        l2 = lin.random()
+    def test_cross_product(self, rand):
+        l1, l2 = rand["lin_pair"]
         p = l1.cross(l2)
 
         assert np.allclose([p.angle(l1), p.angle(l2)], [90, 90])
 
-    def test_mutual_rotation(self):
-        l1 = lin.random()
-        l2 = lin.random()
+    def test_mutual_rotation(self, rand):
+        l1, l2 = rand["lin_pair"]
         F = defgrad.from_two_vectors(l1, l2)
 
         assert l1.transform(F) == l2
 
-    def test_angle_under_rotation(self):
-        l1 = lin.random()
-        l2 = lin.random()
-        D = defgrad.from_axisangle(lin(45, 45), 60)
+    def test_angle_under_rotation(self, rand, D60):
+        l1, l2 = rand["lin_pair"]
 
         assert np.isclose(
-            l1.angle(l2), l1.transform(D).angle(l2.transform(D)), atol=atol
+            l1.angle(l2), l1.transform(D60).angle(l2.transform(D60)), atol=atol
         )
 
-    def test_add_operator__simple(self):
-        l1 = lin.random()
-        l2 = lin.random()
+    def test_add_operator__simple(self, rand):
+        l1, l2 = rand["lin_pair"]
 
         assert l1 + l2 == l1 + (-l2)
 
         # Anyway, axial add is commutative.
         assert l1 + l2 == l2 + l1
 
-    def test_sub_operator__simple(self):
-        l1 = lin.random()
-        l2 = lin.random()
+    def test_sub_operator__simple(self, rand):
+        l1, l2 = rand["lin_pair"]
 
         assert l1 - l2 == l1 - (-l2)
 
@@ -450,69 +405,61 @@ class Testfoliation:
     def test_str(self, x):
         assert str(x) == "S:0/0"
 
-    def test_equality_for_oposite_dir(self):
-        f = fol.random()
+    def test_equality_for_oposite_dir(self, rand):
+        f = rand["fol"]
         assert f == -f
 
-    def test_anlge_for_oposite_dir(self):
-        f = fol.random()
+    def test_anlge_for_oposite_dir(self, rand):
+        f = rand["fol"]
         assert np.isclose(f.angle(-f), 0, atol=atol)
 
     def test_that_azimuth_0_is_same_as_360(self):
         assert fol(0, 20) == fol(360, 20)
 
-    def test_scalar_product(self):
-        f = fol.random()
+    def test_scalar_product(self, rand):
+        f = rand["fol"]
         assert np.isclose(f.dot(f), 1, atol=atol)
 
-    def test_cross_product(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_cross_product(self, rand):
+        f1, f2 = rand["fol_pair"]
         p = f1**f2
 
         assert np.allclose([p.angle(f1), p.angle(f2)], [90, 90])
 
-    def test_foliation_product(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_foliation_product(self, rand):
+        f1, f2 = rand["fol_pair"]
         p = f1.cross(f2)
 
         assert np.allclose([p.angle(f1), p.angle(f2)], [90, 90])
 
-    def test_foliation_product_operator(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_foliation_product_operator(self, rand):
+        f1, f2 = rand["fol_pair"]
 
         assert f1.cross(f2) == f1**f2
 
-    def test_mutual_rotation(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_mutual_rotation(self, rand):
+        f1, f2 = rand["fol_pair"]
         F = defgrad.from_two_vectors(f1, f2)
 
         assert f1.transform(F) == f2
 
-    def test_angle_under_rotation(self):
-        f1 = fol.random()
-        f2 = fol.random()
-        D = defgrad.from_axisangle(lin(45, 45), 60)
+    def test_angle_under_rotation(self, rand, D60):
+        f1, f2 = rand["fol_pair"]
 
         assert np.isclose(
-            f1.angle(f2), f1.transform(D).angle(f2.transform(D)), atol=atol
+            f1.angle(f2), f1.transform(D60).angle(f2.transform(D60)), atol=atol
         )
 
-    def test_add_operator__simple(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_add_operator__simple(self, rand):
+        f1, f2 = rand["fol_pair"]
 
         assert f1 + f2 == f1 + (-f2)
 
         # Anyway, axial add is commutative.
         assert f1 + f2 == f2 + f1
 
-    def test_sub_operator__simple(self):
-        f1 = fol.random()
-        f2 = fol.random()
+    def test_sub_operator__simple(self, rand):
+        f1, f2 = rand["fol_pair"]
 
         assert f1 - f2 == f1 - (-f2)
 
@@ -531,21 +478,27 @@ class Testfoliation:
 
 
 class TestVector3Set:
-    def test_rdegree_under_rotation(self):
-        g = vecset.random_fisher()
+    def test_rdegree_under_rotation(self, rand):
+        g = rand["vecset"]
         assert np.isclose(g.rotate(lin(45, 45), 90).rdegree(), g.rdegree(), atol=atol)
 
-    def test_resultant_rdegree(self):
-        g = vecset.from_array([45, 135, 225, 315], [45, 45, 45, 45])
-        c1 = g.R().uv() == vec(0, 90)
-        c2 = np.isclose(abs(g.R()), np.sqrt(8), atol=atol)
-        c3 = np.isclose((g.rdegree() / 100 + 1) ** 2, 2, atol=atol)
-        assert c1 and c2 and c3
+    @pytest.fixture(scope="class")
+    def resultant_group(self):
+        return vecset.from_array([45, 135, 225, 315], [45, 45, 45, 45])
+
+    def test_resultant_direction(self, resultant_group):
+        assert resultant_group.R().uv() == vec(0, 90)
+
+    def test_resultant_length(self, resultant_group):
+        assert np.isclose(abs(resultant_group.R()), np.sqrt(8), atol=atol)
+
+    def test_resultant_rdegree(self, resultant_group):
+        assert np.isclose((resultant_group.rdegree() / 100 + 1) ** 2, 2, atol=atol)
 
     def test_group_type_error(self):
         with pytest.raises(Exception) as exc:
             vecset([1, 2, 3])
-            assert "Data must be instances of Vector3" == str(exc.exception)
+        assert "Data must be instances of Vector3" == str(exc.value)
 
     def test_centered_group(self):
         g = vecset.random_fisher(position=lin(40, 50))
@@ -555,26 +508,32 @@ class TestVector3Set:
 
 
 class TestLineationSet:
-    def test_rdegree_under_rotation(self):
-        g = linset.random_fisher()
+    def test_rdegree_under_rotation(self, rand):
+        g = rand["linset"]
         assert np.allclose(g.rotate(lin(45, 45), 90).rdegree(), g.rdegree())
 
-    def test_resultant_rdegree(self):
-        g = linset.from_array([45, 135, 225, 315], [45, 45, 45, 45])
-        c1 = g.R().uv() == lin(0, 90)
-        c2 = np.isclose(abs(g.R()), np.sqrt(8), atol=atol)
-        c3 = np.isclose((g.rdegree() / 100 + 1) ** 2, 2, atol=atol)
-        assert c1 and c2 and c3
+    @pytest.fixture(scope="class")
+    def resultant_group(self):
+        return linset.from_array([45, 135, 225, 315], [45, 45, 45, 45])
+
+    def test_resultant_direction(self, resultant_group):
+        assert resultant_group.R().uv() == lin(0, 90)
+
+    def test_resultant_length(self, resultant_group):
+        assert np.isclose(abs(resultant_group.R()), np.sqrt(8), atol=atol)
+
+    def test_resultant_rdegree(self, resultant_group):
+        assert np.isclose((resultant_group.rdegree() / 100 + 1) ** 2, 2, atol=atol)
 
     def test_group_type_error(self):
         with pytest.raises(Exception) as exc:
             linset([1, 2, 3])
-            assert "Data must be instances of Lineation" == str(exc.exception)
+        assert "Data must be instances of Lineation" == str(exc.value)
 
     def test_group_heterogenous_error(self):
         with pytest.raises(Exception) as exc:
             linset([fol(10, 10), lin(20, 20)])
-            assert "Data must be instances of Lineation" == str(exc.exception)
+        assert "Data must be instances of Lineation" == str(exc.value)
 
     def test_centered_group(self):
         g = linset.random_fisher(position=lin(40, 50))
@@ -582,21 +541,73 @@ class TestLineationSet:
         el = gc.ortensor().eigenlins
         assert el[0] == vec("x") and el[1] == vec("y") and el[2] == vec("z")
 
+    @pytest.mark.parametrize(
+        "content, cols",
+        [
+            ("azi,inc\n10,20\n30,40\n", {}),
+            ("10,20\n30,40\n50,60\n", {}),
+            ('"azi","inc"\n"10","20"\n"30","40"\n', {}),
+            ("azi,inc\n10,20\n30,40\n", dict(acol=0, icol="inc")),
+            ('"azi","inc"\n"10","20"\n"30","40"\n', dict(acol="azi", icol=1)),
+        ],
+    )
+    def test_from_csv(self, tmp_path, content, cols):
+        filename = tmp_path / "data.csv"
+        filename.write_text(content)
+        azi, inc = linset.from_csv(filename, **cols).geo
+        assert np.allclose(azi[:2], [10, 30]) and np.allclose(inc[:2], [20, 40])
+
+    def test_from_csv_single_row_error(self, tmp_path):
+        filename = tmp_path / "data.csv"
+        filename.write_text("10,20\n")
+        with pytest.raises(ValueError) as exc:
+            linset.from_csv(filename)
+        assert "No data in CSV file..." == str(exc.value)
+
 
 # ############################################################################
 # pair
 # ############################################################################
 
+FAULT_CSV = [
+    "fazi,finc,lazi,linc,sense\n120,30,155,27,1\n200,60,230,50,-1\n",
+    "120,30,155,27,1\n200,60,230,50,-1\n",
+    '"fazi","finc","lazi","linc","sense"\n"120","30","155","27","1"\n'
+    '"200","60","230","50","-1"\n',
+]
+
 
 class Testpair:
-    def test_pair_misfit(self):
-        p = pair.random()
+    def test_pair_misfit(self, rand):
+        p = rand["pair"]
         assert np.isclose(p.misfit, 0, atol=atol)
 
-    def test_pair_rotate(self):
-        p = pair.random()
+    def test_pair_rotate(self, rand):
+        p = rand["pair"]
         pr = p.rotate(lin(45, 45), 120)
-        assert np.allclose([p.fvec.angle(p.lvec), pr.fvec.angle(pr.lvec)], [90, 90])
+        f = np.vstack([p.fvec, pr.fvec])
+        l = np.vstack([p.lvec, pr.lvec])
+        assert np.allclose(np.einsum("ij,ij->i", f, l), 0, atol=atol)
+
+    def test_pairset_keeps_misfit_of_measurements(self):
+        g = pairset.from_array([120, 200], [30, 60], [155, 230], [27, 50])
+        expects = [pair(120, 30, 155, 27).misfit, pair(200, 60, 230, 50).misfit]
+        assert np.allclose(g.misfit, expects) and min(expects) > 1
+
+    @pytest.mark.parametrize("content", FAULT_CSV)
+    def test_from_csv(self, tmp_path, content):
+        filename = tmp_path / "data.csv"
+        filename.write_text(content)
+        current = pairset.from_csv(filename)
+        expects = pairset.from_array([120, 200], [30, 60], [155, 230], [27, 50])
+        assert np.allclose(np.asarray(current), np.asarray(expects))
+
+    def test_from_csv_single_row_error(self, tmp_path):
+        filename = tmp_path / "data.csv"
+        filename.write_text(FAULT_CSV[1].splitlines()[0])
+        with pytest.raises(ValueError) as exc:
+            pairset.from_csv(filename)
+        assert "No data in CSV file..." == str(exc.value)
 
 
 # ############################################################################
@@ -605,6 +616,23 @@ class Testpair:
 
 
 class Testfault:
+    @pytest.mark.parametrize("content", FAULT_CSV)
+    def test_from_csv(self, tmp_path, content):
+        filename = tmp_path / "data.csv"
+        filename.write_text(content)
+        current = faultset.from_csv(filename)
+        expects = faultset.from_array(
+            [120, 200], [30, 60], [155, 230], [27, 50], [1, -1]
+        )
+        assert np.allclose(np.asarray(current), np.asarray(expects))
+
+    def test_from_csv_single_row_error(self, tmp_path):
+        filename = tmp_path / "data.csv"
+        filename.write_text(FAULT_CSV[1].splitlines()[0])
+        with pytest.raises(ValueError) as exc:
+            faultset.from_csv(filename)
+        assert "No data in CSV file..." == str(exc.value)
+
     def test_fault_flip(self):
         f = fault(90, 30, 110, 28, -1)
         fr = f.rotate(f.rax, 180)
@@ -621,3 +649,171 @@ class Testfault:
     def test_fault_p_axis(self):
         f = fault(150, 30, 150, 30, -1)
         assert f.p == lin(330, 15)
+
+
+# ############################################################################
+# projection
+# ############################################################################
+
+
+class TestProjection:
+    @pytest.mark.parametrize("kind", ["EqualAreaProj", "EqualAngleProj"])
+    def test_inverse_is_inverse_of_project(self, kind):
+        from apsg.plotting import _projection
+
+        proj = getattr(_projection, kind)()
+        v = np.asarray(linset.random_fisher(n=50, position=lin(0, 90), kappa=2))
+        v = v[v[:, 2] > 0]
+        X, Y = proj.project_data(*v.T)
+        assert np.allclose(np.array(proj._inverse(X, Y)).T, v)
+
+    @pytest.mark.parametrize("hemisphere", ["lower", "upper"])
+    def test_horizontal_data_projected_on_both_ends(self, hemisphere):
+        from apsg.plotting._projection import EqualAreaProj
+
+        proj = EqualAreaProj(hemisphere=hemisphere)
+        X, Y, idx = proj.project_data_hemispheres(*np.asarray(linset([lin(90, 0)])).T)
+        assert np.allclose(sorted(zip(X, Y)), [(-1, 0), (1, 0)])
+        assert list(idx) == [0, 0]
+
+
+# ############################################################################
+# stereogrid
+# ############################################################################
+
+
+class TestStereoGrid:
+    def test_pruned_density_agrees_with_exact(self):
+        from apsg.plotting._stereogrid import _exp_kamb_pruned
+
+        grid = np.asarray(vecset.uniform_gss(n=500))
+        features = np.random.default_rng(0).normal(size=(300, 3))
+        features /= np.linalg.norm(features, axis=1, keepdims=True)
+        k = 400
+        expects = np.exp(k * (np.abs(grid @ features.T) - 1)).sum(axis=1)
+        current = _exp_kamb_pruned(grid, features, k)
+        assert np.allclose(current, expects, rtol=0, atol=len(features) * np.exp(-15))
+
+
+# ############################################################################
+
+
+class TestSDB:
+    def test_open_does_not_modify_database(self, sdb_file):
+        from apsg.database import SDB
+
+        with open(sdb_file, "rb") as f:
+            expects = f.read()
+        with SDB(sdb_file) as db:
+            db.getset("S")
+        with open(sdb_file, "rb") as f:
+            assert f.read() == expects
+
+    def test_optimize_creates_indexes(self, sdb_file):
+        from apsg.database import SDB
+
+        with SDB(sdb_file) as db:
+            db.optimize()
+            names = {
+                row[0]
+                for row in db.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                )
+            }
+        assert names.issuperset(name for name, _, _ in SDB._INDEXES)
+
+    @pytest.mark.parametrize("tags, n", [("fold", 2), ("folded", 1), ("old", 2)])
+    def test_tags_match_substrings(self, sdb_file, tags, n):
+        from apsg.database import SDB
+
+        with SDB(sdb_file) as db:
+            assert len(db.getset("S", tags=tags)) == n
+
+
+# ############################################################################
+# rose histogram
+# ############################################################################
+
+
+class TestRoseHistogram:
+    @pytest.mark.parametrize("bins", [6, 13, 18, 36, 72])
+    @pytest.mark.parametrize("axial", [False, True])
+    def test_sectors_agree_with_numpy_histogram(self, bins, axial):
+        from apsg.plotting._roseplot import _rose_histogram
+
+        # integer degrees lie on sector boundaries
+        ang = np.arange(360, dtype=float)
+        weights = np.linspace(0.5, 2, 360)
+        width = 2 * np.pi / bins
+        a, w = ang, weights
+        if axial:
+            a = np.concatenate((ang, (ang + 180) % 360))
+            w = np.concatenate((weights, weights))
+        expects, _ = np.histogram(
+            np.radians(a),
+            bins=bins + 1,
+            range=(-width / 2, 2 * np.pi + width / 2),
+            weights=w,
+        )
+        expects[0] += expects[-1]
+        current = _rose_histogram(ang, weights, bins, axial, False)
+
+        assert np.allclose(current, expects[:-1])
+
+
+# ############################################################################
+# numba kernels
+# ############################################################################
+
+
+def _readonly(a):
+    a = np.array(a, dtype=float)
+    a.flags.writeable = False
+    return a
+
+
+@pytest.fixture(scope="module")
+def vectors():
+    a = np.random.default_rng(0).normal(size=(200, 3))
+    return _readonly(a / np.linalg.norm(a, axis=1, keepdims=True))
+
+
+class TestNumbaKernels:
+    """Kernels are used only for large data, so they are compared with numpy
+    path directly on small inputs."""
+
+    @pytest.fixture(autouse=True)
+    def numba(self):
+        return pytest.importorskip("numba")
+
+    def test_halfspace(self, vectors):
+        from apsg.feature._container import _halfspace, _halfspace_jit
+
+        current = _halfspace_jit()(np.array(vectors))
+        assert np.allclose(current, _halfspace(vectors))
+
+    def test_axial_histogram(self):
+        from apsg.plotting._roseplot import _rose_histogram, _axial_histogram_jit
+
+        ang = _readonly(np.arange(0, 720, 2.5))
+        weights = _readonly(np.linspace(0.5, 2, len(ang)))
+        width = 2 * np.pi / 36
+        edges = np.linspace(-width / 2, 2 * np.pi + width / 2, 38)
+        current = _axial_histogram_jit()(ang, weights, edges)
+        assert np.allclose(current, _rose_histogram(ang, weights, 36, True, False))
+
+    def test_rotate_fan(self, vectors):
+        from apsg.math._vector import _rotate_fan, _rotate_fan_jit
+        from apsg.plotting._stereonet import _angles_trig
+
+        axes = _readonly(np.roll(vectors, 1, axis=0))
+        c, s = _angles_trig(0, 360, 37)
+        current = _rotate_fan_jit()(vectors, axes, c, s)
+        assert np.allclose(current, _rotate_fan(vectors, axes, c, s))
+
+    def test_exp_kamb(self, vectors):
+        from apsg.plotting._stereogrid import _exp_kamb, _exp_kamb_jit
+
+        grid = _readonly(vecset.uniform_gss(n=500))
+        current = _exp_kamb_jit()(grid, vectors, 50.0)
+        assert np.allclose(current, _exp_kamb(grid, vectors, 50.0))
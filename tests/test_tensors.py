@@ -5,11 +5,12 @@ Test the tensor classes.
 """
 
 import numpy as np
+import pytest
 
 from apsg.math import Matrix3
 from apsg import vec
 from apsg import lin, fol, vecset
-from apsg import defgrad, velgrad, stress, ortensor
+from apsg import defgrad, velgrad, stress, ortensor, ellipsoid
 from apsg import defgrad2, velgrad2
 
 # Matrix3 type is value object => structural equality
@@ -35,16 +36,31 @@ def test_tensor_repr_and_str():
     )
 
 
+def test_tensor_repr_keeps_float_and_integer_display():
+    E = ellipsoid.from_defgrad(defgrad.from_comp(xy=1))
+    assert repr(E).startswith("Ellipsoid\n[[2 1 0]\n [1 1 0]\n [0 0 1]]")
+    assert str(defgrad2.from_comp(xy=2)).endswith("[[1. 2.]\n [0. 1.]]")
+
+
 # Ortensor
 
 
-def test_ortensor_uniform():
-    f = fol.random()
-    g = vecset([f.pole(), f.rake(-45), f.rake(45)])
-    ot = ortensor.from_features(g)
+@pytest.fixture(scope="module")
+def rakes(rand):
+    f = rand["fol"]
+    return vecset([f.pole(), f.rake(-45), f.rake(45)])
+
+
+def test_ortensor_uniform(rakes):
+    ot = ortensor.from_features(rakes)
     assert np.allclose(ot.eigenvalues(), np.ones(3) / 3)
 
 
+def test_ortensor_rakes_orthonormal(rakes):
+    a = np.asarray(rakes)
+    assert np.allclose(np.einsum("ik,jk->ij", a, a), np.eye(3))
+
+
 # DefGrad
 
 